@@ -80,6 +80,20 @@ def clear_sqlite_metadata():
         print(f"[Clear] ✗ Error clearing SQLite metadata: {e}")
 
 
+def clear_scan_cache():
+    """Clear the initial_index.py scan cache so the next run re-reads every file."""
+    print("[Clear] Clearing scan cache...")
+    try:
+        scan_cache_path = Path(settings.data_dir) / "scan_cache.db"
+        if scan_cache_path.exists():
+            scan_cache_path.unlink()
+            print(f"[Clear] ✓ Scan cache deleted: {scan_cache_path}")
+        else:
+            print(f"[Clear] ⚠ Scan cache does not exist: {scan_cache_path}")
+    except Exception as e:
+        print(f"[Clear] ✗ Error clearing scan cache: {e}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Clear MyRAGDB indexes and metadata for clean re-indexing"
@@ -125,6 +139,7 @@ def main():
         clear_meilisearch()
         clear_chromadb()
         clear_sqlite_metadata()
+        clear_scan_cache()
 
     else:
         if args.keyword:
@@ -137,6 +152,9 @@ def main():
         if args.metadata:
             clear_sqlite_metadata()
 
+        # Any cleared index must be rebuilt from a full scan
+        clear_scan_cache()
+
     print("\n" + "=" * 60)
     print("✓ Clear operations complete")
     print("=" * 60)
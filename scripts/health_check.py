@@ -5,12 +5,19 @@
 
 import asyncio
 import httpx
-import chromadb
-import psutil
+import re
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, List, Tuple
 from datetime import datetime
 
+# orjson parses /v1/models payloads several times faster than stdlib json
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
 
 # LLM port mapping
 LLM_PORTS: Dict[int, str] = {
@@ -26,6 +33,31 @@ LLM_PORTS: Dict[int, str] = {
     8092: "deepseek-r1-32b"
 }
 
+# Model names are compared as token sets ("qwen2.5", "32b", ...) so that
+# served ids like "Qwen2.5-32B-Instruct.gguf" still match the expected name
+_MODEL_TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:\.[0-9]+)*")
+
+
+def _model_tokens(model_name: str) -> FrozenSet[str]:
+    """Split a model name into lowercase name/version tokens."""
+    return frozenset(_MODEL_TOKEN_PATTERN.findall(model_name.lower()))
+
+
+EXPECTED_TOKENS: Dict[int, FrozenSet[str]] = {
+    port: _model_tokens(name) for port, name in LLM_PORTS.items()
+}
+
+
+def _model_matches(port: int, actual: str) -> bool:
+    """
+    Check whether the model served on a port is the expected one.
+
+    Every token of the expected name must appear in the served name, so
+    extra tokens ("instruct", "gguf") are fine but a shared size or family
+    alone ("32b", "qwen2.5") is not a match.
+    """
+    return EXPECTED_TOKENS[port] <= _model_tokens(actual)
+
 
 async def check_meilisearch(host: str = "http://localhost:7700") -> Tuple[bool, str]:
     """
@@ -39,7 +71,7 @@ async def check_meilisearch(host: str = "http://localhost:7700") -> Tuple[bool,
             response = await client.get(f"{host}/health")
 
             if response.status_code == 200:
-                data = response.json()
+                data = _loads(response.content)
                 status = data.get("status", "unknown")
 
                 if status == "available":
@@ -62,6 +94,9 @@ async def check_chromadb(host: str = "localhost", port: int = 8000) -> Tuple[boo
     Returns:
         Tuple of (is_healthy, status_message)
     """
+    # Imported lazily: chromadb pulls in a large dependency graph at import time
+    import chromadb
+
     try:
         # Try HTTP client first
         client = chromadb.HttpClient(host=host, port=port)
@@ -101,7 +136,7 @@ async def check_llm_endpoint(port: int, model_name: str) -> Tuple[bool, str, str
             models_response = await client.get(f"{base_url}/v1/models")
 
             if models_response.status_code == 200:
-                models_data = models_response.json()
+                models_data = _loads(models_response.content)
 
                 # Extract model name from response
                 actual_model = "unknown"
@@ -142,6 +177,8 @@ def get_system_resources() -> Dict[str, any]:
     Returns:
         Dictionary with memory and CPU stats
     """
+    import psutil
+
     # Memory stats
     memory = psutil.virtual_memory()
     memory_gb = memory.total / (1024 ** 3)
@@ -205,24 +242,31 @@ async def run_full_diagnostics():
     print("🤖 LLM Endpoint Verification (10 Models)")
     print("-" * 80)
 
-    llm_tasks = [
-        check_llm_endpoint(port, name)
+    # Print each result as soon as its probe finishes instead of waiting
+    # for the slowest endpoint (a loading model can take the full timeout)
+    pending = {
+        asyncio.create_task(check_llm_endpoint(port, name)): (port, name)
         for port, name in LLM_PORTS.items()
-    ]
-
-    llm_results = await asyncio.gather(*llm_tasks)
+    }
 
     online_count = 0
     offline_count = 0
     model_mappings = []
 
-    for (healthy, msg, actual_model), (port, expected_model) in zip(llm_results, LLM_PORTS.items()):
-        print(msg)
-        if healthy:
-            online_count += 1
-            model_mappings.append((port, expected_model, actual_model))
-        else:
-            offline_count += 1
+    while pending:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            port, expected_model = pending.pop(task)
+            healthy, msg, actual_model = task.result()
+            print(msg)
+            if healthy:
+                online_count += 1
+                model_mappings.append((port, expected_model, actual_model))
+            else:
+                offline_count += 1
+
+    # Completion order is arbitrary; keep the mapping table in port order
+    model_mappings.sort()
 
     print()
 
@@ -242,7 +286,7 @@ async def run_full_diagnostics():
         print(f"{'Port':<8} {'Expected Model':<25} {'Actual Model':<30}")
         print("-" * 80)
         for port, expected, actual in model_mappings:
-            match_indicator = "✓" if expected.lower() in actual.lower() or actual.lower() in expected.lower() else "?"
+            match_indicator = "✓" if _model_matches(port, actual) else "?"
             print(f"{port:<8} {expected:<25} {actual:<30} {match_indicator}")
         print()
 
@@ -266,6 +310,14 @@ async def run_full_diagnostics():
 
 
 if __name__ == "__main__":
+    # Prefer libuv's event loop when available; the checks are all small
+    # localhost round-trips where loop overhead dominates
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     try:
         exit_code = asyncio.run(run_full_diagnostics())
         sys.exit(exit_code)
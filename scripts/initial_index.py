@@ -11,28 +11,168 @@ populating both Keyword (Meilisearch) and vector indexes to enable search.
 
 Usage:
     python scripts/initial_index.py
+
+    # Keyword index only (skips loading the embedding model)
+    python scripts/initial_index.py --no-vector
+
+    # Re-read every file, ignoring the scan cache (e.g. after clearing indexes)
+    python scripts/initial_index.py --no-scan-cache
+
+Repeat runs consult a scan cache (data/scan_cache.db) and only re-index
+files whose mtime or size changed since each indexer last indexed them;
+a file skipped by one run (e.g. --no-vector) is indexed by the next run
+that includes that indexer.
 """
 
+import argparse
+import concurrent.futures
+import contextlib
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import Iterator, List, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from myragdb.config import load_repositories_config
-from myragdb.indexers.file_scanner import FileScanner
-from myragdb.indexers.meilisearch_indexer import MeilisearchIndexer
-from myragdb.indexers.vector_indexer import VectorIndexer
+from myragdb.config import load_repositories_config, settings
+
+
+# Files buffered between the scanner thread and the indexers; bounds peak
+# memory to roughly SCAN_QUEUE_SIZE + INDEX_BATCH_SIZE files of content
+SCAN_QUEUE_SIZE = 200
+INDEX_BATCH_SIZE = 100
+
+# Marks the end of a scan on the file queue
+_SCAN_DONE = None
+
+# Seconds a blocked put() waits before re-checking whether the consumer stopped
+_PUT_TIMEOUT = 0.5
+
+
+def _put_until_stopped(file_queue: queue.Queue, item, stop: threading.Event) -> bool:
+    """
+    Put an item on the queue, giving up once the consumer has stopped.
+
+    Args:
+        file_queue: Bounded queue shared with the indexing loop
+        item: ScannedFile or _SCAN_DONE
+        stop: Set by the consumer when it no longer reads the queue
+
+    Returns:
+        True if the item was queued, False if the consumer stopped first
+    """
+    while not stop.is_set():
+        try:
+            file_queue.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _scan_into_queue(
+    scanner,
+    file_queue: queue.Queue,
+    errors: List[Exception],
+    stop: threading.Event,
+) -> None:
+    """
+    Run a repository scan and feed each file onto the queue.
+
+    Business Purpose: Producer side of the scan/index pipeline. Runs in a
+    background thread so disk reads overlap with indexing; put() blocks when
+    the queue is full, applying back-pressure to the scanner. If the
+    indexing loop fails or returns early it sets stop, and the scan ends
+    instead of blocking on a queue nobody drains.
+
+    Args:
+        scanner: FileScanner for the repository
+        file_queue: Bounded queue shared with the indexing loop
+        errors: Collects any exception raised by the scan
+        stop: Set by the indexing loop when it stops reading the queue
+    """
+    try:
+        with contextlib.closing(scanner.scan()) as scanned_files:
+            for scanned_file in scanned_files:
+                if not _put_until_stopped(file_queue, scanned_file, stop):
+                    return
+    except Exception as e:
+        errors.append(e)
+    finally:
+        _put_until_stopped(file_queue, _SCAN_DONE, stop)
+
+
+def _iter_batches(file_queue: queue.Queue, batch_size: int) -> Iterator[list]:
+    """
+    Drain the file queue in fixed-size batches until the scan finishes.
+
+    Args:
+        file_queue: Queue filled by _scan_into_queue
+        batch_size: Files per yielded batch
 
+    Yields:
+        Lists of ScannedFile objects (the last batch may be shorter)
+    """
+    batch = []
+    while True:
+        scanned_file = file_queue.get()
+        if scanned_file is _SCAN_DONE:
+            break
+        batch.append(scanned_file)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def _load_vector_indexer():
+    """
+    Import and construct the vector indexer (loads the embedding model).
+
+    Business Purpose: Runs on a background thread so the 1-5s model load
+    overlaps the first repository's file scan and keyword indexing.
+
+    Returns:
+        Ready VectorIndexer instance
+    """
+    from myragdb.indexers.vector_indexer import VectorIndexer
+
+    return VectorIndexer()
 
-def main():
+
+def main(argv: Optional[List[str]] = None):
     """
     Index all configured repositories.
 
     Business Purpose: Builds initial search indexes from all enabled
     repositories, making them searchable.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
     """
+    parser = argparse.ArgumentParser(
+        description="Build initial search indexes for all enabled repositories"
+    )
+
+    parser.add_argument(
+        '--no-vector',
+        action='store_true',
+        help='Skip vector indexing (avoids loading the embedding model)'
+    )
+
+    parser.add_argument(
+        '--no-scan-cache',
+        action='store_true',
+        help='Read and index every file instead of only files changed since the last run'
+    )
+
+    args = parser.parse_args(argv)
+
     print("=" * 70)
     print("MyRAGDB Initial Indexing")
     print("=" * 70)
@@ -57,13 +197,28 @@ def main():
         print(f"Error loading configuration: {e}")
         return
 
-    # Initialize indexers
+    # Initialize indexers (imported here so --help and config errors stay fast;
+    # the vector indexer loads sentence-transformers/torch on import)
     print("Initializing indexers...")
     try:
+        from myragdb.indexers.file_scanner import FileScanner
+        from myragdb.indexers.meilisearch_indexer import MeilisearchIndexer
+
+        # Start the embedding model load first so it overlaps everything below
+        vector_indexer = None
+        vector_future = None
+        if not args.no_vector:
+            loader = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            vector_future = loader.submit(_load_vector_indexer)
+            loader.shutdown(wait=False)
+
         keyword_indexer = MeilisearchIndexer()
-        vector_indexer = VectorIndexer()
         print("✓ Keyword indexer ready")
-        print("✓ Vector indexer ready (model loaded)")
+
+        if vector_future is not None:
+            print("… Vector indexer loading in background")
+        else:
+            print("- Vector indexer skipped (--no-vector)")
         print()
 
     except Exception as e:
@@ -71,7 +226,10 @@ def main():
         return
 
     # Index each repository
+    scan_cache_path = None if args.no_scan_cache else Path(settings.data_dir) / "scan_cache.db"
+    cache_indexers = ["keyword"] if args.no_vector else ["keyword", "vector"]
     total_files = 0
+    total_unchanged = 0
     start_time = time.time()
 
     for repo in enabled_repos:
@@ -79,32 +237,80 @@ def main():
         print("-" * 70)
 
         try:
-            # Scan files
-            print(f"Scanning files in {repo.path}...")
-            scanner = FileScanner(repo)
-            files = list(scanner.scan())
+            # Scan in a background thread and index batches as they arrive
+            print(f"Scanning and indexing files in {repo.path}...")
+            scanner = FileScanner(repo, cache_path=scan_cache_path, cache_indexers=cache_indexers)
+            file_queue: queue.Queue = queue.Queue(maxsize=SCAN_QUEUE_SIZE)
+            scan_errors: List[Exception] = []
+            scan_stop = threading.Event()
+            scan_thread = threading.Thread(
+                target=_scan_into_queue,
+                args=(scanner, file_queue, scan_errors, scan_stop),
+                daemon=True
+            )
+            scan_thread.start()
+
+            repo_files = 0
+            repo_unchanged = 0
+            keyword_count = 0
+            vector_count = 0
+            keyword_time = 0.0
+            vector_time = 0.0
+
+            try:
+                for batch in _iter_batches(file_queue, INDEX_BATCH_SIZE):
+                    repo_files += len(batch)
+
+                    # Unchanged files were not read by the scanner; nothing to re-index
+                    changed = [f for f in batch if not f.unchanged]
+                    repo_unchanged += len(batch) - len(changed)
+                    if not changed:
+                        continue
+                    batch = changed
 
-            if not files:
+                    # Index with Keyword search
+                    keyword_start = time.time()
+                    keyword_count += keyword_indexer.index_files_batch(batch, batch_size=INDEX_BATCH_SIZE)
+                    keyword_time += time.time() - keyword_start
+                    scanner.record_indexed(batch, "keyword")
+
+                    # Index with vectors (first use waits for the background model load)
+                    if vector_future is not None:
+                        if vector_indexer is None:
+                            try:
+                                vector_indexer = vector_future.result()
+                                print("  ✓ Vector indexer ready (model loaded)")
+                            except Exception as e:
+                                # Keep going keyword-only; no vector rows are
+                                # cached, so the next full run vector-indexes
+                                print(f"  Error initializing vector indexer: {e}")
+                                print("  Continuing with keyword indexing only")
+                                vector_future = None
+                                continue
+
+                        vector_start = time.time()
+                        vector_count += vector_indexer.index_files(batch, incremental=False)
+                        vector_time += time.time() - vector_start
+                        scanner.record_indexed(batch, "vector")
+            finally:
+                # Release the scanner if indexing stopped before the scan ended
+                scan_stop.set()
+                scan_thread.join()
+
+            if scan_errors:
+                raise scan_errors[0]
+
+            if not repo_files:
                 print(f"  No files found matching patterns")
                 print()
                 continue
 
-            print(f"  Found {len(files)} files")
-            total_files += len(files)
-
-            # Index with Keyword search
-            print(f"  Indexing with Keyword search...")
-            keyword_start = time.time()
-            keyword_count = keyword_indexer.index_files_batch(files, batch_size=100)
-            keyword_time = time.time() - keyword_start
+            print(f"  Found {repo_files} files ({repo_unchanged} unchanged since last scan)")
+            total_files += repo_files
+            total_unchanged += repo_unchanged
             print(f"  ✓ Keyword indexed {keyword_count} files in {keyword_time:.1f}s")
-
-            # Index with vectors
-            print(f"  Generating embeddings and indexing...")
-            vector_start = time.time()
-            vector_count = vector_indexer.index_files(files, incremental=False)
-            vector_time = time.time() - vector_start
-            print(f"  ✓ Vector indexed {vector_count} files in {vector_time:.1f}s")
+            if vector_future is not None:
+                print(f"  ✓ Vector indexed {vector_count} files in {vector_time:.1f}s")
 
             print()
 
@@ -118,14 +324,15 @@ def main():
     print("=" * 70)
     print("Indexing Complete!")
     print("=" * 70)
-    print(f"Total files processed: {total_files}")
+    print(f"Total files processed: {total_files} ({total_unchanged} unchanged)")
     print(f"Total time: {total_time:.1f}s")
     print()
 
     # Show statistics
     print("Index Statistics:")
     print(f"  Keyword documents: {keyword_indexer.get_document_count()}")
-    print(f"  Vector chunks: {vector_indexer.get_document_count()}")
+    if vector_future is not None and vector_future.exception() is None:
+        print(f"  Vector chunks: {vector_future.result().get_document_count()}")
     print()
 
     print("Next steps:")
@@ -4,88 +4,141 @@
 # Author: Libor Ballaty <libor@arionetworks.com>
 # Created: 2026-01-04
 
+import functools
+import heapq
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from collections import defaultdict, Counter
+from typing import Optional, TextIO
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from myragdb.indexers.keyword_indexer import KeywordIndexer
+from myragdb.indexers.meilisearch_indexer import MeilisearchIndexer
 from myragdb.indexers.vector_indexer import VectorIndexer
-from myragdb.config import settings
 
 
-def analyze_keyword_index():
-    """Analyze Keyword index to show repositories and file types."""
-    print("\n" + "="*80)
-    print("KEYWORD INDEX ANALYSIS")
-    print("="*80)
-
-    indexer = KeywordIndexer(str(Path(settings.index_dir) / "meilisearch"))
-
-    # Get all documents
-    with indexer.ix.searcher() as searcher:
-        # Group by repository
-        repo_counts = Counter()
-        file_type_counts = Counter()
-        repo_file_types = defaultdict(Counter)
-        repo_dirs = defaultdict(set)
-
-        total = searcher.doc_count_all()
-        print(f"\nTotal Documents: {total:,}")
-
-        for docnum in range(total):
-            doc = searcher.stored_fields(docnum)
-            repo = doc.get('repository', 'unknown')
-            file_type = doc.get('file_type', 'unknown')
-            file_path = doc.get('file_path', '')
-
-            repo_counts[repo] += 1
-            file_type_counts[file_type] += 1
-            repo_file_types[repo][file_type] += 1
-
-            # Extract directory
-            if file_path:
-                dir_path = str(Path(file_path).parent)
-                # Get top-level directory structure
-                parts = Path(file_path).parts
-                if len(parts) > 1:
-                    top_dir = "/".join(parts[:3])  # Get first 3 levels
-                    repo_dirs[repo].add(top_dir)
+# Documents fetched per Meilisearch request when walking the keyword index
+KEYWORD_PAGE_SIZE = 1000
+
+# Stored fields needed for the keyword analysis
+KEYWORD_FIELDS = ['repository', 'extension', 'relative_path']
+
+# Chunk metadata records fetched per ChromaDB request when walking the vector index
+VECTOR_PAGE_SIZE = 1000
+
+
+def _top_dir(file_path: str):
+    """
+    Return the first three levels of a POSIX-style relative path.
+
+    Slices at the third '/' found with str.find, so no parts list or joined
+    string is built per document. The result is interned: millions of
+    documents share a few hundred top-level directories, so the slices are
+    dropped right away and every set holds the one shared copy. Paths without
+    any '/' have no directory and return None.
+    """
+    first = file_path.find('/')
+    if first < 0:
+        return None
+    second = file_path.find('/', first + 1)
+    if second < 0:
+        return sys.intern(file_path)
+    third = file_path.find('/', second + 1)
+    return sys.intern(file_path[:third] if third >= 0 else file_path)
+
+
+def analyze_keyword_index(out: Optional[TextIO] = None):
+    """
+    Analyze Keyword index to show repositories and file types.
+
+    Args:
+        out: Stream to write the report to (defaults to stdout)
+    """
+    emit = functools.partial(print, file=out or sys.stdout)
+    emit("\n" + "="*80)
+    emit("KEYWORD INDEX ANALYSIS")
+    emit("="*80)
+
+    indexer = MeilisearchIndexer()
+
+    # Group by repository
+    repo_counts = Counter()
+    file_type_counts = Counter()
+    repo_dirs = defaultdict(set)
+
+    total = indexer.get_document_count()
+    emit(f"\nTotal Documents: {total:,}")
+
+    # Walk all documents a page at a time rather than one request per document,
+    # fetching only the fields analysed here (not the stored file content)
+    offset = 0
+    while True:
+        page = indexer.index.get_documents({
+            'offset': offset,
+            'limit': KEYWORD_PAGE_SIZE,
+            'fields': KEYWORD_FIELDS
+        })
+        if not page.results:
+            break
+        offset += len(page.results)
+
+        docs = [dict(document) for document in page.results]
+        repos = [doc.get('repository') or 'unknown' for doc in docs]
+        file_types = [doc.get('extension', 'unknown') for doc in docs]
+        file_paths = [doc.get('relative_path', '') for doc in docs]
+
+        # Tally the whole page in C rather than incrementing per document
+        repo_counts.update(repos)
+        file_type_counts.update(file_types)
+
+        for repo, file_path in zip(repos, file_paths):
+            # Extract top-level directory structure (first 3 levels)
+            top_dir = _top_dir(file_path)
+            if top_dir:
+                repo_dirs[repo].add(top_dir)
 
     # Print repository breakdown
-    print("\n" + "-"*80)
-    print("REPOSITORIES INDEXED:")
-    print("-"*80)
-    for repo, count in sorted(repo_counts.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {repo:50s} {count:>8,} documents")
+    emit("\n" + "-"*80)
+    emit("REPOSITORIES INDEXED:")
+    emit("-"*80)
+    for repo, count in repo_counts.most_common():
+        emit(f"  {repo:50s} {count:>8,} documents")
 
     # Print file type breakdown
-    print("\n" + "-"*80)
-    print("FILE TYPES INDEXED:")
-    print("-"*80)
-    for file_type, count in sorted(file_type_counts.items(), key=lambda x: x[1], reverse=True)[:20]:
-        print(f"  {file_type:20s} {count:>8,} files")
+    emit("\n" + "-"*80)
+    emit("FILE TYPES INDEXED:")
+    emit("-"*80)
+    for file_type, count in file_type_counts.most_common(20):
+        emit(f"  {file_type:20s} {count:>8,} files")
 
     # Print top directories per repository
-    print("\n" + "-"*80)
-    print("TOP DIRECTORIES PER REPOSITORY:")
-    print("-"*80)
+    emit("\n" + "-"*80)
+    emit("TOP DIRECTORIES PER REPOSITORY:")
+    emit("-"*80)
     for repo in sorted(repo_counts.keys()):
-        print(f"\n  {repo}:")
-        dirs = sorted(list(repo_dirs[repo]))[:10]  # Show first 10 dirs
+        emit(f"\n  {repo}:")
+        top_dirs = repo_dirs.get(repo, ())  # no autovivification on read
+        dirs = heapq.nsmallest(10, top_dirs)  # Show first 10 dirs
         for d in dirs:
-            print(f"    - {d}")
-        if len(repo_dirs[repo]) > 10:
-            print(f"    ... and {len(repo_dirs[repo]) - 10} more directories")
+            emit(f"    - {d}")
+        if len(top_dirs) > 10:
+            emit(f"    ... and {len(top_dirs) - 10} more directories")
 
 
-def analyze_vector_index():
-    """Analyze vector index to show repositories and chunks."""
-    print("\n" + "="*80)
-    print("VECTOR INDEX ANALYSIS")
-    print("="*80)
+def analyze_vector_index(out: Optional[TextIO] = None):
+    """
+    Analyze vector index to show repositories and chunks.
+
+    Args:
+        out: Stream to write the report to (defaults to stdout)
+    """
+    emit = functools.partial(print, file=out or sys.stdout)
+    emit("\n" + "="*80)
+    emit("VECTOR INDEX ANALYSIS")
+    emit("="*80)
 
     indexer = VectorIndexer()
 
@@ -93,61 +146,65 @@ def analyze_vector_index():
     collection = indexer.collection
 
     # Get all documents (in batches to avoid memory issues)
-    print(f"\nTotal Chunks: {collection.count():,}")
-
-    # Sample metadata to understand what's indexed
-    results = collection.get(limit=10000, include=['metadatas'])
-
-    if results and results['metadatas']:
-        repo_counts = Counter()
-        file_type_counts = Counter()
-        repo_file_types = defaultdict(Counter)
-        repo_dirs = defaultdict(set)
-
-        for metadata in results['metadatas']:
-            repo = metadata.get('repository', 'unknown')
-            file_type = metadata.get('file_type', 'unknown')
-            file_path = metadata.get('file_path', '')
-
-            repo_counts[repo] += 1
-            file_type_counts[file_type] += 1
-            repo_file_types[repo][file_type] += 1
-
-            # Extract directory
-            if file_path:
-                parts = Path(file_path).parts
-                if len(parts) > 1:
-                    top_dir = "/".join(parts[:3])  # Get first 3 levels
-                    repo_dirs[repo].add(top_dir)
-
+    total_chunks = collection.count()
+    emit(f"\nTotal Chunks: {total_chunks:,}")
+
+    repo_counts = Counter()
+    file_type_counts = Counter()
+    repo_dirs = defaultdict(set)
+
+    # Stream every chunk's metadata a page at a time instead of sampling;
+    # stopping at the known count saves a trailing empty request
+    offset = 0
+    while offset < total_chunks:
+        results = collection.get(limit=VECTOR_PAGE_SIZE, offset=offset, include=['metadatas'])
+        metadatas = results['metadatas'] if results else None
+        if not metadatas:
+            break
+        offset += len(metadatas)
+
+        # Pull each metadata field into its own column once (struct-of-arrays)
+        repos = [metadata.get('repository', 'unknown') for metadata in metadatas]
+        file_types = [metadata.get('file_type', 'unknown') for metadata in metadatas]
+        file_paths = [metadata.get('file_path', '') for metadata in metadatas]
+
+        # Tally in C rather than incrementing per chunk
+        repo_counts.update(repos)
+        file_type_counts.update(file_types)
+
+        for repo, file_path in zip(repos, file_paths):
+            # Extract top-level directory structure (first 3 levels)
+            top_dir = _top_dir(file_path)
+            if top_dir:
+                repo_dirs[repo].add(top_dir)
+
+    if repo_counts:
         # Print repository breakdown
-        print("\n" + "-"*80)
-        print("REPOSITORIES INDEXED (sampled from 10,000 chunks):")
-        print("-"*80)
-        for repo, count in sorted(repo_counts.items(), key=lambda x: x[1], reverse=True):
-            # Extrapolate to total
-            total_chunks = collection.count()
-            estimated_total = int(count * total_chunks / len(results['metadatas']))
-            print(f"  {repo:50s} ~{estimated_total:>8,} chunks")
+        emit("\n" + "-"*80)
+        emit("REPOSITORIES INDEXED:")
+        emit("-"*80)
+        for repo, count in repo_counts.most_common():
+            emit(f"  {repo:50s} {count:>8,} chunks")
 
         # Print file type breakdown
-        print("\n" + "-"*80)
-        print("FILE TYPES INDEXED (sampled):")
-        print("-"*80)
-        for file_type, count in sorted(file_type_counts.items(), key=lambda x: x[1], reverse=True)[:20]:
-            print(f"  {file_type:20s} ~{count:>8,} chunks")
+        emit("\n" + "-"*80)
+        emit("FILE TYPES INDEXED:")
+        emit("-"*80)
+        for file_type, count in file_type_counts.most_common(20):
+            emit(f"  {file_type:20s} {count:>8,} chunks")
 
         # Print top directories per repository
-        print("\n" + "-"*80)
-        print("TOP DIRECTORIES PER REPOSITORY (sampled):")
-        print("-"*80)
+        emit("\n" + "-"*80)
+        emit("TOP DIRECTORIES PER REPOSITORY:")
+        emit("-"*80)
         for repo in sorted(repo_counts.keys()):
-            print(f"\n  {repo}:")
-            dirs = sorted(list(repo_dirs[repo]))[:10]
+            emit(f"\n  {repo}:")
+            top_dirs = repo_dirs.get(repo, ())
+            dirs = heapq.nsmallest(10, top_dirs)
             for d in dirs:
-                print(f"    - {d}")
-            if len(repo_dirs[repo]) > 10:
-                print(f"    ... and {len(repo_dirs[repo]) - 10} more directories")
+                emit(f"    - {d}")
+            if len(top_dirs) > 10:
+                emit(f"    ... and {len(top_dirs) - 10} more directories")
 
 
 if __name__ == "__main__":
@@ -155,8 +212,18 @@ if __name__ == "__main__":
     print("MYRAGDB INDEX VERIFICATION")
     print("="*80)
 
-    analyze_keyword_index()
-    analyze_vector_index()
+    # The two indexes are independent (Meilisearch over HTTP, ChromaDB on
+    # disk), so analyse them concurrently; each report is buffered and
+    # printed whole to keep the sections from interleaving
+    analyses = (analyze_keyword_index, analyze_vector_index)
+    buffers = [io.StringIO() for _ in analyses]
+    with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+        futures = [executor.submit(analyze, buffer) for analyze, buffer in zip(analyses, buffers)]
+        for future, buffer in zip(futures, buffers):
+            try:
+                future.result()
+            finally:
+                print(buffer.getvalue(), end="")
 
     print("\n" + "="*80)
     print("VERIFICATION COMPLETE")
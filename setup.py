@@ -3,7 +3,7 @@
 # Author: Libor Ballaty <libor@arionetworks.com>
 # Created: 2026-01-04
 
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -18,7 +18,26 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/lballaty/myragdb",
     package_dir={"": "src"},
-    packages=find_packages(where="src"),
+    # Explicit package list (keep in sync when adding a package under src/);
+    # avoids walking src/ via find_packages() on every editable reinstall
+    packages=[
+        "myragdb",
+        "myragdb.agent",
+        "myragdb.agent.orchestration",
+        "myragdb.agent.skills",
+        "myragdb.api",
+        "myragdb.api.routes",
+        "myragdb.auth",
+        "myragdb.auth.flows",
+        "myragdb.cli",
+        "myragdb.db",
+        "myragdb.indexers",
+        "myragdb.llm",
+        "myragdb.llm.providers",
+        "myragdb.search",
+        "myragdb.utils",
+        "myragdb.watcher",
+    ],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
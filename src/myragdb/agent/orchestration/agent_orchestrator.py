@@ -3,12 +3,164 @@
 # Author: Libor Ballaty <libor@arionetworks.com>
 # Created: 2026-01-07
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import structlog
 
 from myragdb.agent.skills.registry import SkillRegistry
-from myragdb.agent.orchestration.workflow_engine import WorkflowEngine, WorkflowExecution
+from myragdb.agent.orchestration.workflow_engine import WorkflowEngine, WorkflowExecution, WorkflowStep
 from myragdb.agent.orchestration.template_engine import TemplateEngine
 
+logger = structlog.get_logger(__name__)
+
+
+# Built-in workflow templates registered on every AgentOrchestrator.
+# Built once at import; TemplateEngine never mutates a registered template
+# (substitution is copy-on-write), so instances can share these definitions.
+_BUILTIN_TEMPLATES = (
+    # Code Search Template
+    (
+        "code_search",
+        {
+            "name": "code_search",
+            "description": "Search for code across repositories",
+            "category": "search",
+            "parameters": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query",
+                    "required": True
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Result limit",
+                    "default": 10
+                },
+                "repository": {
+                    "type": "string",
+                    "description": "Optional repository filter",
+                    "required": False
+                }
+            },
+            "steps": [
+                {
+                    "skill": "search",
+                    "id": "search_step",
+                    "input": {
+                        "query": "{{ query }}",
+                        "limit": "{{ limit }}",
+                        "repository_filter": "{{ repository }}"
+                    }
+                }
+            ]
+        }
+    ),
+    # Code Analysis Template
+    (
+        "code_analysis",
+        {
+            "name": "code_analysis",
+            "description": "Search and analyze code structure",
+            "category": "analysis",
+            "parameters": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query",
+                    "required": True
+                },
+                "language": {
+                    "type": "string",
+                    "description": "Programming language",
+                    "default": "python"
+                }
+            },
+            "steps": [
+                {
+                    "skill": "search",
+                    "id": "find_code",
+                    "input": {
+                        "query": "{{ query }}",
+                        "limit": 1
+                    }
+                },
+                {
+                    "skill": "code_analysis",
+                    "id": "analyze",
+                    "input": {
+                        "code": "{{ find_code.results[0].snippet }}",
+                        "language": "{{ language }}"
+                    }
+                }
+            ]
+        }
+    ),
+    # Code Review Template
+    (
+        "code_review",
+        {
+            "name": "code_review",
+            "description": "Find code, analyze it, and generate review report",
+            "category": "review",
+            "parameters": {
+                "query": {
+                    "type": "string",
+                    "description": "Code to find and review",
+                    "required": True
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Number of files to review",
+                    "default": 3
+                }
+            },
+            "steps": [
+                {
+                    "skill": "search",
+                    "id": "find_code",
+                    "input": {
+                        "query": "{{ query }}",
+                        "limit": "{{ limit }}"
+                    }
+                },
+                {
+                    "skill": "report",
+                    "id": "generate_report",
+                    "input": {
+                        "title": "Code Review: {{ query }}",
+                        "content": [
+                            {
+                                "section": "Reviewed Files",
+                                "data": {"results": "{{ find_code.results }}"}
+                            }
+                        ],
+                        "format": "markdown"
+                    }
+                }
+            ]
+        }
+    ),
+)
+
+
+def _iter_step_details(steps: Iterable[WorkflowStep]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the per-step summary included in formatted execution results.
+
+    Args:
+        steps: Executed workflow steps
+
+    Yields:
+        Dictionary describing one step's outcome
+    """
+    for step in steps:
+        yield {
+            "id": step.step_id,
+            "skill": step.skill_name,
+            "status": "success" if step.success else "failed",
+            "result": step.result,
+            "error": step.error
+        }
+
 
 class AgentOrchestrator:
     """
@@ -87,129 +239,8 @@ class AgentOrchestrator:
 
     def _register_built_in_templates(self) -> None:
         """Register built-in workflow templates for common tasks."""
-        # Code Search Template
-        self.template_engine.register_template(
-            "code_search",
-            {
-                "name": "code_search",
-                "description": "Search for code across repositories",
-                "category": "search",
-                "parameters": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query",
-                        "required": True
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Result limit",
-                        "default": 10
-                    },
-                    "repository": {
-                        "type": "string",
-                        "description": "Optional repository filter",
-                        "required": False
-                    }
-                },
-                "steps": [
-                    {
-                        "skill": "search",
-                        "id": "search_step",
-                        "input": {
-                            "query": "{{ query }}",
-                            "limit": "{{ limit }}",
-                            "repository_filter": "{{ repository }}"
-                        }
-                    }
-                ]
-            }
-        )
-
-        # Code Analysis Template
-        self.template_engine.register_template(
-            "code_analysis",
-            {
-                "name": "code_analysis",
-                "description": "Search and analyze code structure",
-                "category": "analysis",
-                "parameters": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query",
-                        "required": True
-                    },
-                    "language": {
-                        "type": "string",
-                        "description": "Programming language",
-                        "default": "python"
-                    }
-                },
-                "steps": [
-                    {
-                        "skill": "search",
-                        "id": "find_code",
-                        "input": {
-                            "query": "{{ query }}",
-                            "limit": 1
-                        }
-                    },
-                    {
-                        "skill": "code_analysis",
-                        "id": "analyze",
-                        "input": {
-                            "code": "{{ find_code.results[0].snippet }}",
-                            "language": "{{ language }}"
-                        }
-                    }
-                ]
-            }
-        )
-
-        # Code Review Template
-        self.template_engine.register_template(
-            "code_review",
-            {
-                "name": "code_review",
-                "description": "Find code, analyze it, and generate review report",
-                "category": "review",
-                "parameters": {
-                    "query": {
-                        "type": "string",
-                        "description": "Code to find and review",
-                        "required": True
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Number of files to review",
-                        "default": 3
-                    }
-                },
-                "steps": [
-                    {
-                        "skill": "search",
-                        "id": "find_code",
-                        "input": {
-                            "query": "{{ query }}",
-                            "limit": "{{ limit }}"
-                        }
-                    },
-                    {
-                        "skill": "report",
-                        "id": "generate_report",
-                        "input": {
-                            "title": "Code Review: {{ query }}",
-                            "content": [
-                                {
-                                    "section": "Reviewed Files",
-                                    "data": {"results": "{{ find_code.results }}"}
-                                }
-                            ],
-                            "format": "markdown"
-                        }
-                    }
-                ]
-            }
-        )
+        for template_id, template in _BUILTIN_TEMPLATES:
+            self.template_engine.register_template(template_id, template)
 
     async def execute_request(
         self,
@@ -235,7 +266,7 @@ class AgentOrchestrator:
             ValueError: If request type not found
         """
         # Check if template exists
-        if request_type not in self.template_engine.list_templates():
+        if request_type not in self.template_engine:
             raise ValueError(
                 f"Request type '{request_type}' not found. "
                 f"Available: {', '.join(self.template_engine.list_templates())}"
@@ -299,16 +330,7 @@ class AgentOrchestrator:
             "error": execution.error,
             "steps_completed": sum(1 for s in execution.steps if s.success),
             "total_steps": len(execution.steps),
-            "step_details": [
-                {
-                    "id": step.step_id,
-                    "skill": step.skill_name,
-                    "status": "success" if step.success else "failed",
-                    "result": step.result,
-                    "error": step.error
-                }
-                for step in execution.steps
-            ]
+            "step_details": list(_iter_step_details(execution.steps))
         }
 
     def list_available_templates(self) -> List[Dict[str, Any]]:
@@ -323,8 +345,10 @@ class AgentOrchestrator:
             try:
                 info = self.template_engine.get_template_info(template_id)
                 templates.append(info)
-            except Exception as e:
-                print(f"[AgentOrchestrator] Error getting template {template_id}: {e}")
+            except (ValueError, AttributeError) as e:
+                # ValueError from TemplateEngine, AttributeError from a
+                # malformed template definition
+                logger.warning("template_info_error", template_id=template_id, error=str(e))
 
         return templates
 
@@ -379,11 +403,13 @@ class AgentOrchestrator:
         Returns:
             Dictionary with orchestrator details
         """
+        skill_names = self.skill_registry.list_names()
+        template_ids = self.template_engine.list_templates()
         return {
-            "total_skills": len(self.skill_registry.list_names()),
-            "total_templates": len(self.template_engine.list_templates()),
-            "available_skills": self.skill_registry.list_names(),
-            "available_templates": self.template_engine.list_templates(),
+            "total_skills": len(skill_names),
+            "total_templates": len(template_ids),
+            "available_skills": list(skill_names),
+            "available_templates": list(template_ids),
             "has_session_manager": self.session_manager is not None,
             "has_search_engine": self.search_engine is not None
         }
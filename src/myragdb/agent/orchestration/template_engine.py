@@ -4,11 +4,219 @@
 # Created: 2026-01-07
 
 import os
-from typing import Any, Dict, List, Optional
-import yaml
+import re
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 import json
 
-from myragdb.agent.orchestration.workflow_engine import WorkflowEngine
+from myragdb.agent.orchestration.workflow_engine import WorkflowEngine, has_placeholder
+
+
+def _yaml_load(data: bytes) -> Any:
+    """
+    Parse YAML bytes with the fastest available safe loader.
+
+    libyaml's C loader parses several times faster than the pure-Python
+    SafeLoader, which remains the fallback when PyYAML was built without
+    libyaml. PyYAML is imported on first use, so engines that only hold
+    programmatic or JSON templates never pay its import cost.
+    """
+    import yaml
+    return yaml.load(data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _clone(data: Any) -> Any:
+    """
+    Copy parsed template data (dicts, lists and scalar leaves).
+
+    Much cheaper than copy.deepcopy, which dispatches per object and keeps a
+    memo dict; template files only produce plain JSON/YAML-shaped trees.
+    """
+    data_type = type(data)
+    if data_type is dict:
+        return {key: _clone(value) for key, value in data.items()}
+    if data_type is list:
+        return [_clone(item) for item in data]
+    return data
+
+
+# Parsed template files keyed by (path, mtime_ns, size), shared by every
+# TemplateEngine; an edited file gets a new key and is parsed again
+_PARSED_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_PARSED_CACHE_SIZE = 256
+_PARSED_CACHE_LOCK = threading.Lock()
+
+
+# Precompiled sidecar written next to a YAML template ("foo.yaml.tplc") by
+# TemplateEngine.precompile(): the parsed template as JSON, which loads many
+# times faster than YAML, stamped with the source file's mtime and size.
+# Loading only reads sidecars, so template directories may be read-only.
+# The suffix is deliberately not ".json" so directory scans skip it.
+_SIDECAR_SUFFIX = ".tplc"
+
+
+def _read_sidecar(filepath: str, source_stat: os.stat_result) -> Optional[Any]:
+    """
+    Load the precompiled sidecar of a YAML template if it is up to date.
+
+    Args:
+        filepath: Path to the YAML template
+        source_stat: os.stat() result of the YAML template
+
+    Returns:
+        Parsed template, or None if there is no fresh sidecar
+    """
+    try:
+        with open(filepath + _SIDECAR_SUFFIX, 'rb') as f:
+            compiled = json.loads(f.read())
+        if compiled["source"] != [source_stat.st_mtime_ns, source_stat.st_size]:
+            return None
+        return compiled["template"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_sidecar(filepath: str, source_stat: os.stat_result, template: Any) -> bool:
+    """
+    Write the precompiled sidecar of a YAML template (best effort).
+
+    Business Purpose: Let later loads skip YAML parsing. Skipped when the
+    template does not survive a JSON round trip unchanged (e.g. dates or
+    non-string keys) or the directory is not writable.
+
+    Args:
+        filepath: Path to the YAML template
+        source_stat: os.stat() result of the YAML template when it was read
+        template: Template parsed from that file
+
+    Returns:
+        True if the sidecar was written
+    """
+    try:
+        encoded = json.dumps({
+            "source": [source_stat.st_mtime_ns, source_stat.st_size],
+            "template": template
+        })
+        if json.loads(encoded)["template"] != template:
+            return False
+    except (TypeError, ValueError):
+        return False
+
+    directory = os.path.dirname(filepath) or "."
+    try:
+        # Write to a temp file and rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=_SIDECAR_SUFFIX + ".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(encoded)
+            os.replace(tmp_path, filepath + _SIDECAR_SUFFIX)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        return False
+    return True
+
+
+# Matches a "{{ param_name }}" template parameter reference
+_PARAMETER_PATTERN = re.compile(r"\{\{ ([^{}]*?) \}\}")
+
+
+# A compiled substitution: path from the template root to a string leaf,
+# and the parameter names that string references
+SubstitutionOp = Tuple[Tuple[Any, ...], FrozenSet[str]]
+
+
+def _collect_ops(data: Any, path: Tuple[Any, ...], ops: List[SubstitutionOp]) -> None:
+    """Append a substitution op for every placeholder string under data."""
+    if isinstance(data, str):
+        names = frozenset(_PARAMETER_PATTERN.findall(data))
+        if names:
+            ops.append((path, names))
+
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            _collect_ops(value, path + (key,), ops)
+
+    elif isinstance(data, list):
+        for index, item in enumerate(data):
+            _collect_ops(item, path + (index,), ops)
+
+
+def _compile_template(template: Dict[str, Any]) -> List[SubstitutionOp]:
+    """
+    Compile a template's step inputs into a list of substitution ops.
+
+    Business Purpose: Walk the template once at registration and record where
+    its "{{ param }}" references are, so each execution only visits those
+    leaves instead of re-walking every node.
+
+    Args:
+        template: Workflow template definition
+
+    Returns:
+        Substitution ops in document order
+
+    Example:
+        ops = _compile_template({"steps": [{"input": {"query": "{{ query }}"}}]})
+        # [(("steps", 0, "input", "query"), frozenset({"query"}))]
+    """
+    ops: List[SubstitutionOp] = []
+    steps = template.get("steps") if isinstance(template, dict) else None
+    if isinstance(steps, list):
+        for index, step in enumerate(steps):
+            if isinstance(step, dict) and has_placeholder(step.get("input")):
+                _collect_ops(step["input"], ("steps", index, "input"), ops)
+    return ops
+
+
+def _apply_ops(
+    template: Dict[str, Any],
+    ops: List[SubstitutionOp],
+    parameters: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Apply compiled substitution ops to a template.
+
+    Copy-on-write: only the containers on the path to a substituted leaf are
+    copied; everything else is shared with the (unmodified) template.
+
+    Args:
+        template: Registered template definition
+        ops: Ops from _compile_template for that template
+        parameters: Parameter values
+
+    Returns:
+        Template with substituted values
+    """
+    workflow = dict(template)
+    copied: Dict[Tuple[Any, ...], Any] = {(): workflow}
+
+    for path, names in ops:
+        # A referenced parameter replaces the whole string value; strings
+        # referencing no given parameter (e.g. step results) are left as-is
+        for param_name, param_value in parameters.items():
+            if param_name in names:
+                break
+        else:
+            continue
+
+        container = workflow
+        for depth in range(1, len(path)):
+            child = copied.get(path[:depth])
+            if child is None:
+                original = container[path[depth - 1]]
+                child = dict(original) if isinstance(original, dict) else list(original)
+                container[path[depth - 1]] = child
+                copied[path[:depth]] = child
+            container = child
+        container[path[-1]] = param_value
+
+    return workflow
 
 
 class TemplateLibrary:
@@ -22,6 +230,9 @@ class TemplateLibrary:
     def __init__(self):
         """Initialize template library."""
         self.templates: Dict[str, Dict[str, Any]] = {}
+        # Bumped by register_template/delete_template so callers can cache
+        # data derived from the template set
+        self.version = 0
 
     def register_template(self, template_id: str, template: Dict[str, Any]) -> None:
         """
@@ -32,6 +243,7 @@ class TemplateLibrary:
             template: Workflow template definition
         """
         self.templates[template_id] = template
+        self.version += 1
 
     def get_template(self, template_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -66,6 +278,7 @@ class TemplateLibrary:
         """
         if template_id in self.templates:
             del self.templates[template_id]
+            self.version += 1
             return True
         return False
 
@@ -133,6 +346,19 @@ class TemplateEngine:
         self.workflow_engine = workflow_engine
         self.template_dir = template_dir
         self.library = TemplateLibrary()
+        # Direct reference to the library's dict for hot-path lookups
+        self._templates = self.library.templates
+        # template_id -> (template, substitution ops compiled at registration)
+        self._compiled_ops: Dict[str, Tuple[Dict[str, Any], List[SubstitutionOp]]] = {}
+        # template_id -> (template, skill names snapshot, is_valid, error);
+        # validity depends on which skills exist, so a result only holds
+        # while the registry's list_names() snapshot is unchanged
+        self._validation_cache: Dict[str, tuple] = {}
+        # template_id -> (template, skill names snapshot, workflow info)
+        self._workflow_info_cache: Dict[str, tuple] = {}
+        # (library version, template IDs): list_templates() result, rebuilt
+        # whenever the library changes
+        self._template_ids_snapshot: Optional[Tuple[int, Tuple[str, ...]]] = None
 
         # Load templates from directory if provided
         if template_dir and os.path.isdir(template_dir):
@@ -142,20 +368,41 @@ class TemplateEngine:
         """
         Load all templates from a directory.
 
-        Business Purpose: Auto-discover YAML/JSON template files.
+        Business Purpose: Auto-discover YAML/JSON template files. Files are
+        read and parsed on a thread pool so disk reads overlap with parsing
+        (libyaml and json release the GIL while scanning); registration
+        stays on the calling thread, in directory order.
 
         Args:
             directory: Directory containing template files
         """
-        for filename in os.listdir(directory):
-            if filename.endswith((".yaml", ".yml", ".json")):
-                filepath = os.path.join(directory, filename)
-                try:
-                    template = self.load_template_from_file(filepath)
-                    template_id = os.path.splitext(filename)[0]
-                    self.library.register_template(template_id, template)
-                except Exception as e:
-                    print(f"[TemplateEngine] Failed to load template {filename}: {e}")
+        # scandir entries carry the file type from the directory read, so
+        # there is no per-entry isfile() stat or path join
+        with os.scandir(directory) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.endswith((".yaml", ".yml", ".json")) and entry.is_file()
+            ]
+        if not entries:
+            return
+
+        def load(entry: os.DirEntry) -> tuple:
+            # One bad template must not abort the rest of the batch
+            try:
+                return self.load_template_from_file(entry.path), None
+            except Exception as e:
+                return None, e
+
+        max_workers = min(len(entries), 32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(load, entries))
+
+        for entry, (template, error) in zip(entries, results):
+            if error is not None:
+                print(f"[TemplateEngine] Failed to load template {entry.name}: {error}")
+                continue
+            template_id = entry.name.rpartition(".")[0]
+            self.register_template(template_id, template)
 
     def load_template_from_file(self, filepath: str) -> Dict[str, Any]:
         """
@@ -170,23 +417,77 @@ class TemplateEngine:
         Raises:
             ValueError: If file format is unsupported or parsing fails
         """
-        if not os.path.isfile(filepath):
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Template file not found: {filepath}")
 
-        try:
-            with open(filepath, 'r') as f:
-                if filepath.endswith('.json'):
-                    template = json.load(f)
-                elif filepath.endswith(('.yaml', '.yml')):
-                    template = yaml.safe_load(f)
-                else:
-                    raise ValueError(f"Unsupported file format: {filepath}")
+        # Reuse an earlier parse of the same file contents; callers get their
+        # own copy so the cached definition can't be modified
+        cache_key = (filepath, st.st_mtime_ns, st.st_size)
+        with _PARSED_CACHE_LOCK:
+            cached = _PARSED_CACHE.get(cache_key)
+            if cached is not None:
+                _PARSED_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            return _clone(cached)
 
-            return template
+        try:
+            if filepath.endswith('.json'):
+                with open(filepath, 'rb') as f:
+                    template = json.loads(f.read())
+            elif filepath.endswith(('.yaml', '.yml')):
+                template = _read_sidecar(filepath, st)
+                if template is None:
+                    with open(filepath, 'rb') as f:
+                        template = _yaml_load(f.read())
+            else:
+                raise ValueError(f"Unsupported file format: {filepath}")
 
         except Exception as e:
             raise ValueError(f"Failed to parse template file {filepath}: {str(e)}")
 
+        with _PARSED_CACHE_LOCK:
+            _PARSED_CACHE[cache_key] = template
+            if len(_PARSED_CACHE) > _PARSED_CACHE_SIZE:
+                _PARSED_CACHE.popitem(last=False)
+
+        return _clone(template)
+
+    @classmethod
+    def precompile(cls, template_dir: str) -> int:
+        """
+        Write precompiled sidecars for every YAML template in a directory.
+
+        Business Purpose: Build-time step so the first TemplateEngine start
+        after a deploy already loads templates from the fast JSON form.
+
+        Args:
+            template_dir: Directory containing template files
+
+        Returns:
+            Number of sidecars written
+
+        Example:
+            TemplateEngine.precompile("./templates")
+        """
+        written = 0
+        for filename in os.listdir(template_dir):
+            if filename.endswith((".yaml", ".yml")):
+                filepath = os.path.join(template_dir, filename)
+                try:
+                    source_stat = os.stat(filepath)
+                    with open(filepath, 'rb') as f:
+                        template = _yaml_load(f.read())
+                except Exception as e:
+                    print(f"[TemplateEngine] Failed to precompile template {filename}: {e}")
+                    continue
+                if _write_sidecar(filepath, source_stat, template):
+                    written += 1
+        return written
+
     def register_template(self, template_id: str, template: Dict[str, Any]) -> None:
         """
         Register a workflow template.
@@ -196,6 +497,9 @@ class TemplateEngine:
             template: Workflow template definition
         """
         self.library.register_template(template_id, template)
+        self._workflow_info_cache.pop(template_id, None)
+        self._compiled_ops[template_id] = (template, _compile_template(template))
+        self._validate_registered(template_id, template)
 
     def get_template(self, template_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -207,11 +511,25 @@ class TemplateEngine:
         Returns:
             Template definition or None
         """
-        return self.library.get_template(template_id)
+        return self._templates.get(template_id)
 
-    def list_templates(self) -> List[str]:
-        """List available template IDs."""
-        return self.library.list_templates()
+    def list_templates(self) -> Tuple[str, ...]:
+        """
+        List available template IDs.
+
+        Returns:
+            Immutable snapshot of template identifiers, cached until the
+            library next changes (wrap in list() if a list is needed)
+        """
+        version = self.library.version
+        snapshot = self._template_ids_snapshot
+        if snapshot is None or snapshot[0] != version:
+            snapshot = self._template_ids_snapshot = (version, tuple(self._templates))
+        return snapshot[1]
+
+    def __contains__(self, template_id: str) -> bool:
+        """Check whether a template is registered (O(1), no list allocation)."""
+        return template_id in self._templates
 
     def validate_template(self, template: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         """
@@ -241,6 +559,34 @@ class TemplateEngine:
         is_valid, error = self.workflow_engine.validate_workflow(template)
         return is_valid, error
 
+    def _validate_registered(
+        self,
+        template_id: str,
+        template: Dict[str, Any]
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Validate a registered template, reusing the cached result.
+
+        Business Purpose: Templates are validated once at registration; later
+        executions reuse that result until the template is replaced or the
+        set of registered skills changes.
+
+        Args:
+            template_id: Template identifier
+            template: Template registered under that ID
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        skill_names = self.workflow_engine.skill_registry.list_names()
+        cached = self._validation_cache.get(template_id)
+        if cached is not None and cached[0] is template and cached[1] is skill_names:
+            return cached[2], cached[3]
+
+        is_valid, error = self.validate_template(template)
+        self._validation_cache[template_id] = (template, skill_names, is_valid, error)
+        return is_valid, error
+
     async def execute_template(
         self,
         template_id: str,
@@ -263,17 +609,22 @@ class TemplateEngine:
         Raises:
             ValueError: If template not found or invalid
         """
-        template = self.library.get_template(template_id)
+        template = self._templates.get(template_id)
         if not template:
             raise ValueError(f"Template '{template_id}' not found")
 
-        # Validate template
-        is_valid, error = self.validate_template(template)
+        # Validate template (cached since registration)
+        is_valid, error = self._validate_registered(template_id, template)
         if not is_valid:
             raise ValueError(f"Template validation failed: {error}")
 
-        # Substitute parameters
-        workflow = self._substitute_parameters(template, parameters or {})
+        # Substitute parameters using the inputs compiled at registration
+        # (recompiled if the library entry was replaced behind our back)
+        compiled = self._compiled_ops.get(template_id)
+        if compiled is None or compiled[0] is not template:
+            compiled = (template, _compile_template(template))
+            self._compiled_ops[template_id] = compiled
+        workflow = self._substitute_parameters(template, parameters or {}, compiled[1])
 
         # Execute workflow
         execution = await self.workflow_engine.execute_workflow(
@@ -287,7 +638,8 @@ class TemplateEngine:
     def _substitute_parameters(
         self,
         template: Dict[str, Any],
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        compiled_ops: Optional[List[SubstitutionOp]] = None
     ) -> Dict[str, Any]:
         """
         Substitute parameters in template.
@@ -297,52 +649,17 @@ class TemplateEngine:
         Args:
             template: Template with parameter placeholders
             parameters: Parameter values
+            compiled_ops: Optional substitution ops from _compile_template;
+                compiled on the fly when omitted
 
         Returns:
-            Template with substituted values
+            Template with substituted values (shares unmodified values with
+            the registered template, which must not be mutated)
         """
-        import copy
-        workflow = copy.deepcopy(template)
+        if compiled_ops is None:
+            compiled_ops = _compile_template(template)
 
-        # Substitute in steps
-        for step in workflow.get("steps", []):
-            step["input"] = self._substitute_dict(
-                step.get("input", {}),
-                parameters
-            )
-
-        return workflow
-
-    def _substitute_dict(
-        self,
-        data: Any,
-        parameters: Dict[str, Any]
-    ) -> Any:
-        """
-        Recursively substitute parameters in data.
-
-        Args:
-            data: Data with potential variable references
-            parameters: Parameter values
-
-        Returns:
-            Data with variables substituted
-        """
-        if isinstance(data, str):
-            # Simple parameter substitution: {{ param_name }}
-            for param_name, param_value in parameters.items():
-                placeholder = f"{{{{ {param_name} }}}}"
-                if placeholder in data:
-                    return param_value
-            return data
-
-        elif isinstance(data, dict):
-            return {k: self._substitute_dict(v, parameters) for k, v in data.items()}
-
-        elif isinstance(data, list):
-            return [self._substitute_dict(item, parameters) for item in data]
-
-        return data
+        return _apply_ops(template, compiled_ops, parameters)
 
     def get_template_info(self, template_id: str) -> Dict[str, Any]:
         """
@@ -359,7 +676,7 @@ class TemplateEngine:
         Raises:
             ValueError: If template not found
         """
-        template = self.library.get_template(template_id)
+        template = self._templates.get(template_id)
         if not template:
             raise ValueError(f"Template '{template_id}' not found")
 
@@ -370,5 +687,29 @@ class TemplateEngine:
             "category": template.get("category", ""),
             "parameters": template.get("parameters", {}),
             "step_count": len(template.get("steps", [])),
-            "workflow_info": self.workflow_engine.get_workflow_info(template)
+            "workflow_info": self._get_workflow_info(template_id, template)
         }
+
+    def _get_workflow_info(self, template_id: str, template: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get workflow info for a registered template, memoized per template.
+
+        Business Purpose: Template listings are polled by the UI; the step
+        walk and skill schema lookups only need to run again when the
+        template is re-registered or the registered skills change.
+
+        Args:
+            template_id: Template identifier
+            template: Template registered under that ID
+
+        Returns:
+            Workflow info dictionary (shared between calls; do not modify)
+        """
+        skill_names = self.workflow_engine.skill_registry.list_names()
+        cached = self._workflow_info_cache.get(template_id)
+        if cached is not None and cached[0] is template and cached[1] is skill_names:
+            return cached[2]
+
+        info = self.workflow_engine.get_workflow_info(template)
+        self._workflow_info_cache[template_id] = (template, skill_names, info)
+        return info
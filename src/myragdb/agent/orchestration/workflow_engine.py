@@ -3,13 +3,59 @@
 # Author: Libor Ballaty <libor@arionetworks.com>
 # Created: 2026-01-07
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import itertools
 import json
+import re
+import sys
 
 from myragdb.agent.skills.base import Skill, SkillExecutionError
 from myragdb.agent.skills.registry import SkillRegistry
 
 
+# A string that is exactly one "{{ variable.path }}" reference
+_VARIABLE_PATTERN = re.compile(r"\s*\{\{\s*([^}]+?)\s*\}\}\s*\Z")
+
+# Variable path grammar: "step_id.field[0].subfield"
+_PATH_PATTERN = re.compile(r"[^.\[\]]+(?:\.[^.\[\]]+|\[\d+\])*")
+_PATH_TOKEN = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+# Distinct variable paths kept compiled per engine
+_PATH_CACHE_SIZE = 1024
+
+# Step definitions whose placeholder check is kept per engine
+_STEP_CACHE_SIZE = 1024
+
+# Opcodes of a compiled variable path
+_OP_GET = 0
+_OP_INDEX = 1
+
+# (root step_id, ((opcode, field_or_index), ...))
+CompiledPath = Tuple[str, Tuple[Tuple[int, Any], ...]]
+
+
+def has_placeholder(data: Any) -> bool:
+    """
+    Check whether data may contain a "{{ ... }}" reference.
+
+    One C-level scan of the JSON form, so placeholder-free step inputs can
+    skip the recursive substitution/interpolation walk (shared with
+    TemplateEngine, which runs it when compiling templates).
+    """
+    if isinstance(data, str):
+        return "{{" in data
+    try:
+        return "{{" in json.dumps(data)
+    except (TypeError, ValueError):
+        # Not JSON-serializable; let the interpolation walk decide
+        return True
+
+
+def _intern(value: Any) -> Any:
+    """Intern identifier strings so registry/context lookups compare by pointer."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class WorkflowStep:
     """
     Represents a single step in a workflow execution.
@@ -18,12 +64,18 @@ class WorkflowStep:
     and metadata for execution tracking.
     """
 
+    __slots__ = (
+        "skill_name", "input_data", "step_id", "description",
+        "needs_interpolation", "result", "error", "success"
+    )
+
     def __init__(
         self,
         skill_name: str,
         input_data: Dict[str, Any],
         step_id: Optional[str] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        needs_interpolation: Optional[bool] = None
     ):
         """
         Initialize workflow step.
@@ -31,13 +83,19 @@ class WorkflowStep:
         Args:
             skill_name: Name of skill to execute
             input_data: Input parameters for skill
-            step_id: Optional unique step identifier
+            step_id: Optional unique step identifier (assigned by
+                WorkflowExecution.add_step when omitted)
             description: Optional description of what this step does
+            needs_interpolation: Whether input_data holds "{{ ... }}"
+                references, if already known (checked here otherwise)
         """
-        self.skill_name = skill_name
+        self.skill_name = _intern(skill_name)
         self.input_data = input_data
-        self.step_id = step_id or f"{skill_name}_{id(self)}"
+        self.step_id = _intern(step_id)
         self.description = description or f"Execute {skill_name}"
+        if needs_interpolation is None:
+            needs_interpolation = has_placeholder(input_data)
+        self.needs_interpolation = needs_interpolation
         self.result: Optional[Dict[str, Any]] = None
         self.error: Optional[str] = None
         self.success: bool = False
@@ -51,6 +109,11 @@ class WorkflowExecution:
     for auditing and debugging.
     """
 
+    __slots__ = (
+        "workflow_id", "workflow_name", "steps", "current_step_index",
+        "status", "error", "final_result", "_context", "_step_counter"
+    )
+
     def __init__(self, workflow_id: str, workflow_name: str):
         """
         Initialize workflow execution.
@@ -66,9 +129,19 @@ class WorkflowExecution:
         self.status: str = "pending"  # pending, running, completed, failed
         self.error: Optional[str] = None
         self.final_result: Optional[Dict[str, Any]] = None
+        # Results of finished steps by step_id, filled in as steps complete
+        self._context: Dict[str, Any] = {}
+        self._step_counter = itertools.count()
 
     def add_step(self, step: WorkflowStep) -> None:
-        """Add step to workflow."""
+        """
+        Add step to workflow.
+
+        Steps without an ID get a short, deterministic "<skill>_<position>" ID.
+        """
+        position = next(self._step_counter)
+        if not step.step_id:
+            step.step_id = _intern(f"{step.skill_name}_{position}")
         self.steps.append(step)
 
     def get_step_result(self, step_id: str) -> Optional[Dict[str, Any]]:
@@ -78,12 +151,18 @@ class WorkflowExecution:
                 return step.result
         return None
 
+    def record_step(self, step: WorkflowStep) -> None:
+        """Make a finished step's result available to later steps."""
+        self._context[step.step_id] = step.result
+
     def get_context(self) -> Dict[str, Any]:
-        """Get all previous step results as context for variable interpolation."""
-        context: Dict[str, Any] = {}
-        for step in self.steps[:self.current_step_index]:
-            context[step.step_id] = step.result
-        return context
+        """
+        Get all previous step results as context for variable interpolation.
+
+        Returns the execution's live context dict (maintained by
+        record_step, so no per-step rebuild); callers must not modify it.
+        """
+        return self._context
 
 
 class WorkflowEngine:
@@ -130,6 +209,13 @@ class WorkflowEngine:
             skill_registry: SkillRegistry instance for skill lookup
         """
         self.skill_registry = skill_registry
+        # Variable path -> compiled opcodes, e.g. "s.results[0]" ->
+        # ("s", ((_OP_GET, "results"), (_OP_INDEX, 0)))
+        self._path_cache: Dict[str, Optional[CompiledPath]] = {}
+        # id(step definition) -> (step definition, needs_interpolation)
+        self._step_cache: Dict[int, Tuple[Dict[str, Any], bool]] = {}
+        # Numbers executions that were not given an explicit ID
+        self._execution_counter = itertools.count()
 
     async def execute_workflow(
         self,
@@ -165,14 +251,17 @@ class WorkflowEngine:
             raise ValueError("Workflow must have 'steps' list with at least one step")
 
         # Create execution tracker
-        exec_id = execution_id or f"{workflow_name}_{id(self)}"
+        exec_id = execution_id or f"{workflow_name}_{next(self._execution_counter)}"
         execution = WorkflowExecution(exec_id, workflow_name)
 
         # Add initial context if provided
         if context:
             execution.final_result = context
 
-        # Build step list
+        # Build step list, resolving each distinct skill once up front
+        skills: List[Optional[Skill]] = []
+        continue_on_error: List[bool] = []
+        resolved: Dict[str, Optional[Skill]] = {}
         for step_def in steps_def:
             if not isinstance(step_def, dict):
                 raise ValueError(f"Step must be a dictionary: {step_def}")
@@ -182,12 +271,20 @@ class WorkflowEngine:
                 raise ValueError("Each step must have a 'skill' field")
 
             input_data = step_def.get("input", {})
-            step_id = step_def.get("id", f"{skill_name}_{len(execution.steps)}")
+            step_id = step_def.get("id")
             description = step_def.get("description")
 
-            step = WorkflowStep(skill_name, input_data, step_id, description)
+            step = WorkflowStep(
+                skill_name, input_data, step_id, description,
+                self._needs_interpolation(step_def)
+            )
             execution.add_step(step)
 
+            if step.skill_name not in resolved:
+                resolved[step.skill_name] = self.skill_registry.get(step.skill_name)
+            skills.append(resolved[step.skill_name])
+            continue_on_error.append(step_def.get("on_error") == "continue")
+
         # Execute steps
         execution.status = "running"
 
@@ -196,15 +293,19 @@ class WorkflowEngine:
 
             try:
                 # Get skill instance
-                skill = self.skill_registry.get(step.skill_name)
+                skill = skills[step_index]
                 if not skill:
                     raise ValueError(f"Skill '{step.skill_name}' not found in registry")
 
-                # Interpolate variables in input
-                interpolated_input = self._interpolate_variables(
-                    step.input_data,
-                    execution.get_context()
-                )
+                # Interpolate variables in input (inputs without any
+                # "{{" reference are passed through untouched)
+                if step.needs_interpolation:
+                    interpolated_input = self._interpolate_variables(
+                        step.input_data,
+                        execution.get_context()
+                    )
+                else:
+                    interpolated_input = step.input_data
 
                 # Validate input against skill schema
                 if not await skill.validate_input(interpolated_input):
@@ -219,6 +320,7 @@ class WorkflowEngine:
                 step.result = result
                 step.success = True
                 execution.final_result = result
+                execution.record_step(step)
 
             except Exception as e:
                 step.error = str(e)
@@ -227,7 +329,8 @@ class WorkflowEngine:
                 execution.error = f"Step '{step.skill_name}' failed: {str(e)}"
 
                 # Check if step has error handler
-                if step_def.get("on_error") == "continue":
+                if continue_on_error[step_index]:
+                    execution.record_step(step)
                     continue
                 else:
                     # Default: stop on error
@@ -257,11 +360,11 @@ class WorkflowEngine:
         Returns:
             Data with variables interpolated
         """
-        if isinstance(data, str):
-            # Handle {{var}} syntax
-            if data.startswith("{{") and data.endswith("}}"):
-                var_path = data[2:-2].strip()
-                return self._resolve_variable(var_path, context)
+        if type(data) is str:
+            # Handle {{var}} syntax in a single regex scan
+            match = _VARIABLE_PATTERN.match(data)
+            if match:
+                return self._resolve_variable(match.group(1), context)
             return data
 
         elif isinstance(data, dict):
@@ -272,6 +375,64 @@ class WorkflowEngine:
 
         return data
 
+    def _needs_interpolation(self, step_def: Dict[str, Any]) -> bool:
+        """
+        Check a step definition for placeholders once and cache the result.
+
+        Business Purpose: Re-executed workflows (and template steps that
+        parameter substitution left untouched, which stay the same object)
+        reuse the check instead of serializing the input on every run.
+        Step definitions are treated as immutable once executed.
+
+        Args:
+            step_def: Step definition from the workflow
+
+        Returns:
+            True if the step input may reference "{{ ... }}" variables
+        """
+        cached = self._step_cache.get(id(step_def))
+        # The stored definition keeps its id from being reused while cached
+        if cached is not None and cached[0] is step_def:
+            return cached[1]
+
+        needs_interpolation = has_placeholder(step_def.get("input", {}))
+        if len(self._step_cache) >= _STEP_CACHE_SIZE:
+            self._step_cache.clear()
+        self._step_cache[id(step_def)] = (step_def, needs_interpolation)
+        return needs_interpolation
+
+    def _compile_path(self, path: str) -> Optional[CompiledPath]:
+        """
+        Compile a variable path into opcodes once and cache the result.
+
+        Args:
+            path: Variable path like "step_id.results[0].text"
+
+        Returns:
+            (root step_id, ((_OP_GET, field) | (_OP_INDEX, n), ...)), or None
+            if the path is malformed
+        """
+        try:
+            return self._path_cache[path]
+        except KeyError:
+            pass
+
+        compiled = None
+        if _PATH_PATTERN.fullmatch(path):
+            tokens = _PATH_TOKEN.findall(path)
+            compiled = (
+                tokens[0][0],
+                tuple(
+                    (_OP_GET, field) if field else (_OP_INDEX, int(index))
+                    for field, index in tokens[1:]
+                )
+            )
+
+        if len(self._path_cache) >= _PATH_CACHE_SIZE:
+            self._path_cache.clear()
+        self._path_cache[path] = compiled
+        return compiled
+
     def _resolve_variable(self, path: str, context: Dict[str, Any]) -> Any:
         """
         Resolve a variable path in context.
@@ -285,35 +446,26 @@ class WorkflowEngine:
         Returns:
             Resolved value or original path string if not found
         """
-        parts = path.split(".")
-        if not parts:
-            return None
+        compiled = self._compile_path(path)
+        if compiled is None:
+            return f"{{{{{path}}}}}"
 
         # Get root step result
-        step_id = parts[0]
+        step_id, ops = compiled
         if step_id not in context:
             return f"{{{{{path}}}}}"  # Return unresolved variable
 
         value = context[step_id]
 
-        # Traverse remaining parts
-        for part in parts[1:]:
-            if isinstance(value, dict):
-                value = value.get(part)
-            elif isinstance(value, list):
-                try:
-                    # Handle array indexing like "results[0]"
-                    if "[" in part:
-                        field, index_str = part.split("[")
-                        index = int(index_str.rstrip("]"))
-                        value = value[index]
-                        if field and isinstance(value, dict):
-                            value = value.get(field)
-                    else:
-                        # Can't traverse into list without index
-                        return f"{{{{{path}}}}}"
-                except (ValueError, IndexError, KeyError):
+        # Apply field/index opcodes; anything that doesn't fit the value's
+        # shape leaves the variable unresolved
+        for op, arg in ops:
+            if op:  # _OP_INDEX
+                if type(value) is not list or arg >= len(value):
                     return f"{{{{{path}}}}}"
+                value = value[arg]
+            elif type(value) is dict:
+                value = value.get(arg)
             else:
                 return f"{{{{{path}}}}}"
 
@@ -338,6 +490,10 @@ class WorkflowEngine:
         if not isinstance(steps, list) or not steps:
             return False, "Workflow must have non-empty 'steps' list"
 
+        # Check membership against the registry's dict directly rather than
+        # calling has_skill() once per step
+        known_skills = self.skill_registry.skills
+
         for i, step in enumerate(steps):
             if not isinstance(step, dict):
                 return False, f"Step {i} must be a dictionary"
@@ -346,7 +502,7 @@ class WorkflowEngine:
             if not skill_name:
                 return False, f"Step {i} missing 'skill' field"
 
-            if not self.skill_registry.has_skill(skill_name):
+            if skill_name not in known_skills:
                 return False, f"Skill '{skill_name}' not found in registry (step {i})"
 
         return True, None
@@ -3,7 +3,7 @@
 # Author: Libor Ballaty <libor@arionetworks.com>
 # Created: 2026-01-07
 
-from myragdb.agent.skills.base import Skill, SkillExecutionError, SkillInfo, SkillValidationError
+from myragdb.agent.skills.base import Skill, SkillConfig, SkillExecutionError, SkillInfo, SkillValidationError
 from myragdb.agent.skills.registry import SkillRegistry
 
 # Built-in skills
@@ -22,6 +22,7 @@ from myragdb.agent.skills.webhook_integration_skill import WebhookIntegrationSki
 __all__ = [
     # Base
     "Skill",
+    "SkillConfig",
     "SkillInfo",
     "SkillExecutionError",
     "SkillValidationError",
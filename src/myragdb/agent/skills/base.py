@@ -4,28 +4,78 @@
 # Created: 2026-01-07
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
 
-from pydantic import BaseModel
 
-
-class SkillInputSchema(BaseModel):
+class SkillInputSchema:
     """Input schema for a skill"""
     pass
 
 
-class SkillOutputSchema(BaseModel):
+class SkillOutputSchema:
     """Output schema for a skill"""
     pass
 
 
-class SkillInfo(BaseModel):
-    """Metadata about a skill"""
+@dataclass(slots=True, frozen=True)
+class SkillInfo:
+    """Metadata about a skill (plain container; built from trusted skill code)"""
     name: str
     description: str
     input_schema: Dict[str, Any]
     output_schema: Dict[str, Any]
-    required_config: List[str] = []
+    required_config: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metadata as a plain dict."""
+        return asdict(self)
+
+
+@dataclass
+class SkillConfig:
+    """
+    Base class for skill configuration.
+
+    Configurable skills subclass this as a dataclass with their own fields
+    (e.g. CodeGenerationConfig) and pass an instance to Skill.__init__,
+    which stores it as skill.config.
+    """
+    pass
+
+
+def _compile_input_validator(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Generate a validator function specialized to an input schema.
+
+    Business Purpose: Skill inputs are validated before every workflow step.
+    Walking the schema dict each time repeats the same lookups; instead the
+    checks for required fields are emitted once as a single boolean
+    expression, e.g. for SearchSkill:
+        "query" in d and isinstance(d["query"], str)
+
+    Args:
+        schema: Skill input_schema
+
+    Returns:
+        Function taking input_data and returning True if it is valid
+    """
+    checks = []
+    for field_name, field_spec in schema.items():
+        if not field_spec.get("required", False):
+            continue
+        key = repr(field_name)
+        checks.append(f"{key} in d")
+        field_type = field_spec.get("type")
+        if field_type == "string":
+            checks.append(f"isinstance(d[{key}], str)")
+        elif field_type == "integer":
+            checks.append(f"isinstance(d[{key}], int)")
+
+    source = f"def _validate(d):\n    return {' and '.join(checks) or 'True'}\n"
+    namespace: Dict[str, Any] = {}
+    exec(source, {"isinstance": isinstance, "str": str, "int": int}, namespace)
+    return namespace["_validate"]
 
 
 class Skill(ABC):
@@ -59,16 +109,27 @@ class Skill(ABC):
         print(result)  # {"results": [...]}
     """
 
-    def __init__(self, name: str, description: str):
+    # Subclasses that add attributes without declaring __slots__ still get a
+    # __dict__; _info caches get_info(), config is None unless the skill is
+    # configurable
+    __slots__ = ("name", "description", "_info", "config")
+
+    # Generated per subclass by validate_input()
+    _input_validator: Optional[Callable[[Dict[str, Any]], bool]] = None
+
+    def __init__(self, name: str, description: str, config: Optional[SkillConfig] = None):
         """
         Initialize skill.
 
         Args:
             name: Unique skill identifier (e.g., "search", "sql", "report")
             description: Human-readable description of what skill does
+            config: Skill configuration, for configurable skills
         """
         self.name = name
         self.description = description
+        self.config = config
+        self._info: Optional[SkillInfo] = None
 
     @property
     @abstractmethod
@@ -151,35 +212,35 @@ class Skill(ABC):
             True if input is valid
 
         Note: Default implementation is basic. Override for complex validation.
+        The checks are generated once per skill class from input_schema (see
+        _compile_input_validator), so input_schema must not vary per instance.
         """
-        schema = self.input_schema
-        for field_name, field_spec in schema.items():
-            if field_spec.get("required", False):
-                if field_name not in input_data:
-                    return False
-                if field_spec.get("type") == "string":
-                    if not isinstance(input_data[field_name], str):
-                        return False
-                elif field_spec.get("type") == "integer":
-                    if not isinstance(input_data[field_name], int):
-                        return False
-
-        return True
+        validator = type(self).__dict__.get("_input_validator")
+        if validator is None:
+            validator = _compile_input_validator(self.input_schema)
+            type(self)._input_validator = validator
+        return validator(input_data)
 
     def get_info(self) -> SkillInfo:
         """
         Get metadata about this skill.
 
+        Built once per skill instance; name, description and schemas don't
+        change after construction.
+
         Returns:
             SkillInfo with name, description, schemas
         """
-        return SkillInfo(
-            name=self.name,
-            description=self.description,
-            input_schema=self.input_schema,
-            output_schema=self.output_schema,
-            required_config=self.required_config
-        )
+        # getattr: the slot is unset if a subclass bypasses Skill.__init__
+        if getattr(self, "_info", None) is None:
+            self._info = SkillInfo(
+                name=self.name,
+                description=self.description,
+                input_schema=dict(self.input_schema),
+                output_schema=dict(self.output_schema),
+                required_config=list(self.required_config)
+            )
+        return self._info
 
     def __repr__(self) -> str:
         return f"Skill(name={self.name})"
@@ -4,11 +4,912 @@
 # Created: 2026-01-07
 
 import ast
+import asyncio
+import atexit
+import functools
+import hashlib
+import io
+import multiprocessing
+import os
 import re
-from typing import Any, Dict, List, Optional
+import threading
+import tokenize
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterator, List, Mapping, NamedTuple, Optional, Tuple
 
 from myragdb.agent.skills.base import Skill, SkillExecutionError
 
+# Hyperscan finds JS/TS match candidates with a SIMD-compiled automaton;
+# optional (x86-64 only), re is used when it is not installed
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# The third-party regex engine runs the fused JS/TS pattern about twice as
+# fast as re; optional (it comes in with transformers), re otherwise
+try:
+    import regex
+except ImportError:
+    regex = None
+
+
+# Analysis results keyed by (analyzer, analysis_type, blake2b digest of the
+# code), shared by every CodeAnalysisSkill; agents often re-analyze the same
+# snippet
+_ANALYSIS_CACHE: "OrderedDict[Tuple[str, str, bytes], Dict[str, Any]]" = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 512
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+
+# Python sources remembered per code_id for incremental re-analysis
+_SESSION_LIMIT = 64
+
+# Python sources at least this large are scanned from tokens instead of
+# building a full AST (bounded memory; the C parser is faster below this)
+_STREAM_PARSE_MIN_SIZE = 1 << 20
+
+# Batch items at least this large are analyzed in a worker process, so
+# building their ASTs doesn't hold this process's GIL
+_PROCESS_POOL_MIN_SIZE = 100 * 1024
+# Each worker imports this module and holds its own caches, so the pool is
+# kept small rather than one process per CPU
+_PROCESS_POOL_MAX_WORKERS = min(4, os.cpu_count() or 1)
+# Workers start from a fresh interpreter: forking the multi-threaded API
+# server can deadlock on locks held by other threads, and would copy its
+# loaded models into every worker
+_PROCESS_POOL_START_METHOD = "spawn"
+_PROCESS_POOL_LOCK = threading.Lock()
+
+# Function declarations, arrow functions (simplified), class declarations
+# and ES import statements, fused so the source is scanned once. Each
+# alternative is an outer named group, so match.lastgroup names the kind.
+_JS_ALTERNATIVES: Tuple[Tuple[str, str], ...] = (
+    ("fn", r"(?:async\s+)?function\s+(?P<fn_name>\w+)\s*\("),
+    ("arrow", r"(?:const|let|var)\s+(?P<arrow_name>\w+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>"),
+    ("cls", r"class\s+(?P<cls_name>\w+)"),
+    ("imp", r"^import\s+.*from\s+['\"](?P<imp_from>[^'\"]+)['\"]"),
+)
+
+_JS_ENGINE = regex if regex is not None else re
+_JS_PATTERN = _JS_ENGINE.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _JS_ALTERNATIVES),
+    _JS_ENGINE.MULTILINE
+)
+
+# lastgroup -> (structure type, name group)
+_JS_STRUCTURE_GROUPS: Dict[str, Tuple[str, str]] = {
+    "fn": ("function", "fn_name"),
+    "arrow": ("arrow_function", "arrow_name"),
+    "cls": ("class", "cls_name"),
+}
+
+
+def _build_js_database() -> Optional[Any]:
+    """
+    Compile the JS/TS alternatives into a Hyperscan block-mode database.
+
+    Returns:
+        Compiled database, or None when hyperscan is unavailable
+    """
+    if hyperscan is None:
+        return None
+    flags = [
+        hyperscan.HS_FLAG_SOM_LEFTMOST | (hyperscan.HS_FLAG_MULTILINE if pattern.startswith("^") else 0)
+        for _, pattern in _JS_ALTERNATIVES
+    ]
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[pattern.encode() for _, pattern in _JS_ALTERNATIVES],
+        ids=list(range(len(_JS_ALTERNATIVES))),
+        flags=flags
+    )
+    return database
+
+
+_JS_DATABASE = _build_js_database()
+# A database has one scratch space, so scans are serialized
+_JS_DATABASE_LOCK = threading.Lock()
+
+
+def _iter_js_matches(code: str) -> Iterator["re.Match[str]"]:
+    """
+    Yield the same matches as _JS_PATTERN.finditer(code).
+
+    Business Purpose: With hyperscan installed, one vectorized scan reports
+    where matches start and re only runs at those offsets to pull out the
+    names. Each alternative has a single possible end per start, so the
+    leftmost-start reports cover every match finditer would return.
+    Non-ASCII sources use re directly since hyperscan reports byte offsets.
+
+    Args:
+        code: JavaScript/TypeScript source code
+
+    Yields:
+        Non-overlapping matches in source order
+    """
+    if _JS_DATABASE is None or not code.isascii():
+        yield from _JS_PATTERN.finditer(code)
+        return
+
+    starts: List[int] = []
+
+    def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        starts.append(start)
+
+    with _JS_DATABASE_LOCK:
+        _JS_DATABASE.scan(code.encode("ascii"), match_event_handler=on_match)
+
+    last_end = 0
+    for start in sorted(set(starts)):
+        if start < last_end:
+            continue
+        match = _JS_PATTERN.match(code, start)
+        if match is not None:
+            last_end = match.end()
+            yield match
+
+
+# Branch statements, for the complexity estimate ("else if" counts once)
+_JS_BRANCH_PATTERN = re.compile(r"\b(?:if|for|while|try)\b")
+
+
+def _skip_spaces(code: str, i: int) -> int:
+    """Return the first index at or after i that isn't whitespace."""
+    n = len(code)
+    while i < n and code[i].isspace():
+        i += 1
+    return i
+
+
+def _iter_requires(code: str) -> Iterator[str]:
+    """
+    Yield the module names of CommonJS require('...') calls.
+
+    Business Purpose: Locates candidates with str.find (a vectorized search
+    in CPython) and checks the few characters around each one by hand;
+    there is no regex with optional groups to backtrack on minified input.
+    Only string-literal arguments count, and obj.require(...) or
+    names merely ending in "require" are skipped.
+
+    Args:
+        code: JavaScript/TypeScript source code
+
+    Yields:
+        Required module names in source order
+    """
+    pos = code.find("require")
+    while pos != -1:
+        next_pos = pos + 7
+        prev = code[pos - 1] if pos else " "
+        if not (prev.isalnum() or prev in "_$."):
+            i = _skip_spaces(code, next_pos)
+            if code.startswith("(", i):
+                i = _skip_spaces(code, i + 1)
+                quote = code[i:i + 1]
+                if quote in ("'", '"'):
+                    close = code.find(quote, i + 1)
+                    name = code[i + 1:close] if close != -1 else ""
+                    if name and "'" not in name and '"' not in name and (
+                        code.startswith(")", _skip_spaces(code, close + 1))
+                    ):
+                        yield name
+                        next_pos = close + 1
+        pos = code.find("require", next_pos)
+
+
+# Code pattern rules: (pattern tag, keyword groups). A tag is reported when
+# every group has at least one of its keywords somewhere in the source.
+PatternRules = Tuple[Tuple[str, Tuple[FrozenSet[str], ...]], ...]
+
+_PY_PATTERN_RULES: PatternRules = (
+    ("async_programming", (frozenset({"async def"}),)),
+    ("dataclass_pattern", (frozenset({"class "}), frozenset({"@dataclass"}))),
+    ("exception_handling", (frozenset({"try:"}), frozenset({"except"}))),
+    ("context_managers", (frozenset({"with "}),)),
+    ("functional_programming", (frozenset({"lambda"}),)),
+)
+
+_JS_PATTERN_RULES: PatternRules = (
+    ("async_programming", (frozenset({"async"}),)),
+    ("promise_based", (frozenset({"Promise"}),)),
+    ("exception_handling", (frozenset({"try"}), frozenset({"catch"}))),
+    ("functional_programming", (frozenset({"map(", "filter(", "reduce("}),)),
+    ("oop_pattern", (frozenset({"class "}),)),
+)
+
+
+def _keyword_pattern(rules: PatternRules) -> "re.Pattern[str]":
+    """Compile one alternation matching every keyword used by rules."""
+    keywords = {keyword for _, groups in rules for group in groups for keyword in group}
+    # Longest first so "@dataclass" is not cut short by a shorter keyword
+    ordered = sorted(keywords, key=lambda keyword: (-len(keyword), keyword))
+    return re.compile("|".join(map(re.escape, ordered)))
+
+
+_PY_KEYWORD_PATTERN = _keyword_pattern(_PY_PATTERN_RULES)
+_JS_KEYWORD_PATTERN = _keyword_pattern(_JS_PATTERN_RULES)
+
+
+def _detect_patterns(code: str, keyword_pattern: "re.Pattern[str]", rules: PatternRules) -> List[str]:
+    """
+    Detect code patterns with a single scan over the source.
+
+    Args:
+        code: Source code
+        keyword_pattern: Compiled alternation from _keyword_pattern(rules)
+        rules: Pattern rules for the language
+
+    Returns:
+        Pattern tags in rule order
+    """
+    found = set(keyword_pattern.findall(code))
+    return [
+        tag for tag, groups in rules
+        if all(not group.isdisjoint(found) for group in groups)
+    ]
+
+
+_FUNCTION_TYPES = frozenset({"function", "async_function", "arrow_function"})
+_CLASS_TYPES = frozenset({"class"})
+
+
+class _AnalysisScope(NamedTuple):
+    """Which parts of an analysis an analysis_type needs."""
+    structure_types: FrozenSet[str]
+    imports: bool
+    patterns: bool
+
+
+# Structures are always counted for the complexity estimate, but dicts are
+# only built for the types an analysis_type returns
+_ANALYSIS_SCOPES: Dict[str, _AnalysisScope] = {
+    "structure": _AnalysisScope(_FUNCTION_TYPES | _CLASS_TYPES, True, True),
+    "functions": _AnalysisScope(_FUNCTION_TYPES, False, False),
+    "classes": _AnalysisScope(_CLASS_TYPES, False, False),
+    "imports": _AnalysisScope(frozenset(), True, False),
+    "patterns": _AnalysisScope(_FUNCTION_TYPES | _CLASS_TYPES, False, True),
+}
+_FULL_SCOPE = _ANALYSIS_SCOPES["structure"]
+
+
+def _estimate_complexity(functions: int, classes: int, branches: int, max_depth: int = 0) -> str:
+    """
+    Rough complexity from counters gathered while extracting.
+
+    Args:
+        functions: Function definitions, including methods and nested ones
+        classes: Class definitions
+        branches: if/elif/for/while/try statements
+        max_depth: Deepest nesting of compound statements (0 if not tracked)
+
+    Returns:
+        "low", "medium" or "high"
+    """
+    definitions = functions + classes
+    if definitions > 10 or branches > 30 or max_depth > 5:
+        return "high"
+    if definitions < 5 and branches < 10 and max_depth < 4:
+        return "low"
+    return "medium"
+
+
+def _copy_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached analysis so callers can't modify the cached lists."""
+    return {
+        "structures": [dict(structure) for structure in analysis["structures"]],
+        "imports": list(analysis["imports"]),
+        "patterns": list(analysis["patterns"]),
+        "complexity": analysis["complexity"]
+    }
+
+
+def _parse_python(code: str) -> ast.Module:
+    """
+    Parse Python source to an AST.
+
+    Calls compile() directly rather than going through ast.parse(), without
+    type comments or inherited __future__ flags. optimize is left at its
+    default since optimized ASTs (3.13+) drop docstrings, which feed the
+    "description" field.
+    """
+    return compile(code, "<code_analysis>", "exec", ast.PyCF_ONLY_AST, dont_inherit=True)
+
+
+def _fast_docstring(node: ast.AST) -> str:
+    """
+    Return a definition's docstring as written, or "".
+
+    Unlike ast.get_docstring() this skips inspect.cleandoc(); indentation
+    is left in place, which is fine for the "description" field.
+    """
+    body = node.body
+    if body and type(body[0]) is ast.Expr:
+        value = body[0].value
+        if type(value) is ast.Constant and type(value.value) is str:
+            return value.value
+    return ""
+
+
+_BRANCH_TYPES = frozenset({ast.If, ast.For, ast.AsyncFor, ast.While, ast.Try, ast.TryStar})
+_COMPOUND_TYPES = _BRANCH_TYPES | {
+    ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.With, ast.AsyncWith, ast.Match
+}
+
+
+def _nested_blocks(node: ast.stmt, level: int) -> Iterator[Tuple[List[ast.stmt], int]]:
+    """
+    Yield the statement blocks of a compound statement with their nesting level.
+
+    An elif is an If in the orelse of its parent; it stays at the parent's
+    level, like the "elif" line does in the source. Case bodies are two
+    levels down (match, then case).
+    """
+    node_type = type(node)
+    if node_type is ast.If:
+        yield node.body, level + 1
+        orelse = node.orelse
+        if len(orelse) == 1 and type(orelse[0]) is ast.If and orelse[0].col_offset == node.col_offset:
+            yield orelse, level
+        else:
+            yield orelse, level + 1
+    elif node_type is ast.Match:
+        for case in node.cases:
+            yield case.body, level + 2
+    else:
+        yield node.body, level + 1
+        if node_type is ast.Try or node_type is ast.TryStar:
+            for handler in node.handlers:
+                yield handler.body, level + 1
+            yield node.finalbody, level + 1
+        if node_type in _BRANCH_TYPES:
+            yield node.orelse, level + 1
+
+
+class _Extractor(ast.NodeVisitor):
+    """
+    Collect module-level definitions and imports from a Python AST.
+
+    Business Purpose: Visit statements only, never descending into function
+    or class bodies or into expressions, so the cost of extraction scales
+    with the number of top-level statements instead of every node in the tree.
+    Imports and definitions inside module-level if/try/with blocks are still
+    found (e.g. optional-dependency imports).
+
+    Definition bodies are only walked statement by statement to update the
+    complexity counters; no dicts are built for them.
+    """
+
+    def __init__(self, line_offset: int = 0, scope: _AnalysisScope = _FULL_SCOPE):
+        self.line_offset = line_offset
+        self.structure_types = scope.structure_types
+        self.want_imports = scope.imports
+        self.structures: List[Dict[str, Any]] = []
+        self.imports: List[str] = []
+        # Complexity counters
+        self.functions = 0
+        self.classes = 0
+        self.branches = 0
+        self.max_depth = 0
+        self._level = 0
+
+    def _tally(self, node: ast.stmt, level: int) -> None:
+        node_type = type(node)
+        if node_type not in _COMPOUND_TYPES:
+            return
+        if level >= self.max_depth:
+            self.max_depth = level + 1
+        if node_type in _BRANCH_TYPES:
+            self.branches += 1
+        elif node_type is ast.ClassDef:
+            self.classes += 1
+        elif node_type is ast.FunctionDef or node_type is ast.AsyncFunctionDef:
+            self.functions += 1
+
+    def _count_nested(self, node: ast.stmt, level: int) -> None:
+        # Counters only, for bodies whose statements aren't extracted
+        for body, body_level in _nested_blocks(node, level):
+            for stmt in body:
+                if type(stmt) in _COMPOUND_TYPES:
+                    self._tally(stmt, body_level)
+                    self._count_nested(stmt, body_level)
+
+    def _add_structure(self, node: ast.AST, structure_type: str) -> None:
+        self._tally(node, self._level)
+        self._count_nested(node, self._level)
+        if structure_type not in self.structure_types:
+            return
+        self.structures.append({
+            "name": node.name,
+            "type": structure_type,
+            "line": node.lineno + self.line_offset,
+            "description": _fast_docstring(node)
+        })
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self._add_structure(node, "function")
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        self._add_structure(node, "async_function")
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._add_structure(node, "class")
+
+    def visit_Import(self, node: ast.Import) -> None:
+        if not self.want_imports:
+            return
+        for alias in node.names:
+            self.imports.append(f"import {alias.name}")
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if not self.want_imports:
+            return
+        module = node.module or ""
+        for alias in node.names:
+            self.imports.append(f"from {module} import {alias.name}")
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Only follow nested statement blocks (if/try/with bodies, handlers)
+        if type(node) not in _COMPOUND_TYPES:
+            return
+        level = self._level
+        self._tally(node, level)
+        if type(node) is ast.Match:
+            # Case bodies are not visited
+            self._count_nested(node, level)
+            return
+        for body, body_level in _nested_blocks(node, level):
+            self._level = body_level
+            for stmt in body:
+                self.visit(stmt)
+        self._level = level
+
+
+class _StreamFallback(Exception):
+    """The token stream can't be handled without a full parse."""
+
+
+# Keywords opening a compound statement whose body is still module level
+_BLOCK_KEYWORDS = frozenset({"if", "elif", "else", "try", "except", "finally", "for", "while", "with"})
+
+# Statement keywords counted as branches / as nesting for the complexity estimate
+_BRANCH_KEYWORDS = frozenset({"if", "elif", "for", "while", "try"})
+_NESTING_KEYWORDS = _BRANCH_KEYWORDS | {"def", "class", "with"}
+
+
+class _TokenExtractor:
+    """
+    Collect the same definitions and imports as _Extractor from tokens.
+
+    Business Purpose: Very large (often generated) modules can need tens of
+    MB for a full AST. This walks tokenize output one logical line at a
+    time, tracking which indented blocks are def/class/match bodies, so peak
+    memory stays at one line. It is slower than the C parser, so it is only
+    used above _STREAM_PARSE_MIN_SIZE. Anything unexpected raises
+    _StreamFallback and the caller parses normally.
+    """
+
+    def __init__(self, scope: _AnalysisScope = _FULL_SCOPE):
+        self.structure_types = scope.structure_types
+        self.want_imports = scope.imports
+        self.structures: List[Dict[str, Any]] = []
+        self.imports: List[str] = []
+        # Complexity counters, as in _Extractor
+        self.functions = 0
+        self.classes = 0
+        self.branches = 0
+        self.max_depth = 0
+        # One entry per open indented block: True for def/class/match bodies
+        self._blocks: List[bool] = []
+        self._opaque_depth = 0
+        # Kind of block the previous logical line opens, None if it opens none
+        self._opens: Optional[bool] = None
+        # Structure waiting for the first line of its body (docstring)
+        self._pending_doc: Optional[Dict[str, Any]] = None
+
+    def run(self, code: str) -> None:
+        line: List[tokenize.TokenInfo] = []
+        for tok in tokenize.generate_tokens(io.StringIO(code).readline):
+            tok_type = tok.type
+            if tok_type == tokenize.NEWLINE:
+                self._logical_line(line)
+                line = []
+            elif tok_type == tokenize.INDENT:
+                if self._opens is None:
+                    raise _StreamFallback("unexpected indent")
+                self._blocks.append(self._opens)
+                self._opaque_depth += self._opens
+                self._opens = None
+            elif tok_type == tokenize.DEDENT:
+                self._opaque_depth -= self._blocks.pop()
+            elif tok_type not in _SKIPPED_TOKENS:
+                line.append(tok)
+        if line or self._pending_doc is not None:
+            raise _StreamFallback("unterminated statement")
+
+    def _logical_line(self, toks: List[tokenize.TokenInfo]) -> None:
+        if self._pending_doc is not None:
+            self._pending_doc["description"] = _token_docstring(toks, 0)
+            self._pending_doc = None
+
+        ends_block = toks[-1].string == ":"
+        self._tally(toks, ends_block)
+        if self._opaque_depth:
+            self._opens = True if ends_block else None
+            return
+        self._opens = None
+        self._statements(toks, 0, ends_block)
+
+    def _tally(self, toks: List[tokenize.TokenInfo], ends_block: bool) -> None:
+        if toks[0].type != tokenize.NAME:
+            return
+        keyword = toks[0].string
+        if keyword == "async" and len(toks) > 1:
+            keyword = toks[1].string
+        if keyword in _NESTING_KEYWORDS or (keyword == "match" and ends_block):
+            self.max_depth = max(self.max_depth, len(self._blocks) + 1)
+            if keyword in _BRANCH_KEYWORDS:
+                self.branches += 1
+            elif keyword == "def":
+                self.functions += 1
+            elif keyword == "class":
+                self.classes += 1
+
+    def _statements(self, toks: List[tokenize.TokenInfo], i: int, ends_block: bool) -> None:
+        first = toks[i].string
+        if toks[i].type == tokenize.NAME:
+            if first in ("def", "class") or (
+                first == "async" and i + 1 < len(toks) and toks[i + 1].string == "def"
+            ):
+                self._definition(toks, i, ends_block)
+                return
+            if first in _BLOCK_KEYWORDS:
+                colon = _header_colon(toks, i)
+                if colon == len(toks) - 1:
+                    self._opens = False
+                else:
+                    self._statements(toks, colon + 1, ends_block)
+                return
+            if first == "match" and ends_block:
+                # match statement (soft keyword); case bodies are not visited
+                self._opens = True
+                return
+
+        # Simple statements separated by ";"
+        start = i
+        depth = 0
+        for j in range(i, len(toks) + 1):
+            if j < len(toks):
+                string = toks[j].string
+                if string in "([{" and toks[j].type == tokenize.OP:
+                    depth += 1
+                    continue
+                if string in ")]}" and toks[j].type == tokenize.OP:
+                    depth -= 1
+                    continue
+                if not (depth == 0 and string == ";"):
+                    continue
+            if start < j and self.want_imports and toks[start].type == tokenize.NAME:
+                if toks[start].string == "import":
+                    self._import(toks[start + 1:j])
+                elif toks[start].string == "from":
+                    self._import_from(toks[start + 1:j])
+            start = j + 1
+
+    def _definition(self, toks: List[tokenize.TokenInfo], i: int, ends_block: bool) -> None:
+        keyword = toks[i].string
+        if keyword == "async":
+            structure_type, name_index = "async_function", i + 2
+        else:
+            structure_type, name_index = ("class" if keyword == "class" else "function"), i + 1
+
+        colon = _header_colon(toks, i)
+        if colon == len(toks) - 1:
+            self._opens = True
+        if structure_type not in self.structure_types:
+            return
+
+        structure = {
+            "name": toks[name_index].string,
+            "type": structure_type,
+            "line": toks[i].start[0],
+            "description": ""
+        }
+        self.structures.append(structure)
+        if colon == len(toks) - 1:
+            self._pending_doc = structure
+        else:
+            structure["description"] = _token_docstring(toks, colon + 1)
+
+    def _import(self, toks: List[tokenize.TokenInfo]) -> None:
+        for names in _split_commas(toks):
+            self.imports.append(f"import {_dotted_name(names)}")
+
+    def _import_from(self, toks: List[tokenize.TokenInfo]) -> None:
+        i = 0
+        while toks[i].string in (".", "..."):
+            i += 1
+        keyword = i
+        while toks[keyword].string != "import":
+            keyword += 1
+        module = "".join(tok.string for tok in toks[i:keyword])
+        names = [tok for tok in toks[keyword + 1:] if tok.string not in ("(", ")")]
+        for alias in _split_commas(names):
+            self.imports.append(f"from {module} import {_dotted_name(alias)}")
+
+
+_SKIPPED_TOKENS = frozenset({tokenize.COMMENT, tokenize.NL, tokenize.ENDMARKER})
+
+
+def _header_colon(toks: List[tokenize.TokenInfo], i: int) -> int:
+    """Index of the ":" ending a compound statement header that starts at i."""
+    depth = 0
+    for j in range(i, len(toks)):
+        tok = toks[j]
+        if tok.type == tokenize.OP:
+            if tok.string in "([{":
+                depth += 1
+            elif tok.string in ")]}":
+                depth -= 1
+            elif tok.string == ":" and depth == 0:
+                return j
+        elif tok.string == "lambda" and depth == 0:
+            raise _StreamFallback("lambda in header")
+    raise _StreamFallback("compound statement without ':'")
+
+
+def _split_commas(toks: List[tokenize.TokenInfo]) -> Iterator[List[tokenize.TokenInfo]]:
+    """Split import names on commas, skipping a trailing comma."""
+    part: List[tokenize.TokenInfo] = []
+    for tok in toks:
+        if tok.string == ",":
+            if part:
+                yield part
+            part = []
+        else:
+            part.append(tok)
+    if part:
+        yield part
+
+
+def _dotted_name(toks: List[tokenize.TokenInfo]) -> str:
+    """Join an imported name up to its "as" alias."""
+    parts = []
+    for tok in toks:
+        if tok.string == "as":
+            break
+        parts.append(tok.string)
+    return "".join(parts)
+
+
+def _token_docstring(toks: List[tokenize.TokenInfo], i: int) -> str:
+    """
+    Return the docstring if the statement at toks[i] is a string literal.
+
+    Mirrors _fast_docstring(): implicitly concatenated plain strings count,
+    also when parenthesized; f-strings and bytes don't.
+    """
+    parens = 0
+    while i < len(toks) and toks[i].string == "(":
+        parens += 1
+        i += 1
+    j = i
+    while j < len(toks) and toks[j].type == tokenize.STRING:
+        j += 1
+    end = j + parens
+    if j == i or any(tok.string != ")" for tok in toks[j:end]) or (
+        end < len(toks) and toks[end].string != ";"
+    ):
+        return ""
+    try:
+        values = [ast.literal_eval(tok.string) for tok in toks[i:j]]
+    except (ValueError, SyntaxError):
+        # f-string
+        return ""
+    if not all(type(value) is str for value in values):
+        return ""
+    return "".join(values)
+
+
+def _stream_extract(code: str, scope: _AnalysisScope) -> Optional[_TokenExtractor]:
+    """
+    Run _TokenExtractor over code.
+
+    Returns:
+        The finished extractor, or None if the code needs a full parse
+    """
+    extractor = _TokenExtractor(scope)
+    try:
+        extractor.run(code)
+    except (_StreamFallback, tokenize.TokenError, SyntaxError, IndexError):
+        return None
+    return extractor
+
+
+class _TopLevelStatement(NamedTuple):
+    """Definitions, imports and complexity counters of one module-level statement."""
+    start: int  # First line, including decorators
+    end: int
+    structures: List[Dict[str, Any]]
+    imports: List[str]
+    functions: int
+    classes: int
+    branches: int
+    depth: int
+
+
+def _extract_statements(body: List[ast.stmt], line_offset: int = 0) -> List[_TopLevelStatement]:
+    """
+    Extract definitions and imports statement by statement.
+
+    Args:
+        body: Module-level statements
+        line_offset: Added to every line number (for a parsed slice of a file)
+
+    Returns:
+        One _TopLevelStatement per statement, in source order
+    """
+    extractor = _Extractor(line_offset)
+    statements: List[_TopLevelStatement] = []
+    for stmt in body:
+        n_structures = len(extractor.structures)
+        n_imports = len(extractor.imports)
+        counts = (extractor.functions, extractor.classes, extractor.branches)
+        extractor.max_depth = 0
+        extractor.visit(stmt)
+
+        start = stmt.lineno
+        for decorator in getattr(stmt, "decorator_list", ()):
+            start = min(start, decorator.lineno)
+        statements.append(_TopLevelStatement(
+            start + line_offset,
+            stmt.end_lineno + line_offset,
+            extractor.structures[n_structures:],
+            extractor.imports[n_imports:],
+            extractor.functions - counts[0],
+            extractor.classes - counts[1],
+            extractor.branches - counts[2],
+            extractor.max_depth
+        ))
+    return statements
+
+
+def _shift_statement(statement: _TopLevelStatement, delta: int) -> _TopLevelStatement:
+    """Move an unchanged statement by delta lines."""
+    if not delta:
+        return statement
+    return statement._replace(
+        start=statement.start + delta,
+        end=statement.end + delta,
+        structures=[{**structure, "line": structure["line"] + delta} for structure in statement.structures]
+    )
+
+
+def _reparse_statements(
+    old_code: str,
+    old_statements: List[_TopLevelStatement],
+    code: str
+) -> List[_TopLevelStatement]:
+    """
+    Re-extract only the module-level statements touched by an edit.
+
+    Business Purpose: When an agent analyzes successive versions of the same
+    code (streamed LLM output, review iterations), most of the file is
+    unchanged. The edit is located by comparing lines, the statements around
+    it are re-parsed on their own, and the rest are reused with their line
+    numbers shifted.
+
+    Args:
+        old_code: Previously analyzed version
+        old_statements: _extract_statements() result for old_code
+        code: New version
+
+    Returns:
+        Statements for the new version
+
+    Raises:
+        SyntaxError: If the edited span doesn't parse on its own; callers
+            fall back to parsing the whole file
+    """
+    old_lines = old_code.split("\n")
+    new_lines = code.split("\n")
+
+    limit = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    delta = len(new_lines) - len(old_lines)
+
+    # Changed lines of the old version (empty range for a pure insertion)
+    lo = prefix + 1
+    hi = len(old_lines) - suffix
+
+    # Statements next to the edit are re-parsed too: an inserted indented
+    # line can extend the statement above, an inserted decorator the one below
+    before = [st for st in old_statements if st.end < lo - 1]
+    after = [st for st in old_statements if st.start > hi + 1]
+    affected = old_statements[len(before):len(old_statements) - len(after)]
+
+    span_start = min(lo, affected[0].start) if affected else lo
+    span_end = max(hi, affected[-1].end) if affected else hi
+
+    tree = _parse_python("\n".join(new_lines[span_start - 1:span_end + delta]))
+    return before + _extract_statements(tree.body, span_start - 1) + [
+        _shift_statement(st, delta) for st in after
+    ]
+
+
+# Schemas are constant; the properties return these shared read-only views
+_INPUT_SCHEMA: Mapping[str, Any] = MappingProxyType({
+    "code": {
+        "type": "string",
+        "required": True,
+        "description": "Source code to analyze"
+    },
+    "language": {
+        "type": "string",
+        "required": False,
+        "default": "python",
+        "enum": ["python", "javascript", "typescript", "java", "go", "rust"],
+        "description": "Programming language of the code"
+    },
+    "analysis_type": {
+        "type": "string",
+        "required": False,
+        "default": "structure",
+        "enum": ["structure", "imports", "functions", "classes", "patterns"],
+        "description": "Type of analysis to perform"
+    },
+    "code_id": {
+        "type": "string",
+        "required": False,
+        "description": "Stable ID for code analyzed repeatedly as it is edited"
+    }
+})
+
+_OUTPUT_SCHEMA: Mapping[str, Any] = MappingProxyType({
+    "analysis_type": {
+        "type": "string",
+        "description": "Type of analysis performed"
+    },
+    "language": {
+        "type": "string",
+        "description": "Language of analyzed code"
+    },
+    "structures": {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "type": {"type": "string"},
+                "line": {"type": "integer"},
+                "description": {"type": "string"}
+            }
+        },
+        "description": "Found structures (functions, classes, etc.)"
+    },
+    "imports": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Found import statements"
+    },
+    "patterns": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "Detected code patterns"
+    },
+    "complexity_estimate": {
+        "type": "string",
+        "enum": ["low", "medium", "high"],
+        "description": "Rough complexity estimate"
+    }
+})
+
 
 class CodeAnalysisSkill(Skill):
     """
@@ -39,6 +940,11 @@ class CodeAnalysisSkill(Skill):
             "default": "structure",
             "enum": ["structure", "imports", "functions", "classes", "patterns"],
             "description": "Type of analysis to perform"
+        },
+        "code_id": {
+            "type": "string",
+            "required": False,
+            "description": "Stable ID for code analyzed repeatedly as it is edited"
         }
     }
 
@@ -92,151 +998,89 @@ class CodeAnalysisSkill(Skill):
         print(result["structures"])  # [{"name": "authenticate", "type": "function", ...}]
     """
 
+    __slots__ = ("_python_sessions", "_sessions_lock")
+
+    # Shared by all instances, created on first use by execute_batch
+    _process_pool: Optional[ProcessPoolExecutor] = None
+
     def __init__(self):
         """Initialize CodeAnalysisSkill."""
         super().__init__(
             name="code_analysis",
             description="Analyze code structure, dependencies, and patterns"
         )
+        # code_id -> (code, statements) of the last Python version analyzed
+        self._python_sessions: "OrderedDict[str, Tuple[str, List[_TopLevelStatement]]]" = OrderedDict()
+        # Batch items run in threads; parsing happens outside the lock
+        self._sessions_lock = threading.Lock()
 
     @property
-    def input_schema(self) -> Dict[str, Any]:
+    def input_schema(self) -> Mapping[str, Any]:
         """Define input schema for code analysis skill."""
-        return {
-            "code": {
-                "type": "string",
-                "required": True,
-                "description": "Source code to analyze"
-            },
-            "language": {
-                "type": "string",
-                "required": False,
-                "default": "python",
-                "enum": ["python", "javascript", "typescript", "java", "go", "rust"],
-                "description": "Programming language of the code"
-            },
-            "analysis_type": {
-                "type": "string",
-                "required": False,
-                "default": "structure",
-                "enum": ["structure", "imports", "functions", "classes", "patterns"],
-                "description": "Type of analysis to perform"
-            }
-        }
+        return _INPUT_SCHEMA
 
     @property
-    def output_schema(self) -> Dict[str, Any]:
+    def output_schema(self) -> Mapping[str, Any]:
         """Define output schema for code analysis skill."""
-        return {
-            "analysis_type": {
-                "type": "string",
-                "description": "Type of analysis performed"
-            },
-            "language": {
-                "type": "string",
-                "description": "Language of analyzed code"
-            },
-            "structures": {
-                "type": "array",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string"},
-                        "type": {"type": "string"},
-                        "line": {"type": "integer"},
-                        "description": {"type": "string"}
-                    }
-                },
-                "description": "Found structures (functions, classes, etc.)"
-            },
-            "imports": {
-                "type": "array",
-                "items": {"type": "string"},
-                "description": "Found import statements"
-            },
-            "patterns": {
-                "type": "array",
-                "items": {"type": "string"},
-                "description": "Detected code patterns"
-            },
-            "complexity_estimate": {
-                "type": "string",
-                "enum": ["low", "medium", "high"],
-                "description": "Rough complexity estimate"
-            }
-        }
+        return _OUTPUT_SCHEMA
 
     @property
     def required_config(self) -> List[str]:
         """Code analysis requires no external configuration."""
         return []
 
-    def _analyze_python(self, code: str) -> Dict[str, Any]:
+    def _analyze_python(
+        self,
+        code: str,
+        code_id: Optional[str] = None,
+        scope: _AnalysisScope = _FULL_SCOPE
+    ) -> Dict[str, Any]:
         """
         Analyze Python code structure using AST.
 
         Args:
             code: Python source code
+            code_id: Stable identifier for code that is analyzed repeatedly as
+                it changes; only the edited statements are re-parsed
+            scope: Parts of the analysis to produce
 
         Returns:
             Dictionary with analysis results
         """
-        structures: List[Dict[str, Any]] = []
-        imports: List[str] = []
-        patterns: List[str] = []
-
         try:
-            tree = ast.parse(code)
-
             # Extract top-level definitions
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    structures.append({
-                        "name": node.name,
-                        "type": "function",
-                        "line": node.lineno,
-                        "description": ast.get_docstring(node) or ""
-                    })
-                elif isinstance(node, ast.AsyncFunctionDef):
-                    structures.append({
-                        "name": node.name,
-                        "type": "async_function",
-                        "line": node.lineno,
-                        "description": ast.get_docstring(node) or ""
-                    })
-                elif isinstance(node, ast.ClassDef):
-                    structures.append({
-                        "name": node.name,
-                        "type": "class",
-                        "line": node.lineno,
-                        "description": ast.get_docstring(node) or ""
-                    })
-                elif isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.append(f"import {alias.name}")
-                elif isinstance(node, ast.ImportFrom):
-                    module = node.module or ""
-                    for alias in node.names:
-                        imports.append(f"from {module} import {alias.name}")
+            if code_id is None:
+                extractor = None
+                if len(code) >= _STREAM_PARSE_MIN_SIZE:
+                    extractor = _stream_extract(code, scope)
+                if extractor is None:
+                    extractor = _Extractor(scope=scope)
+                    for stmt in _parse_python(code).body:
+                        extractor.visit(stmt)
+                structures = extractor.structures
+                imports = extractor.imports
+                complexity = _estimate_complexity(
+                    extractor.functions, extractor.classes, extractor.branches, extractor.max_depth
+                )
+            else:
+                # Sessions keep everything so any analysis_type can reuse them
+                statements = self._session_statements(code, code_id)
+                structures = [
+                    structure for st in statements for structure in st.structures
+                    if structure["type"] in scope.structure_types
+                ]
+                imports = [imp for st in statements for imp in st.imports] if scope.imports else []
+                complexity = _estimate_complexity(
+                    sum(st.functions for st in statements),
+                    sum(st.classes for st in statements),
+                    sum(st.branches for st in statements),
+                    max((st.depth for st in statements), default=0)
+                )
 
             # Detect patterns
-            if "async def" in code:
-                patterns.append("async_programming")
-            if "class " in code and "@dataclass" in code:
-                patterns.append("dataclass_pattern")
-            if "try:" in code and "except" in code:
-                patterns.append("exception_handling")
-            if "with " in code:
-                patterns.append("context_managers")
-            if "lambda" in code:
-                patterns.append("functional_programming")
-
-            # Estimate complexity
-            complexity = "low"
-            if len(structures) > 10:
-                complexity = "high"
-            elif len(structures) > 5:
-                complexity = "medium"
+            patterns: List[str] = []
+            if scope.patterns:
+                patterns = _detect_patterns(code, _PY_KEYWORD_PATTERN, _PY_PATTERN_RULES)
 
             return {
                 "structures": structures,
@@ -248,94 +1092,166 @@ class CodeAnalysisSkill(Skill):
         except SyntaxError as e:
             raise SkillExecutionError(f"Python syntax error: {str(e)}")
 
-    def _analyze_javascript_typescript(self, code: str) -> Dict[str, Any]:
+    def _session_statements(self, code: str, code_id: str) -> List[_TopLevelStatement]:
+        """
+        Extract statements for code, re-parsing only what changed since the
+        last version analyzed under code_id.
+
+        Args:
+            code: Python source code
+            code_id: Stable identifier for the evolving code
+
+        Returns:
+            Statements for code
+
+        Raises:
+            SyntaxError: If code does not parse
+        """
+        statements = None
+        with self._sessions_lock:
+            session = self._python_sessions.get(code_id)
+        if session is not None:
+            try:
+                statements = _reparse_statements(session[0], session[1], code)
+            except SyntaxError:
+                # The edited span doesn't parse on its own; parse everything
+                statements = None
+        if statements is None:
+            statements = _extract_statements(_parse_python(code).body)
+
+        with self._sessions_lock:
+            self._python_sessions[code_id] = (code, statements)
+            self._python_sessions.move_to_end(code_id)
+            if len(self._python_sessions) > _SESSION_LIMIT:
+                self._python_sessions.popitem(last=False)
+        return statements
+
+    def _analyze_javascript_typescript(
+        self,
+        code: str,
+        scope: _AnalysisScope = _FULL_SCOPE
+    ) -> Dict[str, Any]:
         """
         Analyze JavaScript/TypeScript code using regex patterns.
 
         Args:
             code: JavaScript/TypeScript source code
+            scope: Parts of the analysis to produce
 
         Returns:
             Dictionary with analysis results
         """
         structures: List[Dict[str, Any]] = []
         imports: List[str] = []
-        patterns: List[str] = []
+        functions = 0
+        classes = 0
+        # Matches arrive in source order, so line numbers are tracked by
+        # counting newlines since the previous structure (no slicing)
+        line = 1
+        line_pos = 0
 
-        # Function declarations
-        func_pattern = r"(?:async\s+)?function\s+(\w+)\s*\("
-        for match in re.finditer(func_pattern, code):
-            line_num = code[:match.start()].count('\n') + 1
-            structures.append({
-                "name": match.group(1),
-                "type": "function",
-                "line": line_num,
-                "description": ""
-            })
-
-        # Arrow functions (simplified)
-        arrow_pattern = r"(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\([^)]*\)\s*=>"
-        for match in re.finditer(arrow_pattern, code):
-            line_num = code[:match.start()].count('\n') + 1
-            structures.append({
-                "name": match.group(1),
-                "type": "arrow_function",
-                "line": line_num,
-                "description": ""
-            })
-
-        # Class declarations
-        class_pattern = r"class\s+(\w+)"
-        for match in re.finditer(class_pattern, code):
-            line_num = code[:match.start()].count('\n') + 1
-            structures.append({
-                "name": match.group(1),
-                "type": "class",
-                "line": line_num,
-                "description": ""
-            })
-
-        # Import statements
-        import_pattern = r"^import\s+.*from\s+['\"]([^'\"]+)['\"]"
-        for match in re.finditer(import_pattern, code, re.MULTILINE):
-            imports.append(f"import from {match.group(1)}")
-
-        require_pattern = r"(?:const|let|var)\s+\{?(\w+)\}?\s*=\s*require\s*\(\s*['\"]([^'\"]+)['\"]\s*\)"
-        for match in re.finditer(require_pattern, code):
-            imports.append(f"require {match.group(2)}")
+        # Single pass over the source for functions, arrow functions,
+        # classes and ES imports; structures come out in source order
+        for match in _iter_js_matches(code):
+            kind = match.lastgroup
+            if kind == "imp":
+                if scope.imports:
+                    imports.append(f"import from {match.group('imp_from')}")
+                continue
+            structure_type, name_group = _JS_STRUCTURE_GROUPS[kind]
+            if kind == "cls":
+                classes += 1
+            else:
+                functions += 1
+            if structure_type in scope.structure_types:
+                start = match.start()
+                line += code.count("\n", line_pos, start)
+                line_pos = start
+                structures.append({
+                    "name": match.group(name_group),
+                    "type": structure_type,
+                    "line": line,
+                    "description": ""
+                })
+
+        if scope.imports:
+            for module in _iter_requires(code):
+                imports.append(f"require {module}")
 
         # Detect patterns
-        if "async" in code:
-            patterns.append("async_programming")
-        if "Promise" in code:
-            patterns.append("promise_based")
-        if "try" in code and "catch" in code:
-            patterns.append("exception_handling")
-        if "map(" in code or "filter(" in code or "reduce(" in code:
-            patterns.append("functional_programming")
-        if "class " in code:
-            patterns.append("oop_pattern")
-
-        # Estimate complexity
-        complexity = "low"
-        if len(structures) > 10:
-            complexity = "high"
-        elif len(structures) > 5:
-            complexity = "medium"
+        patterns: List[str] = []
+        if scope.patterns:
+            patterns = _detect_patterns(code, _JS_KEYWORD_PATTERN, _JS_PATTERN_RULES)
 
         return {
             "structures": structures,
             "imports": imports,
             "patterns": patterns,
-            "complexity": complexity
+            # Nesting isn't tracked by the regex scan
+            "complexity": _estimate_complexity(
+                functions, classes, len(_JS_BRANCH_PATTERN.findall(code))
+            )
         }
 
-    async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze(
+        self,
+        code: str,
+        language: str,
+        analysis_type: str,
+        code_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        Execute code analysis.
+        Run the analyzer for a language, reusing earlier results for the same code.
 
-        Business Purpose: Extract code structure and patterns to help agents
-        understand code organization without manual parsing.
+        Args:
+            code: Source code
+            language: Lowercased language name
+            analysis_type: Type of analysis; only the parts it needs are computed
+            code_id: Optional identifier for incremental Python re-analysis
+
+        Returns:
+            Dictionary with analysis results (a private copy)
+
+        Raises:
+            SkillExecutionError: If the code cannot be parsed
+        """
+        if analysis_type not in _ANALYSIS_SCOPES:
+            analysis_type = "structure"
+        scope = _ANALYSIS_SCOPES[analysis_type]
+
+        if language == "python":
+            analyzer_name = "python"
+            analyzer = functools.partial(self._analyze_python, code_id=code_id, scope=scope)
+        else:
+            # JavaScript/TypeScript, and regex-based extraction for
+            # unsupported languages
+            analyzer_name = "regex"
+            analyzer = functools.partial(self._analyze_javascript_typescript, scope=scope)
+
+        cache_key = (
+            analyzer_name,
+            analysis_type,
+            hashlib.blake2b(code.encode(), digest_size=16).digest()
+        )
+        with _ANALYSIS_CACHE_LOCK:
+            cached = _ANALYSIS_CACHE.get(cache_key)
+            if cached is not None:
+                _ANALYSIS_CACHE.move_to_end(cache_key)
+        if cached is not None:
+            return _copy_analysis(cached)
+
+        analysis = analyzer(code)
+
+        with _ANALYSIS_CACHE_LOCK:
+            _ANALYSIS_CACHE[cache_key] = analysis
+            if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+                _ANALYSIS_CACHE.popitem(last=False)
+
+        return _copy_analysis(analysis)
+
+    def _execute_one(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze one input (shared by execute and execute_batch).
 
         Args:
             input_data: Input matching input_schema
@@ -355,15 +1271,9 @@ class CodeAnalysisSkill(Skill):
             analysis_type = input_data.get("analysis_type", "structure")
 
             # Perform language-specific analysis
-            if language == "python":
-                analysis = self._analyze_python(code)
-            elif language in ["javascript", "typescript"]:
-                analysis = self._analyze_javascript_typescript(code)
-            else:
-                # For unsupported languages, use regex-based extraction
-                analysis = self._analyze_javascript_typescript(code)
+            analysis = self._analyze(code, language, analysis_type, input_data.get("code_id"))
 
-            # Filter results based on analysis type
+            # The analyzers only fill in what analysis_type needs
             result: Dict[str, Any] = {
                 "analysis_type": analysis_type,
                 "language": language,
@@ -373,14 +1283,108 @@ class CodeAnalysisSkill(Skill):
                 "complexity_estimate": analysis.get("complexity", "low")
             }
 
-            if analysis_type == "functions":
-                result["structures"] = [s for s in analysis["structures"] if "function" in s["type"]]
-            elif analysis_type == "classes":
-                result["structures"] = [s for s in analysis["structures"] if s["type"] == "class"]
-
             return result
 
         except Exception as e:
             if isinstance(e, SkillExecutionError):
                 raise
             raise SkillExecutionError(f"Code analysis failed: {str(e)}")
+
+    async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute code analysis.
+
+        Business Purpose: Extract code structure and patterns to help agents
+        understand code organization without manual parsing.
+
+        Args:
+            input_data: Input matching input_schema
+
+        Returns:
+            Dictionary with code analysis results
+
+        Raises:
+            SkillExecutionError: If analysis fails
+        """
+        return self._execute_one(input_data)
+
+    async def execute_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyze several code snippets in one call.
+
+        Business Purpose: Workflows often analyze many snippets (e.g. every
+        search result). Items are analyzed concurrently in threads, and
+        large ones without a code_id in a shared worker process pool, so
+        big batches use more than one core. The compiled patterns and
+        result cache are shared.
+
+        Args:
+            items: Inputs, each matching input_schema
+
+        Returns:
+            Results in the same order as items
+
+        Raises:
+            SkillExecutionError: If any item fails
+
+        Example:
+            results = await skill.execute_batch([
+                {"code": python_source},
+                {"code": js_source, "language": "javascript"}
+            ])
+        """
+        large = [
+            len(item.get("code") or "") >= _PROCESS_POOL_MIN_SIZE and item.get("code_id") is None
+            for item in items
+        ]
+        pool = self._get_process_pool() if any(large) else None
+
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*[
+            loop.run_in_executor(pool, _execute_in_worker, item)
+            if pool is not None and is_large
+            else asyncio.to_thread(self._execute_one, item)
+            for item, is_large in zip(items, large)
+        ])
+
+    @classmethod
+    def _get_process_pool(cls) -> ProcessPoolExecutor:
+        """Return the shared worker process pool, creating it on first use."""
+        with _PROCESS_POOL_LOCK:
+            if cls._process_pool is None:
+                cls._process_pool = ProcessPoolExecutor(
+                    max_workers=_PROCESS_POOL_MAX_WORKERS,
+                    mp_context=multiprocessing.get_context(_PROCESS_POOL_START_METHOD),
+                    initializer=_init_worker,
+                )
+                atexit.register(cls.close_process_pool)
+            return cls._process_pool
+
+    @classmethod
+    def close_process_pool(cls) -> None:
+        """
+        Shut down the shared worker process pool, if one was started.
+
+        Registered with atexit when the pool is created; call it earlier to
+        release the worker processes. A later execute_batch starts a new pool.
+        """
+        with _PROCESS_POOL_LOCK:
+            pool, cls._process_pool = cls._process_pool, None
+        if pool is not None:
+            atexit.unregister(cls.close_process_pool)
+            pool.shutdown(wait=True)
+
+
+# The skill used by a worker process, created once by _init_worker
+_worker_skill: Optional[CodeAnalysisSkill] = None
+
+
+def _init_worker() -> None:
+    """Create the worker process's CodeAnalysisSkill (pool initializer)."""
+    global _worker_skill
+    _worker_skill = CodeAnalysisSkill()
+
+
+def _execute_in_worker(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze one batch item in a worker process (see execute_batch)."""
+    return _worker_skill._execute_one(input_data)
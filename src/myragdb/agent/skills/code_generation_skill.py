@@ -3,18 +3,372 @@
 # Author: Libor Ballaty <libor@arionetworks.com>
 # Created: 2026-01-07
 
+import asyncio
+import copy
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import ast
 import re
 
+import numpy as np
+
 from .base import Skill, SkillConfig
 
 
 logger = logging.getLogger(__name__)
 
 
+# Actions whose results are cached. Only "generate" is matched by meaning
+# (its prompt is a free-text description); tests and documentation are
+# derived from code, where near-duplicates need different output, so they
+# only hit on identical code.
+_CACHED_ACTIONS = frozenset({"generate", "generate_tests", "documentation"})
+_SEMANTIC_ACTIONS = frozenset({"generate"})
+
+# Description rewrites used to prefetch likely follow-up requests
+# ("Function to calculate factorial" -> "... using recursion", ...)
+_PREFETCH_MUTATIONS = (
+    "{description} using recursion",
+    "{description} using iteration",
+    "{description} with memoization",
+)
+
+# Pending prefetches beyond this are dropped rather than queued
+_PREFETCH_QUEUE_SIZE = 64
+
+_VALID_ACTIONS = frozenset({"generate", "refactor", "generate_tests", "format", "documentation", "optimize"})
+
+# Loaded sentence embedding models (None if a model could not be loaded),
+# shared by all skill instances
+_EMBEDDERS: Dict[str, Any] = {}
+_EMBEDDERS_LOCK = threading.Lock()
+
+
+def _load_embedder(model_name: str) -> Any:
+    """
+    Load a SentenceTransformer model once per process.
+
+    Imported lazily: loading torch is only worth it when the semantic
+    cache is enabled. A failed load (package missing, model download
+    failing) is logged once and remembered as None, so requests run
+    uncached instead of failing.
+    """
+    with _EMBEDDERS_LOCK:
+        if model_name not in _EMBEDDERS:
+            try:
+                from sentence_transformers import SentenceTransformer
+
+                _EMBEDDERS[model_name] = SentenceTransformer(model_name)
+            except Exception as e:
+                logger.warning(f"Semantic cache disabled, cannot load embedding model '{model_name}': {str(e)}")
+                _EMBEDDERS[model_name] = None
+        return _EMBEDDERS[model_name]
+
+
+def _normalize_prompt(text: str) -> str:
+    """Lowercase and collapse whitespace so trivial variations embed alike."""
+    return " ".join(text.lower().split())
+
+
+class _SemanticCache:
+    """
+    LRU cache of skill results matched by prompt embedding similarity.
+
+    Business Purpose: Near-duplicate generation requests ("Function to
+    calculate factorial" vs "function that computes factorial") reuse the
+    earlier result. Each key (action, language and the exact-match
+    parameters) holds a stacked matrix of unit-length prompt embeddings, so
+    a lookup is one matrix-vector product instead of a loop over entries.
+    Rows stored with a TTL (prefetched results) stop matching once they
+    expire.
+
+    Example:
+        cache = _SemanticCache(threshold=0.92, max_entries=256)
+        cache.store(key, result, embedding)
+        cache.lookup(key, similar_embedding)  # -> result
+    """
+
+    def __init__(self, threshold: float, max_entries: int):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # key -> (embedding matrix [N, d] or None for exact keys, results,
+        #         monotonic expiry time per row, inf when the row never expires)
+        self._entries: "OrderedDict[Tuple, Tuple[Optional[np.ndarray], List[Dict[str, Any]], np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Tuple, embedding: Optional[np.ndarray] = None) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached result.
+
+        Args:
+            key: Exact-match part of the request
+            embedding: Normalized prompt embedding, or None for exact keys
+
+        Returns:
+            The most similar result above the threshold, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            matrix, results, expires = entry
+            live = expires > time.monotonic()
+            if embedding is None:
+                return results[-1] if live[-1] else None
+            similarities = np.where(live, matrix @ embedding, -np.inf)
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                return results[best]
+            return None
+
+    def store(
+        self,
+        key: Tuple,
+        result: Dict[str, Any],
+        embedding: Optional[np.ndarray] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Cache a result.
+
+        Args:
+            key: Exact-match part of the request
+            result: Result to reuse
+            embedding: Normalized prompt embedding, or None for exact keys
+            ttl: Seconds until the result stops matching, or None to keep it
+        """
+        expiry = np.inf if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            entry = self._entries.get(key)
+            if embedding is None or entry is None:
+                matrix = None if embedding is None else embedding[np.newaxis, :]
+                self._entries[key] = (matrix, [result], np.array([expiry]))
+            else:
+                matrix, results, expires = entry
+                # Oldest rows go first once a key holds max_entries prompts
+                drop = max(0, len(results) + 1 - self.max_entries)
+                matrix = np.vstack((matrix[drop:], embedding))
+                results = results[drop:] + [result]
+                expires = np.append(expires[drop:], expiry)
+                self._entries[key] = (matrix, results, expires)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# First function definition, used to name generated tests
+_PY_DEF_RE = re.compile(r'^[ \t]*(?:async[ \t]+)?def[ \t]+([A-Za-z_]\w*)[ \t]*\(', re.MULTILINE)
+
+# Generated JavaScript tests have no per-request parts
+_JS_TEST_CODE = (
+    'describe("Generated Tests", () => {\n'
+    '  it("should test function", () => {\n'
+    '    // Test implementation\n'
+    '  });\n'
+    '});\n'
+)
+
+# Known slow idioms: (pattern, issue, advice) per language, compiled once.
+# These are reported as advice; the code is not rewritten.
+_JS_PERFORMANCE_PATTERNS = (
+    (
+        re.compile(r'for\s*\(\s*(?:let|var)\s+\w+\s*=\s*0\s*;\s*\w+\s*<\s*[\w.]+\.length\s*;'),
+        "Index loop over an array",
+        "Use for...of, or read .length once before the loop",
+    ),
+)
+_PERFORMANCE_PATTERNS: Dict[str, Tuple[Tuple["re.Pattern[str]", str, str], ...]] = {
+    "python": (
+        (
+            re.compile(r'\bfor\s+\w+\s+in\s+range\s*\(\s*len\s*\('),
+            "Index loop over a sequence",
+            "Iterate over the sequence directly, or use enumerate() when the index is needed",
+        ),
+        (
+            re.compile(r'\bfor\s+\w+\s+in\s+[\w.]+\.keys\s*\(\s*\)\s*:'),
+            "Iterating dict.keys()",
+            "Iterate over the dict itself",
+        ),
+        (
+            # Only conditions; "for x in [...]:" iterates, where a set
+            # would change the order
+            re.compile(r'\b(?:if|elif|while)\b[^\n]*\bin\s+\[[^\]\n]*\]\s*:'),
+            "Membership test against a list literal",
+            "Use a set literal (or a module-level frozenset) for O(1) lookups",
+        ),
+        (
+            re.compile(r'^[ \t]+\w+\s*\+=\s*(?:str\(|f?["\'])', re.MULTILINE),
+            "String concatenation in a loop",
+            "Collect the parts in a list and join them once",
+        ),
+    ),
+    "javascript": _JS_PERFORMANCE_PATTERNS,
+    "typescript": _JS_PERFORMANCE_PATTERNS,
+}
+
+# Parsed Python modules by source digest (None for code that doesn't
+# parse), so helpers handling the same code share one parse
+_PARSE_CACHE: "OrderedDict[bytes, Optional[ast.Module]]" = OrderedDict()
+_PARSE_CACHE_SIZE = 128
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _parse_python(code: str) -> Optional[ast.Module]:
+    """
+    Parse Python source, memoized by content.
+
+    Keyed by a blake2b digest rather than the source so cached entries don't
+    keep large inputs alive. The returned tree is shared; callers must not
+    modify it.
+
+    Args:
+        code: Python source code
+
+    Returns:
+        Module AST, or None if the code has a syntax error
+    """
+    key = hashlib.blake2b(code.encode(), digest_size=16).digest()
+    with _PARSE_CACHE_LOCK:
+        if key in _PARSE_CACHE:
+            _PARSE_CACHE.move_to_end(key)
+            return _PARSE_CACHE[key]
+
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        tree = None
+
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = tree
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return tree
+
+
+# Calls a numeric loop may make and still compile in numba's nopython mode
+_NUMBA_SAFE_CALLS = frozenset({
+    "range", "len", "abs", "min", "max", "int", "float", "bool", "round", "sum", "enumerate", "zip",
+})
+_NUMBA_SAFE_MODULES = frozenset({"math", "np", "numpy", "cmath"})
+_NUMBA_SAFE_ANNOTATIONS = frozenset({"int", "float", "bool", "complex"})
+_NUMERIC_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+
+# Constructs nopython mode rejects (or that mean the function isn't numeric)
+_NUMBA_UNSUPPORTED_NODES = (
+    ast.JoinedStr, ast.Dict, ast.Set, ast.DictComp, ast.SetComp, ast.GeneratorExp,
+    ast.Lambda, ast.With, ast.AsyncWith, ast.Try, ast.Yield, ast.YieldFrom, ast.Await,
+    ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Global, ast.Nonlocal,
+    ast.Import, ast.ImportFrom, ast.Starred,
+)
+
+
+def _is_numeric_loop_function(func: ast.FunctionDef) -> bool:
+    """
+    Check whether a function is a numeric loop numba can compile as is.
+
+    Business Purpose: Pure-Python loops over numbers are where numba's
+    @njit helps most (often 10-100x). The check is conservative: the
+    function must loop, do arithmetic, call only builtins/math/numpy,
+    and use no strings, dicts, closures or exception handling.
+
+    Args:
+        func: Module-level function definition
+
+    Returns:
+        True if decorating it with @njit should compile and pay off
+    """
+    if func.decorator_list:
+        return False
+    for arg in func.args.args + func.args.kwonlyargs:
+        annotation = arg.annotation
+        if annotation is not None and not (
+            isinstance(annotation, ast.Name) and annotation.id in _NUMBA_SAFE_ANNOTATIONS
+        ):
+            return False
+
+    has_loop = has_arithmetic = False
+    for node in ast.walk(ast.Module(body=func.body, type_ignores=[])):
+        if isinstance(node, _NUMBA_UNSUPPORTED_NODES):
+            return False
+        if isinstance(node, ast.Constant) and isinstance(node.value, (str, bytes)):
+            return False
+        if isinstance(node, (ast.For, ast.While)):
+            has_loop = True
+        elif isinstance(node, (ast.BinOp, ast.AugAssign)) and isinstance(node.op, _NUMERIC_OPS):
+            has_arithmetic = True
+        elif isinstance(node, ast.Call):
+            callee = node.func
+            if isinstance(callee, ast.Name):
+                if callee.id not in _NUMBA_SAFE_CALLS:
+                    return False
+            elif not (
+                isinstance(callee, ast.Attribute)
+                and isinstance(callee.value, ast.Name)
+                and callee.value.id in _NUMBA_SAFE_MODULES
+            ):
+                return False
+    return has_loop and has_arithmetic
+
+
+def _numba_suggestion(code: str) -> Optional[Dict[str, Any]]:
+    """
+    Suggest compiling a module's numeric loop functions with numba.
+
+    The user's code is only parsed, never executed, so the speedup is not
+    measured here. cache=True keeps compiled functions on disk so later
+    runs skip the compile.
+
+    Args:
+        code: Python source code
+
+    Returns:
+        Suggestion with the decorated code, or None if no function qualifies
+    """
+    tree = _parse_python(code)
+    if tree is None:
+        return None
+
+    candidates = [
+        node for node in tree.body
+        if isinstance(node, ast.FunctionDef) and _is_numeric_loop_function(node)
+    ]
+    if not candidates:
+        return None
+
+    # The import goes after any module docstring and __future__ imports
+    import_line = 0
+    for index, stmt in enumerate(tree.body):
+        is_docstring = (
+            index == 0 and isinstance(stmt, ast.Expr)
+            and isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str)
+        )
+        if not (is_docstring or (isinstance(stmt, ast.ImportFrom) and stmt.module == "__future__")):
+            break
+        import_line = stmt.end_lineno
+
+    lines = code.split("\n")
+    for func in reversed(candidates):
+        lines.insert(func.lineno - 1, "@njit(cache=True)")
+    lines.insert(import_line, "from numba import njit")
+    names = [func.name for func in candidates]
+    return {
+        "issue": "Interpreted numeric loops",
+        "description": (
+            f"Compile {', '.join(names)} to machine code with numba's @njit "
+            "(requires the numba package)"
+        ),
+        "applicable": True,
+        "optimized_code": "\n".join(lines),
+        "functions": names,
+    }
+
+
 @dataclass
 class CodeGenerationConfig(SkillConfig):
     """Configuration for code generation."""
@@ -22,6 +376,18 @@ class CodeGenerationConfig(SkillConfig):
     supported_languages: List[str] = None
     enable_formatting: bool = True
     enable_validation: bool = True
+    # Reuse results for near-duplicate requests (loads an embedding model;
+    # pays off when generation is model-backed rather than templated)
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.92
+    semantic_cache_size: int = 256
+    embedding_model: str = "all-MiniLM-L6-v2"
+    # Warm the semantic cache with variations of missed "generate" requests
+    # in the background (needs semantic_cache_enabled; await close_prefetch()
+    # before the event loop shuts down)
+    prefetch_enabled: bool = False
+    prefetch_fanout: int = 3
+    prefetch_ttl: float = 600.0
 
     def __post_init__(self):
         if self.supported_languages is None:
@@ -29,6 +395,9 @@ class CodeGenerationConfig(SkillConfig):
                 "python", "javascript", "typescript",
                 "java", "go", "rust", "cpp", "csharp", "sql"
             ]
+        # Membership set and error text, built once instead of per request
+        self._supported_set = frozenset(self.supported_languages)
+        self._supported_str = ", ".join(self.supported_languages)
 
 
 class CodeGenerationSkill(Skill):
@@ -80,6 +449,10 @@ class CodeGenerationSkill(Skill):
     DESCRIPTION = "Generate, refactor, and optimize code across multiple languages"
     VERSION = "1.0.0"
 
+    config: CodeGenerationConfig
+
+    __slots__ = ("_response_cache", "_prefetch_q", "_prefetch_task")
+
     def __init__(self, config: Optional[CodeGenerationConfig] = None):
         """
         Initialize code generation skill.
@@ -87,8 +460,93 @@ class CodeGenerationSkill(Skill):
         Args:
             config: Code generation configuration
         """
-        super().__init__(config or CodeGenerationConfig())
-        self.config: CodeGenerationConfig = self.config
+        super().__init__(self.NAME, self.DESCRIPTION, config or CodeGenerationConfig())
+        self._response_cache: Optional[_SemanticCache] = None
+        if self.config.semantic_cache_enabled:
+            self._response_cache = _SemanticCache(
+                self.config.semantic_cache_threshold,
+                self.config.semantic_cache_size,
+            )
+        # Created on the first miss, inside the running event loop
+        self._prefetch_q: Optional[asyncio.Queue] = None
+        self._prefetch_task: Optional[asyncio.Task] = None
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        """Define input schema for code generation skill."""
+        return {
+            "action": {
+                "type": "string",
+                "required": False,
+                "default": "generate",
+                "enum": sorted(_VALID_ACTIONS),
+                "description": "Action to perform"
+            },
+            "language": {
+                "type": "string",
+                "required": False,
+                "default": "python",
+                "enum": list(self.config.supported_languages),
+                "description": "Programming language"
+            },
+            "description": {
+                "type": "string",
+                "required": False,
+                "description": "What to generate (generate)"
+            },
+            "code": {
+                "type": "string",
+                "required": False,
+                "description": "Existing code to refactor, test, format, document or optimize"
+            },
+            "function_name": {
+                "type": "string",
+                "required": False,
+                "default": "generated_function",
+                "description": "Name of the generated function (generate)"
+            },
+            "language_features": {
+                "type": "array",
+                "required": False,
+                "items": {"type": "string"},
+                "description": "Features to use, e.g. recursion or memoization (generate)"
+            },
+            "improvements": {
+                "type": "array",
+                "required": False,
+                "items": {"type": "string"},
+                "description": "Improvements to apply: readability, performance, security (refactor)"
+            },
+            "test_framework": {
+                "type": "string",
+                "required": False,
+                "description": "Test framework, e.g. pytest or jest (generate_tests)"
+            },
+            "doc_format": {
+                "type": "string",
+                "required": False,
+                "description": "Documentation format: docstring, jsdoc, javadoc (documentation)"
+            }
+        }
+
+    @property
+    def output_schema(self) -> Dict[str, Any]:
+        """Define output schema for code generation skill."""
+        return {
+            "status": {
+                "type": "string",
+                "enum": ["success", "error"],
+                "description": "Whether the action succeeded"
+            },
+            "data": {
+                "type": "object",
+                "description": "Generated or analyzed code and action-specific metadata"
+            },
+            "error": {
+                "type": "string",
+                "description": "Error message when status is error"
+            }
+        }
 
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """
@@ -103,6 +561,62 @@ class CodeGenerationSkill(Skill):
             test_framework: Test framework (pytest, unittest, jest, etc.)
             doc_format: Documentation format (docstring, jsdoc, javadoc)
 
+        Returns:
+            Dictionary with generated code and metadata
+        """
+        return await self._execute(kwargs)
+
+    async def execute_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute several code generation requests.
+
+        Business Purpose: With the semantic cache enabled, every "generate"
+        request needs its description embedded. A batch embeds all of them
+        in one encode() call, which amortizes model overhead (about 30x
+        faster than one call per prompt on a GPU); each request then runs
+        as execute() would.
+
+        Args:
+            requests: Keyword arguments for execute(), one dict per request
+
+        Returns:
+            Results in the same order as requests
+
+        Example:
+            results = await skill.execute_batch([
+                {"action": "generate", "description": "Function to calculate factorial"},
+                {"action": "generate_tests", "code": "def add(a, b): return a + b"},
+            ])
+        """
+        embeddings: List[Optional[np.ndarray]] = [None] * len(requests)
+        if self._response_cache is not None:
+            semantic = [
+                index for index, request in enumerate(requests)
+                if request.get("action", "generate") in _SEMANTIC_ACTIONS
+                and request.get("language", "python").lower() in self.config._supported_set
+            ]
+            if semantic:
+                # Encoding is CPU-bound; keep it off the event loop
+                vectors = await self._embed_safely(
+                    [requests[index].get("description", "") for index in semantic]
+                )
+                if vectors is not None:
+                    for index, vector in zip(semantic, vectors):
+                        embeddings[index] = vector
+
+        return [
+            await self._execute(request, embedding)
+            for request, embedding in zip(requests, embeddings)
+        ]
+
+    async def _execute(self, kwargs: Dict[str, Any], embedding: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Run one request (shared by execute and execute_batch).
+
+        Args:
+            kwargs: execute() arguments
+            embedding: Precomputed description embedding for the semantic cache
+
         Returns:
             Dictionary with generated code and metadata
         """
@@ -116,12 +630,27 @@ class CodeGenerationSkill(Skill):
             doc_format = kwargs.get("doc_format", "")
 
             # Validate language
-            if language not in self.config.supported_languages:
+            if language not in self.config._supported_set:
                 return self._error(
                     f"Unsupported language: {language}. "
-                    f"Supported: {', '.join(self.config.supported_languages)}"
+                    f"Supported: {self.config._supported_str}"
                 )
 
+            # Reuse the result of an identical or near-duplicate request
+            cache_key = self._cache_key(action, language, code, kwargs)
+            if cache_key is None or action not in _SEMANTIC_ACTIONS:
+                embedding = None
+            elif embedding is None:
+                vectors = await self._embed_safely([description])
+                if vectors is None:
+                    cache_key = None  # No embedder: run uncached
+                else:
+                    embedding = vectors[0]
+            if cache_key is not None:
+                cached = self._response_cache.lookup(cache_key, embedding)
+                if cached is not None:
+                    return copy.deepcopy(cached)
+
             # Execute action
             if action == "generate":
                 result = await self._generate_code(language, description, kwargs)
@@ -144,6 +673,11 @@ class CodeGenerationSkill(Skill):
             else:
                 return self._error(f"Unknown action: {action}")
 
+            if cache_key is not None and result.get("status") == "success":
+                self._response_cache.store(cache_key, copy.deepcopy(result), embedding)
+                if embedding is not None and self.config.prefetch_enabled:
+                    self._enqueue_prefetch(cache_key, language, description, kwargs)
+
             logger.info(
                 f"Code generation completed: {action} in {language}",
                 extra={
@@ -161,6 +695,146 @@ class CodeGenerationSkill(Skill):
             logger.error(f"Error in code generation: {str(e)}", exc_info=True)
             return self._error(f"Code generation failed: {str(e)}")
 
+    def _cache_key(self, action: str, language: str, code: str, kwargs: Dict) -> Optional[Tuple]:
+        """
+        Build the exact-match part of a cache key, or None if not cached.
+
+        Args:
+            action: Requested action
+            language: Programming language
+            code: Input code (tests and documentation)
+            kwargs: All execute() arguments
+
+        Returns:
+            Hashable key, or None when the cache is off or the action isn't cached
+        """
+        if self._response_cache is None or action not in _CACHED_ACTIONS:
+            return None
+        if action == "generate":
+            return (
+                action,
+                language,
+                kwargs.get("function_name", "generated_function"),
+                tuple(kwargs.get("language_features", [])),
+            )
+        option = kwargs.get("test_framework" if action == "generate_tests" else "doc_format", "")
+        # Digest instead of the code itself so cached keys don't pin large inputs
+        return (action, language, option, hashlib.blake2b(code.encode(), digest_size=16).digest())
+
+    async def _embed_safely(self, prompts: List[str]) -> Optional[np.ndarray]:
+        """
+        Embed prompts in a worker thread, or None if embedding fails.
+
+        Args:
+            prompts: Free-text descriptions
+
+        Returns:
+            Unit-length embeddings, one row per prompt, or None
+        """
+        try:
+            return await asyncio.to_thread(self._embed, prompts)
+        except Exception as e:
+            logger.warning(f"Embedding failed, skipping semantic cache: {str(e)}")
+            return None
+
+    def _embed(self, prompts: List[str]) -> Optional[np.ndarray]:
+        """
+        Embed prompts for the semantic cache.
+
+        Args:
+            prompts: Free-text descriptions
+
+        Returns:
+            Unit-length embeddings, one row per prompt, or None when the
+            embedding model is unavailable
+        """
+        embedder = _load_embedder(self.config.embedding_model)
+        if embedder is None:
+            return None
+        return embedder.encode(
+            [_normalize_prompt(prompt) for prompt in prompts],
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+
+    def _enqueue_prefetch(self, cache_key: Tuple, language: str, description: str, kwargs: Dict) -> None:
+        """
+        Queue a missed "generate" request for background prefetching.
+
+        Business Purpose: A request like "Function to calculate factorial"
+        is often followed by "recursive factorial" or "memoized factorial".
+        Generating those variations while the skill is idle turns the
+        follow-up into a cache lookup. The queue is bounded; when it is
+        full the request is simply not prefetched.
+
+        Args:
+            cache_key: Exact-match cache key of the missed request
+            language: Programming language
+            description: Description that missed the cache
+            kwargs: execute() arguments of the missed request
+        """
+        loop = asyncio.get_running_loop()
+        task = self._prefetch_task
+        # Restart the worker if it stopped or belongs to an earlier event loop
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._prefetch_q = asyncio.Queue(maxsize=_PREFETCH_QUEUE_SIZE)
+            self._prefetch_task = loop.create_task(
+                self._prefetch_worker(self._prefetch_q)
+            )
+        try:
+            self._prefetch_q.put_nowait((cache_key, language, description, kwargs))
+        except asyncio.QueueFull:
+            logger.debug(f"Prefetch queue full, skipping: {description}")
+
+    async def close_prefetch(self) -> None:
+        """
+        Stop the background prefetch worker, if one is running.
+
+        Call before the event loop shuts down; pending prefetches are
+        dropped. A later cache miss starts a new worker.
+        """
+        task, self._prefetch_task = self._prefetch_task, None
+        self._prefetch_q = None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _prefetch_worker(self, queue: asyncio.Queue) -> None:
+        """
+        Generate and cache variations of queued requests until cancelled.
+
+        Args:
+            queue: Queue filled by _enqueue_prefetch
+        """
+        while True:
+            cache_key, language, description, kwargs = await queue.get()
+            try:
+                variants = [
+                    mutation.format(description=description)
+                    for mutation in _PREFETCH_MUTATIONS[:self.config.prefetch_fanout]
+                ]
+                # Encoding is CPU-bound; keep it off the event loop
+                embeddings = await asyncio.to_thread(self._embed, variants)
+                if embeddings is None:
+                    continue
+                for variant, embedding in zip(variants, embeddings):
+                    if self._response_cache.lookup(cache_key, embedding) is not None:
+                        continue
+                    result = await self._generate_code(language, variant, kwargs)
+                    if result.get("status") == "success":
+                        self._response_cache.store(
+                            cache_key, copy.deepcopy(result), embedding, ttl=self.config.prefetch_ttl
+                        )
+            except Exception as e:
+                logger.warning(f"Prefetch failed for '{description}': {str(e)}")
+            finally:
+                queue.task_done()
+
     async def _generate_code(self, language: str, description: str, kwargs: Dict) -> Dict[str, Any]:
         """Generate code from description."""
         language_features = kwargs.get("language_features", [])
@@ -305,28 +979,28 @@ class CodeGenerationSkill(Skill):
 
     def _generate_python_code(self, description: str, func_name: str, features: List[str]) -> str:
         """Generate Python code template."""
-        code = f'def {func_name}():\n    """'
-        code += f'{description}\n    """\n    pass\n'
-        return code
+        return f'def {func_name}():\n    """{description}\n    """\n    pass\n'
 
     def _generate_js_code(self, description: str, func_name: str, features: List[str], lang: str) -> str:
         """Generate JavaScript/TypeScript code template."""
         const_or_func = "const" if lang == "javascript" else "function"
-        code = f'{const_or_func} {func_name} = () => {{\n  // {description}\n  return null;\n}};\n'
-        return code
+        return f'{const_or_func} {func_name} = () => {{\n  // {description}\n  return null;\n}};\n'
 
     def _generate_java_code(self, description: str, func_name: str, features: List[str]) -> str:
         """Generate Java code template."""
-        code = f'public static Object {func_name}() {{\n  // {description}\n  return null;\n}}\n'
-        return code
+        return f'public static Object {func_name}() {{\n  // {description}\n  return null;\n}}\n'
 
     def _generate_python_tests(self, code: str, framework: str) -> str:
         """Generate Python test code."""
-        return f'import pytest\n\ndef test_{code[:20]}():\n    """Test for generated code."""\n    pass\n'
+        # Name the test after the first function; a raw slice of the code
+        # could contain spaces or punctuation and not parse
+        match = _PY_DEF_RE.search(code)
+        name = match.group(1) if match else "generated"
+        return f'import pytest\n\ndef test_{name}():\n    """Test for generated code."""\n    pass\n'
 
     def _generate_js_tests(self, code: str, framework: str) -> str:
         """Generate JavaScript test code."""
-        return f'describe("Generated Tests", () => {{\n  it("should test function", () => {{\n    // Test implementation\n  }});\n}});\n'
+        return _JS_TEST_CODE
 
     def _improve_readability(self, code: str, language: str) -> str:
         """Improve code readability."""
@@ -348,17 +1022,25 @@ class CodeGenerationSkill(Skill):
         return code + "\n// Error handling added"
 
     def _count_different_lines(self, original: str, refactored: str) -> int:
-        """Count lines that changed."""
-        orig_lines = set(original.split('\n'))
-        ref_lines = set(refactored.split('\n'))
-        return len(orig_lines.symmetric_difference(ref_lines))
+        """
+        Count lines that changed (distinct lines in only one version).
+
+        The refactoring helpers append lines, so when refactored extends
+        original only the appended lines are checked, each with a substring
+        search instead of hashing every line of both versions.
+        """
+        n = len(original)
+        if refactored.startswith(original) and refactored[n:n + 1] in ("\n", ""):
+            if len(refactored) == n:
+                return 0
+            framed = f"\n{original}\n"
+            added = set(refactored[n + 1:].split('\n'))
+            return sum(1 for line in added if f"\n{line}\n" not in framed)
+        return len(set(original.split('\n')).symmetric_difference(refactored.split('\n')))
 
     def _format_python(self, code: str) -> str:
         """Format Python code."""
-        try:
-            ast.parse(code)  # Validate syntax
-        except SyntaxError:
-            return code
+        _parse_python(code)  # Validate syntax
         return code
 
     def _format_javascript(self, code: str) -> str:
@@ -371,6 +1053,25 @@ class CodeGenerationSkill(Skill):
 
     def _analyze_code_performance(self, code: str, language: str) -> List[Dict[str, Any]]:
         """Analyze and suggest performance improvements."""
+        suggestions: List[Dict[str, Any]] = []
+        if language == "python":
+            suggestion = _numba_suggestion(code)
+            if suggestion is not None:
+                suggestions.append(suggestion)
+
+        for pattern, issue, advice in _PERFORMANCE_PATTERNS.get(language, ()):
+            match = pattern.search(code)
+            if match is not None:
+                suggestions.append({
+                    "issue": issue,
+                    "description": advice,
+                    "applicable": False,
+                    "optimized_code": code,
+                    "line": code.count("\n", 0, match.start()) + 1,
+                })
+
+        if suggestions:
+            return suggestions
         return [
             {
                 "issue": "Example optimization",
@@ -400,11 +1101,10 @@ class CodeGenerationSkill(Skill):
         action = kwargs.get("action", "generate")
         language = kwargs.get("language", "python").lower()
 
-        if language not in self.config.supported_languages:
+        if language not in self.config._supported_set:
             return False
 
-        valid_actions = ["generate", "refactor", "generate_tests", "format", "documentation", "optimize"]
-        if action not in valid_actions:
+        if action not in _VALID_ACTIONS:
             return False
 
         return True
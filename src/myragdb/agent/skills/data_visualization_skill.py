@@ -5,17 +5,99 @@
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, field
+import threading
+from string import Template
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional
+from dataclasses import dataclass, field, replace
 import base64
+from datetime import datetime, timezone
 from io import BytesIO
 
+import numpy as np
+
+try:
+    # Figure renders through the Agg canvas on its own, so neither pyplot's
+    # global figure manager nor matplotlib.use() is needed
+    from matplotlib.figure import Figure
+except ImportError:
+    Figure = None
+
 from .base import Skill, SkillConfig
 
 
 logger = logging.getLogger(__name__)
 
 
+# Chart.js page; only the chart-specific fields are substituted per call
+_HTML_TEMPLATE = Template("""
+        <html>
+        <head>
+            <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+            <style>
+                body { font-family: Arial, sans-serif; padding: 20px; }
+                canvas { max-width: 100%; }
+            </style>
+        </head>
+        <body>
+            <h1>${title}</h1>
+            <canvas id="chart"></canvas>
+            <script>
+                const ctx = document.getElementById('chart').getContext('2d');
+                const chart = new Chart(ctx, {
+                    type: '${chart_type}',
+                    data: {
+                        labels: ${labels},
+                        datasets: ${datasets},
+                    },
+                    options: {
+                        responsive: true,
+                        plugins: {
+                            legend: { display: ${legend} },
+                            title: { display: true, text: '${title}' },
+                        },
+                        scales: {
+                            ${scales}
+                        },
+                    },
+                });
+            </script>
+        </body>
+        </html>
+        """)
+
+# Simplified SVG generation
+# In production, use matplotlib or plotly for better rendering
+_SVG_TEMPLATE = Template("""<?xml version="1.0" encoding="UTF-8"?>
+        <svg width="${width}" height="${height}"
+             xmlns="http://www.w3.org/2000/svg">
+            <text x="10" y="30" font-size="20" font-weight="bold">
+                ${title}
+            </text>
+            <!-- Chart content would be generated here -->
+            <text x="10" y="60" font-size="12" fill="#666">
+                Generated SVG chart (${chart_type})
+            </text>
+        </svg>
+        """)
+
+# Chart types whose y axis starts at zero in the HTML chart
+_ZERO_BASED_CHART_TYPES = frozenset({"bar", "line"})
+
+# Chart types whose points form an ordered series, so dropping evenly
+# spaced points keeps the shape. Pie slices and bar categories are each a
+# datum (dropping them changes the totals or hides categories).
+_DOWNSAMPLED_CHART_TYPES = frozenset({"line"})
+
+_JS_BOOLEANS = {True: "true", False: "false"}
+
+
+def _nested_json(value: Any) -> str:
+    """Serialize a value indented to sit one level inside an indent=2 object."""
+    # json.dumps escapes newlines inside strings, so every "\n" is layout
+    return json.dumps(value, indent=2).replace("\n", "\n  ")
+
+
 @dataclass
 class VisualizationConfig(SkillConfig):
     """Configuration for data visualization."""
@@ -26,18 +108,140 @@ class VisualizationConfig(SkillConfig):
     theme: str = "light"
     include_legend: bool = True
     include_grid: bool = True
+    # zlib level for PNG output: 1 renders fastest, 9 gives the smallest files
+    png_compress_level: int = 6
 
 
-@dataclass
+_NO_OPTIONS: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
 class ChartData:
-    """Structure for chart data."""
+    """Structure for chart data (immutable; built once per execute call)"""
     title: str
     chart_type: str
     labels: List[str]
     datasets: List[Dict[str, Any]]
     x_label: Optional[str] = None
     y_label: Optional[str] = None
-    options: Dict[str, Any] = field(default_factory=dict)
+    # Defaults to one shared read-only mapping, no per-instance allocation
+    options: Mapping[str, Any] = field(default_factory=lambda: _NO_OPTIONS)
+
+
+@dataclass(slots=True)
+class BatchChartData:
+    """
+    Charts of one execute_batch call, stored column by column.
+
+    Business Purpose: A batch of thousands of charts keeps one list per
+    field instead of one object per chart, so per-batch metadata (such as
+    the data point counts) is computed over whole columns. Renderers read
+    chart i through chart(i).
+
+    Example:
+        batch = BatchChartData.from_requests(requests)
+        batch.data_points()  # -> array([3, 12, ...])
+    """
+    titles: List[str]
+    chart_types: np.ndarray  # dtype=object
+    labels: List[List[str]]
+    datasets: List[List[Dict[str, Any]]]
+    x_labels: List[Optional[str]]
+    y_labels: List[Optional[str]]
+    options: List[Mapping[str, Any]]
+    export_formats: List[str]
+
+    @classmethod
+    def from_requests(cls, requests: List[Dict[str, Any]], default_chart_type: str) -> "BatchChartData":
+        """
+        Build the columns from execute() keyword arguments.
+
+        Args:
+            requests: execute() arguments, one dict per chart
+            default_chart_type: Chart type for requests without one
+
+        Returns:
+            BatchChartData with one row per request
+        """
+        return cls(
+            titles=[request.get("title", "Chart") for request in requests],
+            chart_types=np.array(
+                [request.get("chart_type", default_chart_type) for request in requests],
+                dtype=object,
+            ),
+            labels=[request.get("labels", []) for request in requests],
+            datasets=[request.get("datasets", []) for request in requests],
+            x_labels=[request.get("x_label") for request in requests],
+            y_labels=[request.get("y_label") for request in requests],
+            options=[request.get("options", _NO_OPTIONS) for request in requests],
+            export_formats=[request.get("export_format", "json") for request in requests],
+        )
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def chart(self, index: int) -> ChartData:
+        """Row index as a ChartData, the form the renderers take."""
+        return ChartData(
+            title=self.titles[index],
+            chart_type=self.chart_types[index],
+            labels=self.labels[index],
+            datasets=self.datasets[index],
+            x_label=self.x_labels[index],
+            y_label=self.y_labels[index],
+            options=self.options[index],
+        )
+
+    def data_points(self) -> np.ndarray:
+        """
+        Count the data points of every chart in one NumPy pass.
+
+        Returns:
+            int64 array with the total dataset length per chart
+        """
+        counts = np.array(
+            [len(ds["data"]) if "data" in ds else 0 for chart_datasets in self.datasets for ds in chart_datasets],
+            dtype=np.int64,
+        )
+        owners = np.repeat(np.arange(len(self)), [len(chart_datasets) for chart_datasets in self.datasets])
+        totals = np.zeros(len(self), dtype=np.int64)
+        np.add.at(totals, owners, counts)
+        return totals
+
+
+def _render_line_png(ax: Any, chart: ChartData) -> None:
+    """Draw one line per dataset."""
+    for dataset in chart.datasets:
+        ax.plot(chart.labels, dataset["data"], label=dataset.get("label", ""))
+    ax.set_xlabel(chart.x_label or "X")
+    ax.set_ylabel(chart.y_label or "Y")
+
+
+def _render_bar_png(ax: Any, chart: ChartData) -> None:
+    """Draw grouped bars: dataset i is shifted by i bar widths."""
+    width = 0.35
+    x_pos = np.arange(len(chart.labels))
+    offsets = np.arange(len(chart.datasets)) * width
+    for offset, dataset in zip(offsets, chart.datasets):
+        ax.bar(x_pos + offset, np.asarray(dataset["data"]),
+               width=width, label=dataset.get("label", ""))
+    # Ticks under the middle of each group
+    ax.set_xticks(x_pos + (len(chart.datasets) - 1) * width / 2)
+    ax.set_xticklabels(chart.labels)
+
+
+def _render_pie_png(ax: Any, chart: ChartData) -> None:
+    """Draw the first dataset as a pie."""
+    data = chart.datasets[0].get("data", [])
+    ax.pie(data, labels=chart.labels, autopct="%1.1f%%")
+
+
+# Chart type -> function drawing it on a matplotlib Axes
+_PNG_RENDERERS: Dict[str, Callable[[Any, ChartData], None]] = {
+    "line": _render_line_png,
+    "bar": _render_bar_png,
+    "pie": _render_pie_png,
+}
 
 
 class DataVisualizationSkill(Skill):
@@ -80,7 +284,11 @@ class DataVisualizationSkill(Skill):
     DESCRIPTION = "Generate interactive charts and visualizations from data"
     VERSION = "1.0.0"
 
-    SUPPORTED_CHART_TYPES = {
+    config: VisualizationConfig
+
+    __slots__ = ("_figure", "_figure_lock")
+
+    SUPPORTED_CHART_TYPES = frozenset({
         "line",
         "bar",
         "pie",
@@ -89,14 +297,19 @@ class DataVisualizationSkill(Skill):
         "bubble",
         "radar",
         "heatmap",
-    }
+    })
 
-    SUPPORTED_EXPORT_FORMATS = {
+    SUPPORTED_EXPORT_FORMATS = frozenset({
         "json",
         "svg",
         "png",
         "html",
-    }
+        "all",
+    })
+
+    # Joined once for the validation error messages
+    _SUPPORTED_CHART_TYPES_STR = ", ".join(sorted(SUPPORTED_CHART_TYPES))
+    _SUPPORTED_EXPORT_FORMATS_STR = ", ".join(sorted(SUPPORTED_EXPORT_FORMATS))
 
     def __init__(self, config: Optional[VisualizationConfig] = None):
         """
@@ -105,8 +318,83 @@ class DataVisualizationSkill(Skill):
         Args:
             config: Visualization configuration
         """
-        super().__init__(config or VisualizationConfig())
-        self.config: VisualizationConfig = self.config
+        super().__init__(self.NAME, self.DESCRIPTION, config or VisualizationConfig())
+        # PNG figure reused across renders (created on first use); a
+        # matplotlib Figure is not thread-safe, so renders are serialized
+        self._figure: Optional[Any] = None
+        self._figure_lock = threading.Lock()
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        """Define input schema for data visualization skill."""
+        return {
+            "chart_type": {
+                "type": "string",
+                "required": False,
+                "default": self.config.default_chart_type,
+                "enum": sorted(self.SUPPORTED_CHART_TYPES),
+                "description": "Type of chart"
+            },
+            "title": {
+                "type": "string",
+                "required": False,
+                "default": "Chart",
+                "description": "Chart title"
+            },
+            "labels": {
+                "type": "array",
+                "required": True,
+                "items": {"type": "string"},
+                "description": "Data labels (X-axis)"
+            },
+            "datasets": {
+                "type": "array",
+                "required": True,
+                "items": {"type": "object"},
+                "description": "Datasets, each with a label and a data list"
+            },
+            "x_label": {
+                "type": "string",
+                "required": False,
+                "description": "X-axis label"
+            },
+            "y_label": {
+                "type": "string",
+                "required": False,
+                "description": "Y-axis label"
+            },
+            "export_format": {
+                "type": "string",
+                "required": False,
+                "default": "json",
+                "enum": sorted(self.SUPPORTED_EXPORT_FORMATS),
+                "description": "Format to export the chart as"
+            },
+            "options": {
+                "type": "object",
+                "required": False,
+                "description": "Additional chart options"
+            }
+        }
+
+    @property
+    def output_schema(self) -> Dict[str, Any]:
+        """Define output schema for data visualization skill."""
+        return {
+            "status": {
+                "type": "string",
+                "enum": ["success", "error"],
+                "description": "Whether the chart was generated"
+            },
+            "data": {
+                "type": "object",
+                "description": "chart_json plus chart_html, chart_svg or chart_base64_png for the requested format"
+            },
+            "error": {
+                "type": "string",
+                "description": "Error message when status is error"
+            }
+        }
 
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """
@@ -119,7 +407,9 @@ class DataVisualizationSkill(Skill):
             datasets: List of datasets with label and data
             x_label: X-axis label
             y_label: Y-axis label
-            export_format: Format to export as (json, svg, png, html)
+            export_format: Format to export as (json, svg, png, html, or all).
+                chart_json is always returned; "json" adds nothing else, so
+                it no longer renders the PNG. "all" returns every format.
             options: Additional chart options
 
         Returns:
@@ -127,190 +417,249 @@ class DataVisualizationSkill(Skill):
         """
         try:
             chart_type = kwargs.get("chart_type", self.config.default_chart_type)
-            title = kwargs.get("title", "Chart")
             labels = kwargs.get("labels", [])
             datasets = kwargs.get("datasets", [])
-            x_label = kwargs.get("x_label")
-            y_label = kwargs.get("y_label")
             export_format = kwargs.get("export_format", "json")
-            options = kwargs.get("options", {})
-
-            # Validate inputs
-            if not chart_type in self.SUPPORTED_CHART_TYPES:
-                return self._error(
-                    f"Unsupported chart type: {chart_type}. "
-                    f"Supported types: {', '.join(self.SUPPORTED_CHART_TYPES)}"
-                )
 
-            if not labels or not datasets:
-                return self._error("Labels and datasets are required")
-
-            if not export_format in self.SUPPORTED_EXPORT_FORMATS:
-                return self._error(
-                    f"Unsupported export format: {export_format}. "
-                    f"Supported formats: {', '.join(self.SUPPORTED_EXPORT_FORMATS)}"
-                )
+            error = self._validate_request(chart_type, labels, datasets, export_format)
+            if error is not None:
+                return self._error(error)
 
             # Create chart data
             chart_data = ChartData(
-                title=title,
+                title=kwargs.get("title", "Chart"),
                 chart_type=chart_type,
                 labels=labels,
                 datasets=datasets,
-                x_label=x_label,
-                y_label=y_label,
-                options=options,
+                x_label=kwargs.get("x_label"),
+                y_label=kwargs.get("y_label"),
+                options=kwargs.get("options", {}),
             )
 
-            # Generate chart in requested formats
-            result = {
-                "title": title,
-                "chart_type": chart_type,
-                "data_points": sum(len(ds.get("data", [])) for ds in datasets),
-            }
+            data_points = sum(len(ds["data"]) for ds in datasets if "data" in ds)
+            return self._success(self._render(chart_data, export_format, data_points))
 
-            # JSON format (always included)
-            result["chart_json"] = self._to_json_format(chart_data)
+        except Exception as e:
+            logger.error(f"Error generating visualization: {str(e)}", exc_info=True)
+            return self._error(f"Visualization generation failed: {str(e)}")
 
-            # HTML interactive chart
-            if export_format in ["html", "json"]:
-                result["chart_html"] = self._to_html_format(chart_data)
+    async def execute_batch(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Generate several charts.
 
-            # SVG format
-            if export_format in ["svg", "json"]:
-                result["chart_svg"] = self._to_svg_format(chart_data)
+        Business Purpose: Bulk chart generation (dashboards, reports) holds
+        the valid requests in one BatchChartData, so the data point counts
+        of every chart come from a single NumPy sum; each chart is then
+        rendered as execute() would.
 
-            # PNG format (requires rendering)
-            if export_format in ["png", "json"]:
-                result["chart_base64_png"] = self._to_png_format(chart_data)
+        Args:
+            requests: Keyword arguments for execute(), one dict per chart
 
-            # Add metadata
-            result["metadata"] = {
-                "generated_at": logger.info.__self__.__class__.__name__,
-                "skill": self.NAME,
-                "version": self.VERSION,
-            }
+        Returns:
+            Results in the same order as requests
 
-            logger.info(
-                f"Generated {chart_type} chart: {title}",
-                extra={
-                    'context': {
-                        'chart_type': chart_type,
-                        'data_points': result['data_points'],
-                        'export_format': export_format,
-                    }
-                },
-            )
+        Example:
+            results = await skill.execute_batch([
+                {"chart_type": "line", "labels": ["Jan", "Feb"], "datasets": [{"data": [1, 2]}]},
+                {"chart_type": "bar", "labels": ["A"], "datasets": [{"data": [5]}], "export_format": "svg"},
+            ])
+        """
+        try:
+            results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+            valid: List[int] = []
+            for index, request in enumerate(requests):
+                error = self._validate_request(
+                    request.get("chart_type", self.config.default_chart_type),
+                    request.get("labels", []),
+                    request.get("datasets", []),
+                    request.get("export_format", "json"),
+                )
+                if error is None:
+                    valid.append(index)
+                else:
+                    results[index] = self._error(error)
 
-            return self._success(result)
+            batch = BatchChartData.from_requests(
+                [requests[index] for index in valid], self.config.default_chart_type
+            )
+            data_points = batch.data_points()
+            for row, index in enumerate(valid):
+                try:
+                    result = self._render(batch.chart(row), batch.export_formats[row], int(data_points[row]))
+                    results[index] = self._success(result)
+                except Exception as e:
+                    logger.error(f"Error generating visualization: {str(e)}", exc_info=True)
+                    results[index] = self._error(f"Visualization generation failed: {str(e)}")
+            return results
 
         except Exception as e:
-            logger.error(f"Error generating visualization: {str(e)}", exc_info=True)
-            return self._error(f"Visualization generation failed: {str(e)}")
+            logger.error(f"Error generating visualizations: {str(e)}", exc_info=True)
+            message = f"Visualization generation failed: {str(e)}"
+            return [self._error(message) for _ in requests]
+
+    def _validate_request(
+        self,
+        chart_type: str,
+        labels: List[str],
+        datasets: List[Dict[str, Any]],
+        export_format: str,
+    ) -> Optional[str]:
+        """
+        Check one chart request.
 
-    def _to_json_format(self, chart: ChartData) -> str:
-        """Convert chart to JSON format."""
-        return json.dumps({
-            "title": chart.title,
-            "type": chart.chart_type,
-            "labels": chart.labels,
-            "datasets": chart.datasets,
-            "axes": {
-                "x": chart.x_label,
-                "y": chart.y_label,
+        Returns:
+            Error message, or None if the request is valid
+        """
+        if not chart_type in self.SUPPORTED_CHART_TYPES:
+            return (
+                f"Unsupported chart type: {chart_type}. "
+                f"Supported types: {self._SUPPORTED_CHART_TYPES_STR}"
+            )
+
+        if not labels or not datasets:
+            return "Labels and datasets are required"
+
+        if not export_format in self.SUPPORTED_EXPORT_FORMATS:
+            return (
+                f"Unsupported export format: {export_format}. "
+                f"Supported formats: {self._SUPPORTED_EXPORT_FORMATS_STR}"
+            )
+
+        return None
+
+    def _render(self, chart_data: ChartData, export_format: str, data_points: int) -> Dict[str, Any]:
+        """
+        Render one validated chart (shared by execute and execute_batch).
+
+        Args:
+            chart_data: Chart to render
+            export_format: Requested export format
+            data_points: Total data points across the chart's datasets
+
+        Returns:
+            Result data with the chart in the requested formats
+        """
+        # Generate chart in requested formats
+        result = {
+            "title": chart_data.title,
+            "chart_type": chart_data.chart_type,
+            "data_points": data_points,
+        }
+
+        # Serialized once, shared by the JSON and HTML outputs
+        labels_json = json.dumps(chart_data.labels)
+        datasets_json = json.dumps(chart_data.datasets)
+
+        # JSON format (always included)
+        result["chart_json"] = self._to_json_format(chart_data, labels_json, datasets_json)
+
+        # Only the requested format is rendered
+        export_all = export_format == "all"
+
+        # HTML interactive chart
+        if export_all or export_format == "html":
+            result["chart_html"] = self._to_html_format(chart_data, labels_json, datasets_json)
+
+        # SVG format
+        if export_all or export_format == "svg":
+            result["chart_svg"] = self._to_svg_format(chart_data)
+
+        # PNG format (requires rendering)
+        if export_all or export_format == "png":
+            result["chart_base64_png"] = self._to_png_format(chart_data)
+
+        # Add metadata
+        result["metadata"] = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "skill": self.NAME,
+            "version": self.VERSION,
+        }
+
+        logger.info(
+            f"Generated {chart_data.chart_type} chart: {chart_data.title}",
+            extra={
+                'context': {
+                    'chart_type': chart_data.chart_type,
+                    'data_points': data_points,
+                    'export_format': export_format,
+                }
             },
-            "options": chart.options,
-        }, indent=2)
+        )
 
-    def _to_html_format(self, chart: ChartData) -> str:
-        """Convert chart to interactive HTML using Chart.js."""
-        dataset_str = json.dumps(chart.datasets)
-        labels_str = json.dumps(chart.labels)
+        return result
 
-        html = f"""
-        <html>
-        <head>
-            <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-            <style>
-                body {{ font-family: Arial, sans-serif; padding: 20px; }}
-                canvas {{ max-width: 100%; }}
-            </style>
-        </head>
-        <body>
-            <h1>{chart.title}</h1>
-            <canvas id="chart"></canvas>
-            <script>
-                const ctx = document.getElementById('chart').getContext('2d');
-                const chart = new Chart(ctx, {{
-                    type: '{chart.chart_type}',
-                    data: {{
-                        labels: {labels_str},
-                        datasets: {dataset_str},
-                    }},
-                    options: {{
-                        responsive: true,
-                        plugins: {{
-                            legend: {{ display: {str(self.config.include_legend).lower()} }},
-                            title: {{ display: true, text: '{chart.title}' }},
-                        }},
-                        scales: {{
-                            {'y: { beginAtZero: true },' if chart.chart_type in ['bar', 'line'] else ''}
-                        }},
-                    }},
-                }});
-            </script>
-        </body>
-        </html>
+    def _to_json_format(
+        self,
+        chart: ChartData,
+        labels_json: Optional[str] = None,
+        datasets_json: Optional[str] = None,
+    ) -> str:
+        """
+        Convert chart to JSON format.
+
+        The small fields are indented; labels and datasets (the bulk of the
+        data) are spliced in as already-serialized compact JSON.
         """
-        return html
+        if labels_json is None:
+            labels_json = json.dumps(chart.labels)
+        if datasets_json is None:
+            datasets_json = json.dumps(chart.datasets)
+        return "".join((
+            '{\n  "title": ', json.dumps(chart.title),
+            ',\n  "type": ', json.dumps(chart.chart_type),
+            ',\n  "labels": ', labels_json,
+            ',\n  "datasets": ', datasets_json,
+            ',\n  "axes": ', _nested_json({"x": chart.x_label, "y": chart.y_label}),
+            ',\n  "options": ', _nested_json(dict(chart.options)),
+            '\n}',
+        ))
+
+    def _to_html_format(
+        self,
+        chart: ChartData,
+        labels_json: Optional[str] = None,
+        datasets_json: Optional[str] = None,
+    ) -> str:
+        """Convert chart to interactive HTML using Chart.js."""
+        return _HTML_TEMPLATE.substitute(
+            title=chart.title,
+            chart_type=chart.chart_type,
+            labels=labels_json if labels_json is not None else json.dumps(chart.labels),
+            datasets=datasets_json if datasets_json is not None else json.dumps(chart.datasets),
+            legend=_JS_BOOLEANS[bool(self.config.include_legend)],
+            scales="y: { beginAtZero: true }," if chart.chart_type in _ZERO_BASED_CHART_TYPES else "",
+        )
 
     def _to_svg_format(self, chart: ChartData) -> str:
         """Convert chart to SVG format."""
-        # Simplified SVG generation
-        # In production, use matplotlib or plotly for better rendering
-        svg = f"""<?xml version="1.0" encoding="UTF-8"?>
-        <svg width="{self.config.width}" height="{self.config.height}"
-             xmlns="http://www.w3.org/2000/svg">
-            <text x="10" y="30" font-size="20" font-weight="bold">
-                {chart.title}
-            </text>
-            <!-- Chart content would be generated here -->
-            <text x="10" y="60" font-size="12" fill="#666">
-                Generated SVG chart ({chart.chart_type})
-            </text>
-        </svg>
-        """
-        return svg
+        return _SVG_TEMPLATE.substitute(
+            width=self.config.width,
+            height=self.config.height,
+            title=chart.title,
+            chart_type=chart.chart_type,
+        )
 
     def _to_png_format(self, chart: ChartData) -> str:
         """Convert chart to PNG format (base64 encoded)."""
-        try:
-            # Try to import matplotlib for PNG generation
-            import matplotlib.pyplot as plt
-            import matplotlib
-            matplotlib.use('Agg')
-
-            fig, ax = plt.subplots(figsize=(10, 6))
-
-            # Generate based on chart type
-            if chart.chart_type == "line":
-                for dataset in chart.datasets:
-                    ax.plot(chart.labels, dataset["data"], label=dataset.get("label", ""))
-                ax.set_xlabel(chart.x_label or "X")
-                ax.set_ylabel(chart.y_label or "Y")
-
-            elif chart.chart_type == "bar":
-                x_pos = range(len(chart.labels))
-                for i, dataset in enumerate(chart.datasets):
-                    offset = i * 0.35
-                    ax.bar([p + offset for p in x_pos], dataset["data"],
-                          width=0.35, label=dataset.get("label", ""))
-                ax.set_xticks([p + 0.35 for p in x_pos])
-                ax.set_xticklabels(chart.labels)
-
-            elif chart.chart_type == "pie":
-                data = chart.datasets[0].get("data", [])
-                ax.pie(data, labels=chart.labels, autopct="%1.1f%%")
+        if Figure is None:
+            logger.warning("matplotlib not available, returning placeholder PNG")
+            # Return a simple placeholder
+            return base64.b64encode(b"PNG_PLACEHOLDER").decode()
+
+        chart = self._downsample(chart)
+
+        with self._figure_lock:
+            if self._figure is None:
+                self._figure = Figure(figsize=(10, 6))
+            fig = self._figure
+            fig.clear()
+            ax = fig.add_subplot()
+
+            # Generate based on chart type; types without a renderer get
+            # only the title, legend and grid
+            renderer = _PNG_RENDERERS.get(chart.chart_type)
+            if renderer is not None:
+                renderer(ax, chart)
 
             ax.set_title(chart.title)
             if self.config.include_legend:
@@ -320,17 +669,43 @@ class DataVisualizationSkill(Skill):
 
             # Convert to base64
             buffer = BytesIO()
-            plt.savefig(buffer, format='png', dpi=100, bbox_inches='tight')
-            buffer.seek(0)
-            base64_str = base64.b64encode(buffer.read()).decode()
-            plt.close(fig)
+            fig.savefig(
+                buffer, format='png', dpi=100, bbox_inches='tight',
+                pil_kwargs={'compress_level': self.config.png_compress_level},
+            )
+        # getbuffer() is a view of the PNG bytes, not a copy
+        return base64.b64encode(buffer.getbuffer()).decode('ascii')
 
-            return base64_str
+    def _downsample(self, chart: ChartData) -> ChartData:
+        """
+        Reduce a line chart to at most config.max_data_points points per dataset.
 
-        except ImportError:
-            logger.warning("matplotlib not available, returning placeholder PNG")
-            # Return a simple placeholder
-            return base64.b64encode(b"PNG_PLACEHOLDER").decode()
+        Business Purpose: matplotlib creates per-point objects, so render time
+        grows with the point count; past a thousand points the extra detail
+        isn't visible at chart resolution anyway. Points are picked at evenly
+        spaced indices (always keeping the first and last). The same indices
+        apply to every dataset, since they share the labels. Other chart
+        types are returned unchanged.
+
+        Args:
+            chart: Chart to render
+
+        Returns:
+            chart itself if it is small enough, otherwise a reduced copy
+        """
+        n_points = len(chart.labels)
+        limit = self.config.max_data_points
+        if n_points <= limit or chart.chart_type not in _DOWNSAMPLED_CHART_TYPES:
+            return chart
+
+        index = np.linspace(0, n_points - 1, limit).round().astype(np.int64)
+        datasets = [
+            {**dataset, "data": np.asarray(dataset["data"])[index]}
+            if len(dataset.get("data", ())) == n_points else dataset
+            for dataset in chart.datasets
+        ]
+        labels = [chart.labels[i] for i in index]
+        return replace(chart, labels=labels, datasets=datasets)
 
     def _success(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Format successful execution result."""
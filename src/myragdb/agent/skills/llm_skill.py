@@ -3,12 +3,148 @@
 # Author: Libor Ballaty <libor@arionetworks.com>
 # Created: 2026-01-07
 
-from typing import Any, Dict, Optional
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from myragdb.agent.skills.base import Skill, SkillExecutionError
 from myragdb.llm.session_manager import SessionManager
 
 
+logger = logging.getLogger(__name__)
+
+# Only near-deterministic calls are cached; at higher temperatures the
+# caller asked for sampled output that differs between calls
+_CACHE_MAX_TEMPERATURE = 0.2
+
+# Splits a prompt into a reusable prefix (instructions, shared context) and
+# the per-call user query when no system_prompt is given
+_USER_SENTINEL = "<<<USER>>>"
+
+# Loaded sentence embedding models (None if a model could not be loaded),
+# shared by all skill instances
+_EMBEDDERS: Dict[str, Any] = {}
+_EMBEDDERS_LOCK = threading.Lock()
+
+
+def _load_embedder(model_name: str) -> Any:
+    """
+    Load a SentenceTransformer model once per process.
+
+    Imported lazily so skills that never cache don't load torch. A failed
+    load (package missing, model download failing) is logged once and
+    remembered as None; the cache then falls back to exact matches only.
+    """
+    with _EMBEDDERS_LOCK:
+        if model_name not in _EMBEDDERS:
+            try:
+                from sentence_transformers import SentenceTransformer
+
+                _EMBEDDERS[model_name] = SentenceTransformer(model_name)
+            except Exception as e:
+                logger.warning(f"Similarity cache disabled, cannot load embedding model '{model_name}': {str(e)}")
+                _EMBEDDERS[model_name] = None
+        return _EMBEDDERS[model_name]
+
+
+class _SemanticCache:
+    """
+    LLM response cache with an exact-match layer and a similarity layer.
+
+    Business Purpose: Agents re-issue the same or nearly the same prompts
+    ("Summarize the auth flow" vs "Summarise the authentication flow"), and
+    each provider call is a multi-second network round-trip. Identical
+    prompts hit a dict; otherwise the prompt embedding is compared against
+    every cached prompt of the same scope (model, temperature, max_tokens)
+    with one matrix-vector product over unit vectors, i.e. a flat
+    inner-product (cosine) search.
+
+    Example:
+        cache = _SemanticCache(threshold=0.92, max_entries=1024)
+        cache.put(prompt, scope, response, embedding)
+        cache.get_exact(prompt, scope)              # -> response
+        cache.get_similar(similar_embedding, scope)  # -> response
+    """
+
+    def __init__(self, threshold: float, max_entries: int):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        # (prompt, *scope) -> response
+        self._exact: "OrderedDict[Tuple, str]" = OrderedDict()
+        # scope -> (embedding matrix [N, d], responses)
+        self._semantic: "OrderedDict[Tuple, Tuple[np.ndarray, List[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_exact(self, prompt: str, scope: Tuple) -> Optional[str]:
+        """Return the response cached for this exact prompt, or None."""
+        key = (prompt, *scope)
+        with self._lock:
+            response = self._exact.get(key)
+            if response is not None:
+                self._exact.move_to_end(key)
+            return response
+
+    def get_similar(self, embedding: np.ndarray, scope: Tuple) -> Optional[str]:
+        """
+        Find the response of the most similar cached prompt.
+
+        Args:
+            embedding: Normalized prompt embedding
+            scope: Model, temperature and max_tokens of the call
+
+        Returns:
+            Response whose prompt similarity is at least the threshold, or None
+        """
+        with self._lock:
+            entry = self._semantic.get(scope)
+            if entry is None:
+                return None
+            self._semantic.move_to_end(scope)
+            matrix, responses = entry
+            similarities = matrix @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.threshold:
+                return responses[best]
+            return None
+
+    def put(self, prompt: str, scope: Tuple, response: str, embedding: Optional[np.ndarray] = None) -> None:
+        """
+        Cache a response.
+
+        Args:
+            prompt: Prompt sent to the provider
+            scope: Model, temperature and max_tokens of the call
+            response: Provider response
+            embedding: Normalized prompt embedding, or None for exact matches only
+        """
+        with self._lock:
+            self._exact[(prompt, *scope)] = response
+            if len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+
+            if embedding is None:
+                return
+            entry = self._semantic.get(scope)
+            if entry is None:
+                self._semantic[scope] = (embedding[np.newaxis, :], [response])
+            else:
+                matrix, responses = entry
+                # Oldest rows go first once a scope holds max_entries prompts
+                drop = max(0, len(responses) + 1 - self.max_entries)
+                self._semantic[scope] = (
+                    np.vstack((matrix[drop:], embedding)),
+                    responses[drop:] + [response],
+                )
+            self._semantic.move_to_end(scope)
+            if len(self._semantic) > self.max_entries:
+                self._semantic.popitem(last=False)
+
+
 class LLMSkill(Skill):
     """
     Skill for calling the active LLM for reasoning, analysis, and summarization.
@@ -25,6 +161,11 @@ class LLMSkill(Skill):
             "required": True,
             "description": "Prompt to send to the LLM"
         },
+        "system_prompt": {
+            "type": "string",
+            "required": False,
+            "description": "Fixed prefix shared across calls (provider-side prompt caching)"
+        },
         "max_tokens": {
             "type": "integer",
             "required": False,
@@ -61,6 +202,16 @@ class LLMSkill(Skill):
         }
     }
 
+    Responses to near-deterministic calls (temperature below 0.2) are
+    cached: an identical prompt for the same model and parameters returns
+    the earlier response without calling the provider. With
+    semantic_cache=True a semantically similar prompt does too; prompts
+    longer than the embedding model's input are matched exactly only. A fixed prefix (system_prompt, or the text before a
+    <<<USER>>> line in prompt) is sent as the provider's system prompt,
+    which providers cache server-side, and only the remaining user query is
+    matched against the response cache. get_cache_stats() reports hit
+    rates.
+
     Example:
         skill = LLMSkill(session_manager)
         result = await skill.execute({
@@ -71,18 +222,41 @@ class LLMSkill(Skill):
         print(result["response"])  # LLM summary
     """
 
-    def __init__(self, session_manager: SessionManager):
+    def __init__(
+        self,
+        session_manager: SessionManager,
+        cache_threshold: float = 0.92,
+        cache_size: int = 1024,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        semantic_cache: bool = False,
+    ):
         """
         Initialize LLMSkill.
 
         Args:
             session_manager: SessionManager instance for accessing active LLM
+            cache_threshold: Minimum cosine similarity for a cached response
+                to answer a different prompt
+            cache_size: Maximum cached prompts
+            embedding_model: Sentence embedding model for similarity matching
+            semantic_cache: Also answer similar (not only identical) prompts
+                from the cache; loads the embedding model
         """
         super().__init__(
             name="llm",
             description="Call active LLM for reasoning, analysis, and summarization"
         )
         self.session_manager = session_manager
+        self.embedding_model = embedding_model
+        self.semantic_cache = semantic_cache
+        self._cache = _SemanticCache(cache_threshold, cache_size)
+        self._cache_stats = {
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "uncached": 0,
+            "prefix_requests": 0,
+        }
 
     @property
     def input_schema(self) -> Dict[str, Any]:
@@ -93,6 +267,11 @@ class LLMSkill(Skill):
                 "required": True,
                 "description": "Prompt to send to the LLM"
             },
+            "system_prompt": {
+                "type": "string",
+                "required": False,
+                "description": "Fixed prefix shared across calls (provider-side prompt caching)"
+            },
             "max_tokens": {
                 "type": "integer",
                 "required": False,
@@ -167,6 +346,9 @@ class LLMSkill(Skill):
 
             # Extract parameters
             prompt = input_data.get("prompt")
+            system_prompt = input_data.get("system_prompt")
+            if system_prompt is None and prompt and _USER_SENTINEL in prompt:
+                system_prompt, prompt = (part.strip() for part in prompt.split(_USER_SENTINEL, 1))
             if not prompt:
                 raise SkillExecutionError("Prompt is required")
 
@@ -195,16 +377,57 @@ class LLMSkill(Skill):
                         f"Provider {session.provider_type.value} not available"
                     )
 
-                # Generate response
-                response = await provider.generate(
-                    prompt=prompt,
-                    model_id=session.model_id,
-                    max_tokens=max_tokens,
-                    temperature=temperature
-                )
+                # Reuse the response to an identical or similar user query
+                # under the same prefix (digested so keys don't pin it)
+                cacheable = temperature < _CACHE_MAX_TEMPERATURE
+                response = None
+                embedding = None
+                if cacheable:
+                    prefix_digest = (
+                        hashlib.blake2b(system_prompt.encode(), digest_size=16).digest()
+                        if system_prompt else None
+                    )
+                    scope = (session.model_id, temperature, max_tokens, prefix_digest)
+                    response = self._cache.get_exact(prompt, scope)
+                    if response is not None:
+                        self._cache_stats["exact_hits"] += 1
+                    else:
+                        if self.semantic_cache:
+                            # Encoding is CPU-bound; keep it off the event loop
+                            try:
+                                embedding = await asyncio.to_thread(self._embed, prompt)
+                            except Exception as e:
+                                logger.warning(f"Prompt embedding failed, using exact match only: {str(e)}")
+                        if embedding is not None:
+                            response = self._cache.get_similar(embedding, scope)
+                        self._cache_stats["semantic_hits" if response is not None else "misses"] += 1
+                else:
+                    self._cache_stats["uncached"] += 1
+
+                if response is None:
+                    # The prefix goes out as the system prompt, which the
+                    # provider can serve from its prompt cache
+                    provider_kwargs = {}
+                    if system_prompt:
+                        provider_kwargs["system"] = system_prompt
+                        self._cache_stats["prefix_requests"] += 1
+
+                    # Generate response
+                    response = await provider.generate(
+                        prompt=prompt,
+                        model_id=session.model_id,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **provider_kwargs
+                    )
+                    if cacheable:
+                        self._cache.put(prompt, scope, response, embedding)
 
                 # Estimate tokens (roughly 1.3 tokens per word)
-                estimated_tokens = int((len(prompt.split()) + len(response.split())) * 1.3)
+                words = len(prompt.split()) + len(response.split())
+                if system_prompt:
+                    words += len(system_prompt.split())
+                estimated_tokens = int(words * 1.3)
 
                 return {
                     "response": response,
@@ -216,3 +439,50 @@ class LLMSkill(Skill):
             if isinstance(e, SkillExecutionError):
                 raise
             raise SkillExecutionError(f"LLM execution failed: {str(e)}")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Report how often responses came from the cache.
+
+        Business Purpose: Shows whether caching pays off for an agent's
+        workload (repeated prompts) and how many provider calls carried a
+        cacheable prefix.
+
+        Returns:
+            Counters (exact_hits, semantic_hits, misses, uncached for calls
+            above the cache temperature, prefix_requests) and hit_rate, the
+            share of cacheable calls answered from the cache
+
+        Example:
+            skill.get_cache_stats()
+            # {"exact_hits": 3, "semantic_hits": 1, "misses": 4, ..., "hit_rate": 0.5}
+        """
+        stats: Dict[str, Any] = dict(self._cache_stats)
+        hits = stats["exact_hits"] + stats["semantic_hits"]
+        lookups = hits + stats["misses"]
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        return stats
+
+    def _embed(self, prompt: str) -> Optional[np.ndarray]:
+        """
+        Embed a prompt for the similarity cache.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            Unit-length embedding, or None if no embedding model is available
+            or the prompt is longer than the model's input
+        """
+        embedder = _load_embedder(self.embedding_model)
+        if embedder is None:
+            return None
+        # Lowercase and collapse whitespace so trivial variations embed alike
+        words = prompt.lower().split()
+        # The model truncates longer input, so prompts differing past the
+        # cut-off would embed alike (roughly 1.3 tokens per word)
+        max_seq_length = getattr(embedder, "max_seq_length", None)
+        if max_seq_length and len(words) * 1.3 > max_seq_length:
+            return None
+        text = " ".join(words)
+        return embedder.encode([text], convert_to_numpy=True, normalize_embeddings=True)[0]
@@ -3,7 +3,7 @@
 # Author: Libor Ballaty <libor@arionetworks.com>
 # Created: 2026-01-07
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from myragdb.agent.skills.base import Skill, SkillInfo
 
@@ -37,6 +37,7 @@ class SkillRegistry:
         """Initialize skill registry"""
         self.skills: Dict[str, Skill] = {}
         self._skill_cache: Dict[str, SkillInfo] = {}
+        self._names_cache: Optional[Tuple[str, ...]] = None
 
     def register_skill(self, skill: Skill) -> None:
         """
@@ -54,6 +55,7 @@ class SkillRegistry:
         self.skills[skill.name] = skill
         # Invalidate cache
         self._skill_cache.pop(skill.name, None)
+        self._names_cache = None
 
     def unregister_skill(self, skill_name: str) -> None:
         """
@@ -65,6 +67,7 @@ class SkillRegistry:
         if skill_name in self.skills:
             del self.skills[skill_name]
             self._skill_cache.pop(skill_name, None)
+            self._names_cache = None
 
     def get(self, skill_name: str) -> Optional[Skill]:
         """
@@ -85,16 +88,19 @@ class SkillRegistry:
         Returns:
             List of SkillInfo objects for all registered skills
         """
-        return [skill.get_info() for skill in self.skills.values()]
+        return [self.get_skill_info(skill_name) for skill_name in self.list_names()]
 
-    def list_names(self) -> List[str]:
+    def list_names(self) -> Tuple[str, ...]:
         """
         List names of all available skills.
 
         Returns:
-            List of skill names
+            Immutable snapshot of skill names, cached until the next
+            register/unregister (wrap in list() if a list is needed)
         """
-        return list(self.skills.keys())
+        if self._names_cache is None:
+            self._names_cache = tuple(self.skills)
+        return self._names_cache
 
     def has_skill(self, skill_name: str) -> bool:
         """
@@ -163,6 +169,7 @@ class SkillRegistry:
         """Clear all registered skills"""
         self.skills.clear()
         self._skill_cache.clear()
+        self._names_cache = None
 
     def __repr__(self) -> str:
         return f"SkillRegistry({len(self.skills)} skills)"
@@ -84,6 +84,8 @@ class SlackIntegrationSkill(Skill):
     DESCRIPTION = "Send messages and notifications to Slack"
     VERSION = "1.0.0"
 
+    config: SlackIntegrationConfig
+
     def __init__(self, config: Optional[SlackIntegrationConfig] = None):
         """
         Initialize Slack integration skill.
@@ -91,8 +93,7 @@ class SlackIntegrationSkill(Skill):
         Args:
             config: Slack configuration
         """
-        super().__init__(config or SlackIntegrationConfig())
-        self.config: SlackIntegrationConfig = self.config
+        super().__init__(self.NAME, self.DESCRIPTION, config or SlackIntegrationConfig())
 
         # Load config from environment if not provided
         if not self.config.webhook_url:
@@ -100,6 +101,90 @@ class SlackIntegrationSkill(Skill):
         if not self.config.bot_token:
             self.config.bot_token = os.getenv("SLACK_BOT_TOKEN")
 
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        """Define input schema for Slack integration skill."""
+        return {
+            "action": {
+                "type": "string",
+                "required": False,
+                "default": "send_message",
+                "enum": ["send_message", "send_rich_message", "send_thread", "add_reaction", "upload_file", "update_message"],
+                "description": "Action to perform"
+            },
+            "channel": {
+                "type": "string",
+                "required": False,
+                "description": "Target channel (defaults to config.default_channel)"
+            },
+            "message": {
+                "type": "string",
+                "required": False,
+                "description": "Message text"
+            },
+            "title": {
+                "type": "string",
+                "required": False,
+                "description": "Message title (send_rich_message)"
+            },
+            "blocks": {
+                "type": "array",
+                "required": False,
+                "items": {"type": "object"},
+                "description": "Slack Block Kit blocks (send_rich_message)"
+            },
+            "thread_ts": {
+                "type": "string",
+                "required": False,
+                "description": "Parent message timestamp (send_thread)"
+            },
+            "timestamp": {
+                "type": "string",
+                "required": False,
+                "description": "Message timestamp (add_reaction, update_message)"
+            },
+            "emoji": {
+                "type": "string",
+                "required": False,
+                "default": "thumbsup",
+                "description": "Reaction emoji name (add_reaction)"
+            },
+            "file_path": {
+                "type": "string",
+                "required": False,
+                "description": "Local file to upload (upload_file)"
+            },
+            "file_name": {
+                "type": "string",
+                "required": False,
+                "description": "Name shown for the uploaded file (upload_file)"
+            },
+            "new_message": {
+                "type": "string",
+                "required": False,
+                "description": "Replacement text (update_message)"
+            }
+        }
+
+    @property
+    def output_schema(self) -> Dict[str, Any]:
+        """Define output schema for Slack integration skill."""
+        return {
+            "status": {
+                "type": "string",
+                "enum": ["success", "error"],
+                "description": "Whether the action succeeded"
+            },
+            "data": {
+                "type": "object",
+                "description": "Action details, e.g. channel and message preview"
+            },
+            "error": {
+                "type": "string",
+                "description": "Error message when status is error"
+            }
+        }
+
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """
         Execute Slack integration action.
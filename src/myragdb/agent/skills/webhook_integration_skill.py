@@ -81,6 +81,8 @@ class WebhookIntegrationSkill(Skill):
     DESCRIPTION = "Call webhooks and integrate with HTTP-based services"
     VERSION = "1.0.0"
 
+    config: WebhookIntegrationConfig
+
     def __init__(self, config: Optional[WebhookIntegrationConfig] = None):
         """
         Initialize webhook integration skill.
@@ -88,8 +90,82 @@ class WebhookIntegrationSkill(Skill):
         Args:
             config: Webhook configuration
         """
-        super().__init__(config or WebhookIntegrationConfig())
-        self.config: WebhookIntegrationConfig = self.config
+        super().__init__(self.NAME, self.DESCRIPTION, config or WebhookIntegrationConfig())
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        """Define input schema for webhook integration skill."""
+        return {
+            "action": {
+                "type": "string",
+                "required": False,
+                "default": "call_webhook",
+                "enum": ["call_webhook", "verify_signature", "trigger_workflow", "batch_webhooks"],
+                "description": "Action to perform"
+            },
+            "url": {
+                "type": "string",
+                "required": False,
+                "description": "Webhook URL"
+            },
+            "method": {
+                "type": "string",
+                "required": False,
+                "default": "POST",
+                "enum": ["GET", "POST", "PUT", "DELETE", "PATCH"],
+                "description": "HTTP method"
+            },
+            "payload": {
+                "type": "object",
+                "required": False,
+                "description": "Request body, or the signed data for verify_signature"
+            },
+            "headers": {
+                "type": "object",
+                "required": False,
+                "description": "Custom request headers"
+            },
+            "auth_type": {
+                "type": "string",
+                "required": False,
+                "enum": ["bearer", "basic", "hmac", "api_key"],
+                "description": "Authentication type"
+            },
+            "auth_value": {
+                "type": "string",
+                "required": False,
+                "description": "Authentication value"
+            },
+            "signature": {
+                "type": "string",
+                "required": False,
+                "description": "Signature to verify (verify_signature)"
+            },
+            "secret": {
+                "type": "string",
+                "required": False,
+                "description": "Shared secret for signing and verification"
+            }
+        }
+
+    @property
+    def output_schema(self) -> Dict[str, Any]:
+        """Define output schema for webhook integration skill."""
+        return {
+            "status": {
+                "type": "string",
+                "enum": ["success", "error"],
+                "description": "Whether the action succeeded"
+            },
+            "data": {
+                "type": "object",
+                "description": "Response details, e.g. status code and parsed body"
+            },
+            "error": {
+                "type": "string",
+                "description": "Error message when status is error"
+            }
+        }
 
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """
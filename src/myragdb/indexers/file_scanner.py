@@ -4,8 +4,9 @@
 # Created: 2026-01-04
 
 import os
+import sqlite3
 from pathlib import Path
-from typing import List, Iterator, Optional
+from typing import List, Iterator, Optional, Sequence
 from dataclasses import dataclass, field
 import fnmatch
 import chardet
@@ -51,6 +52,8 @@ class ScannedFile:
     relative_path: str  # Path relative to repository/directory root
     repository_name: Optional[str] = None  # Repository name (None if from directory)
     directory_id: Optional[int] = None  # Directory ID (None if from repository)
+    unchanged: bool = False  # True if scan cache shows no change (content not read)
+    mtime: Optional[float] = None  # Modification time when the file was scanned
 
 
 class FileScanner:
@@ -64,17 +67,40 @@ class FileScanner:
         scanner = FileScanner(repository_config)
         for file in scanner.scan():
             print(f"Found: {file.file_path}")
+
+        # Skip files both indexers handled in a previous run
+        scanner = FileScanner(
+            repository_config,
+            cache_path=Path("data/scan_cache.db"),
+            cache_indexers=("keyword", "vector"),
+        )
+        changed = [f for f in scanner.scan() if not f.unchanged]
+        # ... index changed files, then:
+        scanner.record_indexed(changed, "keyword")
     """
 
-    def __init__(self, repository_config: RepositoryConfig):
+    def __init__(
+        self,
+        repository_config: RepositoryConfig,
+        cache_path: Optional[Path] = None,
+        cache_indexers: Sequence[str] = (),
+    ):
         """
         Initialize file scanner for a repository.
 
         Args:
             repository_config: Configuration for the repository to scan
+            cache_path: Optional SQLite scan cache; files that every indexer in
+                        cache_indexers recorded (via record_indexed) with the
+                        current mtime and size are yielded with unchanged=True
+                        and without reading their content
+            cache_indexers: Indexers the caller will run (e.g. "keyword",
+                        "vector"); with none, every file counts as changed
         """
         self.config = repository_config
         self.repo_path = Path(repository_config.path)
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.cache_indexers = tuple(cache_indexers)
 
     def scan(self) -> Iterator[ScannedFile]:
         """
@@ -92,15 +118,112 @@ class FileScanner:
             file_count = sum(1 for _ in scanner.scan())
             print(f"Found {file_count} files")
         """
-        for file_path in self._discover_files():
-            try:
-                scanned_file = self._process_file(file_path)
-                if scanned_file:
-                    yield scanned_file
-            except Exception as e:
-                # Log error but continue scanning
-                print(f"Error processing {file_path}: {e}")
-                continue
+        cache = self._open_scan_cache() if self.cache_path and self.cache_indexers else None
+
+        try:
+            for file_path in self._discover_files():
+                try:
+                    if cache is not None:
+                        scanned_file = self._process_file_cached(file_path, cache)
+                    else:
+                        scanned_file = self._process_file(file_path)
+                    if scanned_file:
+                        yield scanned_file
+                except Exception as e:
+                    # Log error but continue scanning
+                    print(f"Error processing {file_path}: {e}")
+                    continue
+        finally:
+            if cache is not None:
+                cache.close()
+
+    def record_indexed(self, files: List[ScannedFile], indexer: str) -> None:
+        """
+        Record in the scan cache that an indexer has indexed these files.
+
+        Business Purpose: Rows are written only after indexing, one per
+        indexer, so a keyword-only (--no-vector) run or an interrupted run
+        doesn't hide files from indexers that never saw them.
+
+        Args:
+            files: Files just indexed (read by scan(), so mtime is set)
+            indexer: Indexer name, as passed in cache_indexers
+        """
+        if self.cache_path is None:
+            return
+
+        conn = self._open_scan_cache()
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO indexed_files (path, indexer, mtime, size) VALUES (?, ?, ?, ?)",
+                [
+                    (f.file_path, indexer, f.mtime, f.size_bytes)
+                    for f in files if f.mtime is not None
+                ]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _open_scan_cache(self) -> sqlite3.Connection:
+        """
+        Open (creating if needed) the SQLite scan cache.
+
+        Business Purpose: Persists the mtime and size each indexer last saw
+        for every file so repeat scans only read files that changed since
+        they were indexed.
+
+        Returns:
+            Open SQLite connection to the scan cache
+        """
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.cache_path))
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS indexed_files (
+                path TEXT NOT NULL,
+                indexer TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                PRIMARY KEY (path, indexer)
+            )
+        """)
+        return conn
+
+    def _process_file_cached(self, file_path: Path, cache: sqlite3.Connection) -> Optional[ScannedFile]:
+        """
+        Process a file, skipping the content read if every indexer is current.
+
+        Args:
+            file_path: Path to file to process
+            cache: Open scan cache connection (only read here)
+
+        Returns:
+            ScannedFile (flagged unchanged=True on a cache hit) or None
+        """
+        stat = file_path.stat()
+        absolute_path = str(file_path.absolute())
+
+        current = {
+            indexer
+            for indexer, mtime, size in cache.execute(
+                "SELECT indexer, mtime, size FROM indexed_files WHERE path = ?", (absolute_path,)
+            )
+            if mtime == stat.st_mtime and size == stat.st_size
+        }
+
+        if current.issuperset(self.cache_indexers):
+            return ScannedFile(
+                file_path=absolute_path,
+                repository_name=self.config.name,
+                content="",
+                file_type=file_path.suffix,
+                size_bytes=stat.st_size,
+                relative_path=str(file_path.relative_to(self.repo_path)),
+                unchanged=True,
+                mtime=stat.st_mtime
+            )
+
+        return self._process_file(file_path)
 
     def _discover_files(self) -> Iterator[Path]:
         """
@@ -225,7 +348,8 @@ class FileScanner:
         """
         try:
             # Get file info
-            size_bytes = file_path.stat().st_size
+            stat = file_path.stat()
+            size_bytes = stat.st_size
 
             # Skip very large files (> 10MB)
             if size_bytes > 10 * 1024 * 1024:
@@ -249,7 +373,8 @@ class FileScanner:
                 content=content,
                 file_type=file_type,
                 size_bytes=size_bytes,
-                relative_path=relative_path
+                relative_path=relative_path,
+                mtime=stat.st_mtime
             )
 
         except Exception as e:
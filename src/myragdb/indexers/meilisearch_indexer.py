@@ -345,6 +345,32 @@ class MeilisearchIndexer:
 
         return indexed
 
+    def index_files(
+        self,
+        files: List[ScannedFile],
+        incremental: bool = True,
+        batch_size: int = 50000
+    ) -> int:
+        """
+        Index multiple files (same call shape as VectorIndexer.index_files).
+
+        Business Purpose: Lets callers drive the keyword and vector indexers
+        through one method name instead of special-casing each backend.
+
+        Args:
+            files: List of files to index
+            incremental: Only index files modified since last indexing
+            batch_size: Documents per batch (default: 50,000)
+
+        Returns:
+            Number of files successfully indexed
+
+        Example:
+            for indexer in (keyword_indexer, vector_indexer):
+                indexer.index_files(files, incremental=True)
+        """
+        return self.index_files_batch(files, batch_size=batch_size, incremental=incremental)
+
     def index_directory(
         self,
         directory_path: str,
@@ -132,6 +132,7 @@ class ChatGPTProvider(CloudLLMProvider):
             max_tokens: Maximum tokens to generate
             temperature: Temperature for randomness
             **kwargs: Additional provider-specific parameters
+                (system: system prompt)
 
         Returns:
             Generated text response
@@ -141,9 +142,14 @@ class ChatGPTProvider(CloudLLMProvider):
         """
         try:
             client = self.client
+            messages = [{"role": "user", "content": prompt}]
+            system = kwargs.get("system")
+            if system:
+                # OpenAI caches repeated message prefixes automatically
+                messages.insert(0, {"role": "system", "content": system})
             response = await client.chat.completions.create(
                 model=model_id,
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 max_tokens=max_tokens,
                 temperature=temperature
             )
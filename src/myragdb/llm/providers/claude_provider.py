@@ -141,6 +141,7 @@ class ClaudeProvider(CloudLLMProvider):
             max_tokens: Maximum tokens to generate
             temperature: Temperature for randomness
             **kwargs: Additional provider-specific parameters
+                (system: system prompt, marked for prompt caching)
 
         Returns:
             Generated text response
@@ -150,11 +151,21 @@ class ClaudeProvider(CloudLLMProvider):
         """
         try:
             client = self.client
+            request = {}
+            system = kwargs.get("system")
+            if system:
+                # Cached server-side, so repeated calls skip its prefill
+                request["system"] = [{
+                    "type": "text",
+                    "text": system,
+                    "cache_control": {"type": "ephemeral"},
+                }]
             response = await client.messages.create(
                 model=model_id,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                **request
             )
             # Extract text from response
             text_content = next(
@@ -124,6 +124,7 @@ class GeminiProvider(CloudLLMProvider):
             max_tokens: Maximum tokens to generate
             temperature: Temperature for randomness
             **kwargs: Additional provider-specific parameters
+                (system: system prompt)
 
         Returns:
             Generated text response
@@ -133,7 +134,7 @@ class GeminiProvider(CloudLLMProvider):
         """
         try:
             genai = self.client
-            model = genai.GenerativeModel(model_id)
+            model = genai.GenerativeModel(model_id, system_instruction=kwargs.get("system"))
             generation_config = {
                 "max_output_tokens": max_tokens,
                 "temperature": temperature,
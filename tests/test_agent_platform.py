@@ -9,8 +9,8 @@ from typing import Dict, Any
 
 from myragdb.agent.skills import (
     Skill, SkillRegistry, SearchSkill, LLMSkill,
-    CodeAnalysisSkill, ReportSkill, SQLSkill,
-    SkillExecutionError
+    CodeAnalysisSkill, ReportSkill, SQLSkill, CodeGenerationSkill,
+    DataVisualizationSkill, SkillExecutionError
 )
 from myragdb.agent.orchestration import (
     WorkflowEngine, WorkflowExecution, TemplateEngine, AgentOrchestrator
@@ -83,6 +83,9 @@ class TestSkillRegistry:
         assert "skill2" in names
         assert len(names) == 2
 
+        registry.unregister_skill("skill2")
+        assert registry.list_names() == ("skill1",)
+
     def test_duplicate_skill_registration(self):
         """Test that duplicate skill registration raises error."""
         registry = SkillRegistry()
@@ -104,6 +107,25 @@ class TestSkillRegistry:
         with pytest.raises(ValueError):
             registry.register_skill(TestSkill())
 
+    def test_configurable_skills_store_config(self):
+        """Configurable skills pass name, description and config to Skill."""
+        from myragdb.agent.skills import SlackIntegrationSkill, WebhookIntegrationSkill
+        from myragdb.agent.skills.webhook_integration_skill import WebhookIntegrationConfig
+
+        config = WebhookIntegrationConfig(max_retries=1)
+        webhook = WebhookIntegrationSkill(config)
+        slack = SlackIntegrationSkill()
+
+        assert webhook.config is config
+        assert slack.config.default_channel == "#general"
+        assert slack.get_info().name == "slack_integration"
+        assert "url" in webhook.get_info().input_schema
+
+        registry = SkillRegistry()
+        registry.register_skill(slack)
+        registry.register_skill(webhook)
+        assert registry.list_names() == ("slack_integration", "webhook_integration")
+
 
 class TestCodeAnalysisSkill:
     """Test CodeAnalysisSkill."""
@@ -159,6 +181,128 @@ const verify = async (token) => {
         assert len(result["structures"]) > 0
         assert all("function" in s["type"].lower() for s in result["structures"])
 
+    @pytest.mark.asyncio
+    async def test_repeated_analysis_is_isolated(self):
+        """Test cached analysis results are not shared between calls."""
+        skill = CodeAnalysisSkill()
+        input_data = {"code": "import os\n\ndef handler(event):\n    return event\n"}
+
+        first = await skill.execute(input_data)
+        first["structures"][0]["name"] = "changed"
+        first["imports"].append("import sys")
+
+        second = await skill.execute(input_data)
+        assert second["structures"][0]["name"] == "handler"
+        assert second["imports"] == ["import os"]
+
+    @pytest.mark.asyncio
+    async def test_analysis_type_limits_output(self):
+        """Test only the parts requested by analysis_type are returned."""
+        skill = CodeAnalysisSkill()
+        code = "import os\n\nclass Config:\n    pass\n\ndef load():\n    pass\n"
+
+        imports = await skill.execute({"code": code, "analysis_type": "imports"})
+        assert imports["imports"] == ["import os"]
+        assert imports["structures"] == []
+
+        classes = await skill.execute({"code": code, "analysis_type": "classes"})
+        assert [s["name"] for s in classes["structures"]] == ["Config"]
+        assert classes["imports"] == []
+
+    @pytest.mark.asyncio
+    async def test_complexity_counts_branches(self):
+        """Test complexity reflects control flow, not only definitions."""
+        skill = CodeAnalysisSkill()
+        branches = "".join(f"    if x == {i}:\n        return {i}\n" for i in range(12))
+        code = f"def dispatch(x):\n{branches}    return None\n"
+
+        result = await skill.execute({"code": code})
+        assert len(result["structures"]) == 1
+        assert result["complexity_estimate"] == "medium"
+
+        result = await skill.execute({"code": "def f():\n    return 1\n"})
+        assert result["complexity_estimate"] == "low"
+
+    @pytest.mark.asyncio
+    async def test_streamed_python_analysis_matches_ast(self, monkeypatch):
+        """Test the token-based path for large files matches the AST path."""
+        from myragdb.agent.skills import code_analysis_skill
+
+        code = (
+            "import os, sys as system\n"
+            "from . import (a, b as c,)\n"
+            "try:\n"
+            "    import ujson as json\n"
+            "except ImportError:\n"
+            "    import json\n"
+            "\n"
+            "@decorator\n"
+            "class Loader(Base):\n"
+            "    '''Load things.'''\n"
+            "    def method(self):\n"
+            "        pass\n"
+            "\n"
+            "async def fetch(url: str) -> bytes: ('Fetch' ' a URL')\n"
+        )
+        expected = await CodeAnalysisSkill().execute({"code": code})
+
+        monkeypatch.setattr(code_analysis_skill, "_STREAM_PARSE_MIN_SIZE", 0)
+        streamed = await CodeAnalysisSkill().execute({"code": code + "\n"})
+
+        assert streamed["structures"] == expected["structures"]
+        assert streamed["imports"] == expected["imports"]
+
+    @pytest.mark.asyncio
+    async def test_execute_batch(self):
+        """Test batch analysis keeps input order across languages."""
+        skill = CodeAnalysisSkill()
+
+        results = await skill.execute_batch([
+            {"code": "def handler():\n    pass\n"},
+            {"code": "class Widget {}\n", "language": "javascript"},
+        ])
+
+        assert [r["language"] for r in results] == ["python", "javascript"]
+        assert results[0]["structures"][0]["name"] == "handler"
+        assert results[1]["structures"][0]["name"] == "Widget"
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_large_items_in_processes(self, monkeypatch):
+        """Test large batch items analyzed in worker processes match execute."""
+        from myragdb.agent.skills import code_analysis_skill
+
+        skill = CodeAnalysisSkill()
+        items = [{"code": f"import os\n\ndef task_{i}():\n    pass\n"} for i in range(3)]
+        expected = [await skill.execute(item) for item in items]
+
+        monkeypatch.setattr(code_analysis_skill, "_PROCESS_POOL_MIN_SIZE", 0)
+        try:
+            assert await skill.execute_batch(items) == expected
+            # Later batches reuse the same bounded pool
+            pool = CodeAnalysisSkill._process_pool
+            assert pool._max_workers <= code_analysis_skill._PROCESS_POOL_MAX_WORKERS
+            assert pool._mp_context.get_start_method() == "spawn"
+            assert await skill.execute_batch(items) == expected
+            assert CodeAnalysisSkill._process_pool is pool
+        finally:
+            CodeAnalysisSkill.close_process_pool()
+        assert CodeAnalysisSkill._process_pool is None
+
+    @pytest.mark.asyncio
+    async def test_incremental_python_analysis(self):
+        """Test re-analysis of edited code under a code_id."""
+        skill = CodeAnalysisSkill()
+        code = "import os\n\ndef first():\n    pass\n\nclass Second:\n    pass\n"
+
+        await skill.execute({"code": code, "code_id": "buffer"})
+        edited = code.replace("def first():\n", "import sys\n\ndef first(arg):\n")
+        result = await skill.execute({"code": edited, "code_id": "buffer"})
+
+        assert result["imports"] == ["import os", "import sys"]
+        assert [(s["name"], s["line"]) for s in result["structures"]] == [
+            ("first", 5), ("Second", 8)
+        ]
+
 
 class TestReportSkill:
     """Test ReportSkill."""
@@ -203,6 +347,416 @@ class TestReportSkill:
         assert parsed["title"] == "JSON Report"
 
 
+class StemEmbedder:
+    """Stand-in sentence embedder for semantic cache tests."""
+
+    def encode(self, texts, **kwargs):
+        import numpy as np
+
+        # Bag of word stems, so plural/singular variants embed alike
+        vectors = np.zeros((len(texts), 16))
+        for row, text in enumerate(texts):
+            for word in text.split():
+                vectors[row, sum(map(ord, word.rstrip("s"))) % 16] += 1
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class TestLLMSkill:
+    """Test LLMSkill response caching."""
+
+    @staticmethod
+    def _skill(monkeypatch, **options):
+        from types import SimpleNamespace
+        from myragdb.agent.skills import llm_skill
+
+        class Provider:
+            calls = 0
+            systems = []
+
+            async def generate(self, prompt, model_id, max_tokens, temperature, **kwargs):
+                Provider.calls += 1
+                Provider.systems.append(kwargs.get("system"))
+                return f"answer {Provider.calls}"
+
+        monkeypatch.setitem(llm_skill._EMBEDDERS, "test-embedder", StemEmbedder())
+        provider = Provider()
+        session = SimpleNamespace(
+            provider_type=SimpleNamespace(value="gemini"),
+            model_id="test-model",
+            provider_manager=SimpleNamespace(get_provider=lambda name: provider),
+        )
+        manager = SimpleNamespace(get_active_session=lambda: session)
+        return LLMSkill(manager, embedding_model="test-embedder", **options), provider
+
+    @pytest.mark.asyncio
+    async def test_similar_prompt_served_from_cache(self, monkeypatch):
+        """Near-duplicate low-temperature prompts reuse the response."""
+        skill, provider = self._skill(monkeypatch, semantic_cache=True)
+
+        first = await skill.execute({"prompt": "Summarize the flows", "temperature": 0.0})
+        exact = await skill.execute({"prompt": "Summarize the flows", "temperature": 0.0})
+        similar = await skill.execute({"prompt": "summarize  the flow", "temperature": 0.0})
+        other = await skill.execute({"prompt": "List every table name", "temperature": 0.0})
+
+        assert first["response"] == exact["response"] == similar["response"] == "answer 1"
+        assert other["response"] == "answer 2"
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_similarity_matching_is_opt_in(self, monkeypatch):
+        """Without semantic_cache only identical prompts hit, and no model loads."""
+        from myragdb.agent.skills import llm_skill
+
+        skill, provider = self._skill(monkeypatch)
+        monkeypatch.setattr(llm_skill, "_load_embedder", lambda name: pytest.fail("embedder loaded"))
+
+        await skill.execute({"prompt": "Summarize the flows", "temperature": 0.0})
+        await skill.execute({"prompt": "Summarize the flows", "temperature": 0.0})
+        await skill.execute({"prompt": "summarize  the flow", "temperature": 0.0})
+
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_long_prompt_matched_exactly(self, monkeypatch):
+        """Prompts past the model's max_seq_length skip similarity matching."""
+        skill, provider = self._skill(monkeypatch, semantic_cache=True)
+        monkeypatch.setattr(StemEmbedder, "max_seq_length", 8, raising=False)
+
+        prompt = "Summarize the flows in these files about auth"
+        await skill.execute({"prompt": prompt, "temperature": 0.0})
+        await skill.execute({"prompt": prompt, "temperature": 0.0})
+        # Would be a similarity hit if it fit the model's input
+        await skill.execute({"prompt": "summarize the flow in these file about auth", "temperature": 0.0})
+
+        assert provider.calls == 2
+        assert skill.get_cache_stats()["exact_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_embedder_load_failure_falls_back_to_exact(self, monkeypatch, caplog):
+        """A model that fails to load is logged once; exact matching still works."""
+        import sys
+        from myragdb.agent.skills import llm_skill
+
+        skill, provider = self._skill(monkeypatch, semantic_cache=True)
+        skill.embedding_model = "missing-model"
+        monkeypatch.setattr(llm_skill, "_EMBEDDERS", {})
+        monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+
+        for prompt in ("Summarize the flows", "Summarize the flows", "summarize the flow"):
+            await skill.execute({"prompt": prompt, "temperature": 0.0})
+
+        assert provider.calls == 2
+        assert llm_skill._EMBEDDERS == {"missing-model": None}
+        assert sum("missing-model" in r.getMessage() for r in caplog.records) == 1
+
+    @pytest.mark.asyncio
+    async def test_sampled_prompt_not_cached(self, monkeypatch):
+        """Calls at higher temperatures always reach the provider."""
+        skill, provider = self._skill(monkeypatch)
+
+        await skill.execute({"prompt": "Suggest a name", "temperature": 0.7})
+        await skill.execute({"prompt": "Suggest a name", "temperature": 0.7})
+
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_prefix_sent_as_system_prompt(self, monkeypatch):
+        """The prompt prefix goes to the provider and scopes the cache."""
+        skill, provider = self._skill(monkeypatch)
+
+        await skill.execute({"prompt": "You review code.\n<<<USER>>>\nCheck auth", "temperature": 0.0})
+        await skill.execute({"prompt": "Check auth", "system_prompt": "You review code.", "temperature": 0.0})
+        await skill.execute({"prompt": "Check auth", "system_prompt": "You write tests.", "temperature": 0.0})
+
+        assert provider.systems == ["You review code.", "You write tests."]
+        stats = skill.get_cache_stats()
+        assert stats["exact_hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["prefix_requests"] == 2
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+class TestCodeGenerationSkill:
+    """Test CodeGenerationSkill."""
+
+    @staticmethod
+    def _cached_skill(monkeypatch, **options):
+        from myragdb.agent.skills import code_generation_skill
+        from myragdb.agent.skills.code_generation_skill import CodeGenerationConfig
+
+        monkeypatch.setitem(code_generation_skill._EMBEDDERS, "test-embedder", StemEmbedder())
+        return CodeGenerationSkill(CodeGenerationConfig(
+            semantic_cache_enabled=True, embedding_model="test-embedder", **options
+        ))
+
+    def test_skill_info(self):
+        """The skill can be built with its default config and registered."""
+        skill = CodeGenerationSkill()
+        registry = SkillRegistry()
+        registry.register_skill(skill)
+
+        info = registry.get("code_generation").get_info()
+        assert "python" in info.input_schema["language"]["enum"]
+        assert "generate" in info.input_schema["action"]["enum"]
+        assert skill._response_cache is None
+
+    def test_semantic_cache_hit_miss_and_ttl(self, monkeypatch):
+        """Similar prompts hit, different ones miss, TTL rows expire."""
+        import numpy as np
+        from myragdb.agent.skills.code_generation_skill import _SemanticCache
+
+        clock = [100.0]
+        monkeypatch.setattr("myragdb.agent.skills.code_generation_skill.time.monotonic", lambda: clock[0])
+        embed = StemEmbedder().encode
+        cache = _SemanticCache(threshold=0.92, max_entries=4)
+        key = ("generate", "python", "f", ())
+
+        cache.store(key, {"code": "factorial"}, embed(["calculate factorial"])[0])
+        cache.store(key, {"code": "sorted"}, embed(["sort list"])[0], ttl=10)
+        assert cache.lookup(key, embed(["calculate factorials"])[0]) == {"code": "factorial"}
+        assert cache.lookup(key, embed(["parse json file"])[0]) is None
+        assert cache.lookup(("generate", "go", "f", ()), embed(["calculate factorial"])[0]) is None
+        assert cache.lookup(key, embed(["sort lists"])[0]) == {"code": "sorted"}
+
+        clock[0] += 11
+        assert cache.lookup(key, embed(["sort lists"])[0]) is None
+        assert cache.lookup(key, embed(["calculate factorial"])[0]) == {"code": "factorial"}
+
+        exact = ("documentation", "python", "", b"digest")
+        cache.store(exact, {"doc": 1})
+        assert cache.lookup(exact) == {"doc": 1}
+        assert isinstance(cache._entries[key][0], np.ndarray)
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_keeps_request_order(self, monkeypatch):
+        """Batched results line up with requests and near-duplicates reuse the cache."""
+        skill = self._cached_skill(monkeypatch)
+        generated = []
+        original = CodeGenerationSkill._generate_code
+
+        async def generate_code(self, language, description, kwargs):
+            generated.append(description)
+            return await original(self, language, description, kwargs)
+
+        monkeypatch.setattr(CodeGenerationSkill, "_generate_code", generate_code)
+        results = await skill.execute_batch([
+            {"action": "generate", "description": "calculate factorial"},
+            {"action": "format", "code": "x = 1"},
+            {"action": "generate", "description": "calculate factorials"},
+            {"action": "generate", "language": "cobol", "description": "calculate factorial"},
+        ])
+
+        assert [r["status"] for r in results] == ["success", "success", "success", "error"]
+        assert results[0]["data"]["code"] == results[2]["data"]["code"]
+        assert results[1]["data"]["formatted_code"] == "x = 1"
+        assert generated == ["calculate factorial"]
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_matches_execute_without_cache(self, monkeypatch):
+        """Without the semantic cache a batch returns what execute() would, embedding nothing."""
+        skill = CodeGenerationSkill()
+        monkeypatch.setattr(CodeGenerationSkill, "_embed", lambda self, prompts: pytest.fail("embedded"))
+        requests = [
+            {"action": "generate", "description": "calculate factorial", "function_name": "factorial"},
+            {"action": "generate_tests", "code": "def add(a, b):\n    return a + b\n"},
+            {"action": "refactor", "code": "x=1", "language": "ruby"},
+        ]
+
+        batch = await skill.execute_batch(requests)
+
+        assert batch == [await skill.execute(**request) for request in requests]
+        assert await skill.execute_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_degrades_without_embedder(self, monkeypatch):
+        """An embedding model that fails to load leaves requests uncached, not failing."""
+        import sys
+        from myragdb.agent.skills import code_generation_skill
+        from myragdb.agent.skills.code_generation_skill import CodeGenerationConfig
+
+        monkeypatch.setattr(code_generation_skill, "_EMBEDDERS", {})
+        monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+        skill = CodeGenerationSkill(CodeGenerationConfig(semantic_cache_enabled=True))
+
+        result = await skill.execute(action="generate", description="calculate factorial")
+        results = await skill.execute_batch([{"action": "generate", "description": "sort list"}])
+
+        assert result["status"] == "success"
+        assert results[0]["status"] == "success"
+        assert code_generation_skill._EMBEDDERS == {"all-MiniLM-L6-v2": None}
+        assert not skill._response_cache._entries
+
+    @pytest.mark.asyncio
+    async def test_prefetched_variant_served_until_ttl(self, monkeypatch):
+        """A prefetched variation is served from the cache, then expires."""
+        skill = self._cached_skill(monkeypatch, prefetch_enabled=True, prefetch_fanout=1, prefetch_ttl=0.2)
+        generated = []
+        original = CodeGenerationSkill._generate_code
+
+        async def generate_code(self, language, description, kwargs):
+            generated.append(description)
+            return await original(self, language, description, kwargs)
+
+        monkeypatch.setattr(CodeGenerationSkill, "_generate_code", generate_code)
+        try:
+            first = await skill.execute(action="generate", description="calculate factorial")
+            await skill._prefetch_q.join()
+            assert generated == ["calculate factorial", "calculate factorial using recursion"]
+
+            variant = await skill.execute(action="generate", description="calculate factorial using recursion")
+            assert len(generated) == 2
+            variant["data"]["code"] = "mutated"
+            again = await skill.execute(action="generate", description="calculate factorial using recursion")
+            assert again["data"]["description"] == "calculate factorial using recursion"
+            assert again["data"]["code"] != "mutated"
+            assert first["data"]["description"] == "calculate factorial"
+
+            await asyncio.sleep(0.25)
+            key = next(iter(skill._response_cache._entries))
+            embedding = StemEmbedder().encode(["calculate factorial using recursion"])[0]
+            assert skill._response_cache.lookup(key, embedding) is None
+        finally:
+            task = skill._prefetch_task
+            await skill.close_prefetch()
+        assert task.cancelled()
+        assert skill._prefetch_task is None
+
+        # Closing twice is harmless, and a later miss starts a new worker
+        await skill.close_prefetch()
+        await skill.execute(action="generate", description="sort list")
+        restarted = skill._prefetch_task
+        assert restarted is not None and restarted is not task
+        await skill.close_prefetch()
+        assert restarted.cancelled()
+
+    def test_count_different_lines(self):
+        """Appended and rewritten lines are counted once each."""
+        skill = CodeGenerationSkill()
+        original = "a = 1\nb = 2"
+
+        assert skill._count_different_lines(original, original) == 0
+        assert skill._count_different_lines(original, original + "\n# note") == 1
+        assert skill._count_different_lines(original, original + "\na = 1") == 0
+        assert skill._count_different_lines(original, "a = 1\nb = 3") == 2
+        assert skill._count_different_lines(original, original + "c = 3") == 2
+
+    @pytest.mark.asyncio
+    async def test_refactor_lines_changed_matches_set_difference(self):
+        """The appended-lines shortcut agrees with diffing every line."""
+        skill = CodeGenerationSkill()
+        code = "import os\n\ndef f(x):\n    return x\n"
+
+        for improvements in (["readability"], ["security", "testing"], ["readability", "performance", "security", "testing"]):
+            result = await skill.execute(action="refactor", code=code, improvements=improvements)
+            refactored = result["data"]["refactored_code"]
+            expected = len(set(code.split("\n")) ^ set(refactored.split("\n")))
+            assert result["data"]["lines_changed"] == expected == len(improvements)
+
+    @pytest.mark.asyncio
+    async def test_optimize_reports_list_membership_tests_only(self):
+        """Iterating a list literal is not reported as a membership test."""
+        skill = CodeGenerationSkill()
+
+        def issues(code):
+            return [
+                (s["issue"], s.get("line"))
+                for s in skill._analyze_code_performance(code, "python")
+            ]
+
+        membership = "Membership test against a list literal"
+        assert (membership, 2) in issues("def f(x):\n    if x in [1, 2, 3]:\n        return x\n")
+        assert membership not in dict(issues("def f():\n    for x in [1, 2, 3]:\n        print(x)\n"))
+        assert (membership, 4) in issues("if x:\n    pass\n\nelif x not in [1, 2]:\n    pass\n")
+        assert membership not in dict(issues("squares = [x * x for x in [1, 2, 3]]\n"))
+        assert membership not in dict(issues("if ready:\n    items = [1, 2]\n"))
+
+        result = await skill.execute(
+            action="optimize", language="python",
+            code="while token not in ['a', 'b']:\n    token = read()\n",
+        )
+        assert result["data"]["suggestions"][0]["issue"] == membership
+
+
+class TestDataVisualizationSkill:
+    """Test DataVisualizationSkill."""
+
+    def test_downsample_only_line_charts(self):
+        """Line charts are thinned; pie and bar charts keep every value."""
+        from myragdb.agent.skills.data_visualization_skill import ChartData, VisualizationConfig
+
+        skill = DataVisualizationSkill(VisualizationConfig(max_data_points=10))
+        labels = [str(i) for i in range(100)]
+        datasets = [{"label": "values", "data": list(range(100))}]
+
+        line = skill._downsample(ChartData("Line", "line", labels, datasets))
+        assert len(line.labels) == 10
+        assert list(line.datasets[0]["data"][[0, -1]]) == [0, 99]
+
+        for chart_type in ("pie", "bar"):
+            chart = ChartData(chart_type, chart_type, labels, datasets)
+            assert skill._downsample(chart) is chart
+
+    @pytest.mark.asyncio
+    async def test_png_export_end_to_end(self):
+        """A long line chart and a bar chart render to PNG through execute()."""
+        pytest.importorskip("matplotlib")
+        import base64
+        from myragdb.agent.skills.data_visualization_skill import VisualizationConfig
+
+        skill = DataVisualizationSkill(VisualizationConfig(max_data_points=50))
+        labels = [str(i) for i in range(200)]
+        for chart_type in ("line", "bar"):
+            result = await skill.execute(
+                chart_type=chart_type, labels=labels, export_format="png",
+                datasets=[{"label": "values", "data": list(range(200))}],
+            )
+            assert result["status"] == "success"
+            assert result["data"]["data_points"] == 200
+            png = base64.b64decode(result["data"]["chart_base64_png"])
+            assert png[:8] == b"\x89PNG\r\n\x1a\n"
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_matches_execute(self):
+        """Batched charts come back in order, each as execute() would return it."""
+        skill = DataVisualizationSkill()
+        requests = [
+            {"chart_type": "line", "title": "Revenue", "labels": ["Jan", "Feb"], "datasets": [{"label": "r", "data": [1, 2]}]},
+            {"chart_type": "gantt", "labels": ["A"], "datasets": [{"data": [1]}]},
+            {"chart_type": "bar", "labels": ["A", "B"], "datasets": [{"data": [5, 6]}, {"label": "empty"}], "export_format": "svg"},
+            {"chart_type": "pie", "labels": [], "datasets": []},
+        ]
+
+        def without_timestamp(result):
+            if "data" in result:
+                result["data"]["metadata"].pop("generated_at")
+            return result
+
+        results = [without_timestamp(r) for r in await skill.execute_batch(requests)]
+
+        assert [r["status"] for r in results] == ["success", "error", "success", "error"]
+        assert results == [without_timestamp(await skill.execute(**request)) for request in requests]
+        assert results[2]["data"]["data_points"] == 2
+        assert await skill.execute_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_failure_returns_separate_errors(self, monkeypatch):
+        """When the whole batch fails, every request gets its own error dict."""
+        from myragdb.agent.skills.data_visualization_skill import BatchChartData
+
+        def broken(cls, requests, default_chart_type):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(BatchChartData, "from_requests", classmethod(broken))
+        skill = DataVisualizationSkill()
+        request = {"labels": ["A"], "datasets": [{"data": [1]}]}
+
+        results = await skill.execute_batch([request, request])
+
+        assert [r["status"] for r in results] == ["error", "error"]
+        assert "boom" in results[0]["error"]
+        assert results[0] is not results[1]
+
+
 class TestWorkflowEngine:
     """Test WorkflowEngine."""
 
@@ -293,6 +847,49 @@ class TestWorkflowEngine:
         assert execution.status == "completed"
         assert execution.final_result["result"] == "consumed_processed_test"
 
+    @pytest.mark.asyncio
+    async def test_step_on_error_continue(self):
+        """Test on_error: continue applies to the step that failed."""
+        registry = SkillRegistry()
+        engine = WorkflowEngine(registry)
+
+        class EchoSkill(Skill):
+            def __init__(self):
+                super().__init__("echo", "Echo skill")
+            @property
+            def input_schema(self):
+                return {"text": {"type": "string", "required": True}}
+            @property
+            def output_schema(self):
+                return {"result": {"type": "string"}}
+            async def execute(self, input_data):
+                return {"result": input_data["text"]}
+
+        registry.register_skill(EchoSkill())
+
+        workflow = {
+            "name": "continue_on_error",
+            "steps": [
+                {"skill": "missing", "input": {}, "on_error": "continue"},
+                {"skill": "echo", "input": {"text": "still ran"}}
+            ]
+        }
+
+        execution = await engine.execute_workflow(workflow)
+        assert not execution.steps[0].success
+        assert execution.steps[1].success
+        assert execution.final_result["result"] == "still ran"
+
+    def test_resolve_variable_paths(self):
+        """Test dotted and indexed variable paths resolve against step results."""
+        engine = WorkflowEngine(SkillRegistry())
+        context = {"find_code": {"results": [{"snippet": "a"}, {"snippet": "b"}]}}
+
+        assert engine._resolve_variable("find_code.results[1].snippet", context) == "b"
+        assert engine._resolve_variable("find_code.results", context) == context["find_code"]["results"]
+        assert engine._resolve_variable("find_code.results[5].snippet", context) == "{{find_code.results[5].snippet}}"
+        assert engine._resolve_variable("missing.field", context) == "{{missing.field}}"
+
     @pytest.mark.asyncio
     async def test_workflow_validation(self):
         """Test workflow validation."""
@@ -353,6 +950,38 @@ class TestTemplateEngine:
         assert execution.status == "completed"
         assert execution.final_result["result"] == "hello"
 
+    @pytest.mark.asyncio
+    async def test_template_validation_follows_registry(self):
+        """Test cached template validation is refreshed when skills change."""
+        registry = SkillRegistry()
+        workflow_engine = WorkflowEngine(registry)
+        template_engine = TemplateEngine(workflow_engine)
+
+        template_engine.register_template("late", {
+            "name": "late",
+            "steps": [{"skill": "late_skill", "input": {"text": "{{ text }}"}}]
+        })
+
+        with pytest.raises(ValueError):
+            await template_engine.execute_template("late", {"text": "hi"})
+
+        class LateSkill(Skill):
+            def __init__(self):
+                super().__init__("late_skill", "Registered after the template")
+            @property
+            def input_schema(self):
+                return {"text": {"type": "string", "required": True}}
+            @property
+            def output_schema(self):
+                return {"result": {"type": "string"}}
+            async def execute(self, input_data):
+                return {"result": input_data["text"]}
+
+        registry.register_skill(LateSkill())
+
+        execution = await template_engine.execute_template("late", {"text": "hi"})
+        assert execution.status == "completed"
+
     def test_template_validation(self):
         """Test template validation."""
         registry = SkillRegistry()
@@ -364,6 +993,115 @@ class TestTemplateEngine:
         is_valid, error = template_engine.validate_template(invalid)
         assert not is_valid
 
+    def test_template_membership(self):
+        """Test template membership check."""
+        registry = SkillRegistry()
+        workflow_engine = WorkflowEngine(registry)
+        template_engine = TemplateEngine(workflow_engine)
+
+        template_engine.register_template("known", {"name": "known", "steps": []})
+
+        assert "known" in template_engine
+        assert "unknown" not in template_engine
+
+    def test_load_template_from_file_cache(self, tmp_path):
+        """Test parsed template files are cached but returned as copies."""
+        registry = SkillRegistry()
+        workflow_engine = WorkflowEngine(registry)
+        template_engine = TemplateEngine(workflow_engine)
+
+        path = tmp_path / "cached.yaml"
+        path.write_text("name: cached\nsteps:\n  - skill: search\n")
+
+        first = template_engine.load_template_from_file(str(path))
+        first["steps"].append({"skill": "report"})
+        second = template_engine.load_template_from_file(str(path))
+        assert second == {"name": "cached", "steps": [{"skill": "search"}]}
+
+        # Editing the file invalidates the cached parse
+        path.write_text("name: edited\nsteps:\n  - skill: search\n")
+        assert template_engine.load_template_from_file(str(path))["name"] == "edited"
+
+    def test_precompiled_template_sidecar(self, tmp_path):
+        """Test YAML templates load from a fresh precompiled sidecar."""
+        import json
+
+        registry = SkillRegistry()
+        workflow_engine = WorkflowEngine(registry)
+
+        path = tmp_path / "precompiled.yaml"
+        path.write_text("name: precompiled\nsteps:\n  - skill: search\n")
+
+        # Loading never writes sidecars; only precompile() does
+        loaded_dir = tmp_path / "loaded"
+        loaded_dir.mkdir()
+        (loaded_dir / "plain.yaml").write_text("name: plain\nsteps: []\n")
+        TemplateEngine(workflow_engine, template_dir=str(loaded_dir))
+        assert sorted(p.name for p in loaded_dir.iterdir()) == ["plain.yaml"]
+
+        assert TemplateEngine.precompile(str(tmp_path)) == 1
+        sidecar = tmp_path / "precompiled.yaml.tplc"
+        compiled = json.loads(sidecar.read_text())
+        assert compiled["template"]["name"] == "precompiled"
+
+        # The sidecar is used instead of re-parsing the YAML
+        compiled["template"]["name"] = "from_sidecar"
+        sidecar.write_text(json.dumps(compiled))
+        template_engine = TemplateEngine(workflow_engine, template_dir=str(tmp_path))
+        assert template_engine.list_templates() == ("precompiled",)
+        assert template_engine.get_template("precompiled")["name"] == "from_sidecar"
+
+    def test_list_templates_snapshot(self):
+        """Test template listing is cached and refreshed on registration."""
+        registry = SkillRegistry()
+        workflow_engine = WorkflowEngine(registry)
+        template_engine = TemplateEngine(workflow_engine)
+
+        template_engine.register_template("first", {"name": "first", "steps": []})
+        snapshot = template_engine.list_templates()
+        assert snapshot == ("first",)
+        assert template_engine.list_templates() is snapshot
+
+        template_engine.register_template("second", {"name": "second", "steps": []})
+        assert template_engine.list_templates() == ("first", "second")
+
+        # Changes made through the library also refresh the snapshot
+        template_engine.library.delete_template("first")
+        assert template_engine.list_templates() == ("second",)
+
+    def test_parameter_substitution(self):
+        """Test compiled parameter substitution leaves step references intact."""
+        registry = SkillRegistry()
+        workflow_engine = WorkflowEngine(registry)
+        template_engine = TemplateEngine(workflow_engine)
+
+        template = {
+            "name": "substitution",
+            "steps": [
+                {
+                    "skill": "search",
+                    "input": {
+                        "query": "{{ query }}",
+                        "filters": [{"limit": "{{ limit }}"}, "static"],
+                        "code": "{{ find_code.results[0].snippet }}"
+                    }
+                }
+            ]
+        }
+        template_engine.register_template("substitution", template)
+
+        workflow = template_engine._substitute_parameters(
+            template, {"query": "auth", "limit": 5}
+        )
+
+        assert workflow["steps"][0]["input"] == {
+            "query": "auth",
+            "filters": [{"limit": 5}, "static"],
+            "code": "{{ find_code.results[0].snippet }}"
+        }
+        assert template["steps"][0]["input"]["query"] == "{{ query }}"
+        assert template["steps"][0]["input"]["filters"][0] == {"limit": "{{ limit }}"}
+
 
 class TestAgentOrchestrator:
     """Test AgentOrchestrator."""
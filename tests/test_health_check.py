@@ -0,0 +1,36 @@
+# File: /Users/liborballaty/LocalProjects/GitHubProjectsDocuments/myragdb/tests/test_health_check.py
+# Description: Tests for the infrastructure health check script
+# Author: Libor Ballaty <libor@arionetworks.com>
+# Created: 2026-01-07
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def health_check():
+    """Load scripts/health_check.py as a module."""
+    script = Path(__file__).parent.parent / "scripts" / "health_check.py"
+    spec = importlib.util.spec_from_file_location("health_check", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_served_model_with_extra_tokens_matches(health_check):
+    """Served ids that add suffixes to the expected name are matches."""
+    assert health_check._model_matches(8084, "Qwen2.5-32B-Instruct.gguf")
+    assert health_check._model_matches(8087, "Meta-Llama-3.1-8B-Instruct")
+    assert health_check._model_matches(8083, "mistral")
+
+
+@pytest.mark.parametrize("port, actual", [
+    (8092, "qwen2.5-32b-instruct"),  # shares only the size with deepseek-r1-32b
+    (8087, "hermes-3-8b"),           # shares only the size with llama-3.1-8b
+    (8084, "qwen2.5-7b"),            # shares only the family with qwen2.5-32b
+])
+def test_model_sharing_one_token_is_a_mismatch(health_check, port, actual):
+    """A single shared token does not make a different model a match."""
+    assert not health_check._model_matches(port, actual)
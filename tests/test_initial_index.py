@@ -0,0 +1,96 @@
+# File: /Users/liborballaty/LocalProjects/GitHubProjectsDocuments/myragdb/tests/test_initial_index.py
+# Description: Tests for the initial indexing script
+# Author: Libor Ballaty <libor@arionetworks.com>
+# Created: 2026-01-07
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from myragdb.config import FilePatterns, RepositoryConfig
+
+
+@pytest.fixture
+def initial_index(tmp_path, monkeypatch):
+    """Load scripts/initial_index.py with one temporary repository and fake indexers."""
+    script = Path(__file__).parent.parent / "scripts" / "initial_index.py"
+    spec = importlib.util.spec_from_file_location("initial_index", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    for name in ("a.py", "b.md"):
+        (repo_path / name).write_text(f"content of {name}\n")
+    repo = RepositoryConfig(
+        name="repo",
+        path=str(repo_path),
+        file_patterns=FilePatterns(include=["**/*"]),
+    )
+
+    indexed = {"keyword": [], "vector": []}
+
+    class KeywordIndexer:
+        def index_files_batch(self, files, batch_size):
+            indexed["keyword"].extend(f.relative_path for f in files)
+            return len(files)
+
+        def get_document_count(self):
+            return len(indexed["keyword"])
+
+    class VectorIndexer:
+        def index_files(self, files, incremental):
+            indexed["vector"].extend(f.relative_path for f in files)
+            return len(files)
+
+        def get_document_count(self):
+            return len(indexed["vector"])
+
+    import myragdb.indexers.meilisearch_indexer as meilisearch_indexer
+
+    monkeypatch.setattr(meilisearch_indexer, "MeilisearchIndexer", KeywordIndexer)
+    monkeypatch.setattr(module, "_load_vector_indexer", VectorIndexer)
+    monkeypatch.setattr(
+        module, "load_repositories_config",
+        lambda: SimpleNamespace(get_enabled_repositories=lambda: [repo]),
+    )
+    monkeypatch.setattr(module.settings, "data_dir", str(tmp_path / "data"))
+    return module, indexed
+
+
+def test_keyword_only_run_does_not_hide_files_from_vector_index(initial_index):
+    """A --no-vector run leaves files for the next full run to vector-index."""
+    module, indexed = initial_index
+
+    module.main(["--no-vector"])
+    assert sorted(indexed["keyword"]) == ["a.py", "b.md"]
+    assert indexed["vector"] == []
+
+    module.main([])
+    assert sorted(indexed["vector"]) == ["a.py", "b.md"]
+
+    # Both indexers are now current, so a third run reads nothing
+    indexed["keyword"].clear()
+    indexed["vector"].clear()
+    module.main([])
+    assert indexed == {"keyword": [], "vector": []}
+
+
+def test_vector_load_failure_continues_keyword_only(initial_index, monkeypatch):
+    """A failed model load keeps keyword indexing and leaves vector work for later."""
+    module, indexed = initial_index
+    loader = module._load_vector_indexer
+
+    def failing_loader():
+        raise OSError("model not found")
+
+    monkeypatch.setattr(module, "_load_vector_indexer", failing_loader)
+    module.main([])
+    assert sorted(indexed["keyword"]) == ["a.py", "b.md"]
+    assert indexed["vector"] == []
+
+    monkeypatch.setattr(module, "_load_vector_indexer", loader)
+    module.main([])
+    assert sorted(indexed["vector"]) == ["a.py", "b.md"]